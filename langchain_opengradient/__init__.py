@@ -1,6 +1,35 @@
-from importlib import metadata
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any
 
-from langchain_opengradient.toolkits import OpenGradientToolkit
+if TYPE_CHECKING:
+    from langchain_opengradient.batching import InferenceBatcher
+    from langchain_opengradient.caching import (
+        CacheStats,
+        InferenceCache,
+        WorkflowResultCache,
+    )
+    from langchain_opengradient.clients import AsyncClient
+    from langchain_opengradient.deadlines import DeadlinePolicy
+    from langchain_opengradient.fanout import ToolCallResult
+    from langchain_opengradient.local import LocalInferenceBackend, LocalModelStore
+    from langchain_opengradient.manifest import ToolManifest
+    from langchain_opengradient.metrics import LatencyHistogram, ToolMetrics
+    from langchain_opengradient.modes import (
+        InferenceModePolicy,
+        ModeDecision,
+        RollingLatencies,
+    )
+    from langchain_opengradient.offload import ProcessOffload
+    from langchain_opengradient.persistent import SharedResultStore
+    from langchain_opengradient.prefetch import InputPrefetcher
+    from langchain_opengradient.replay import ReplayReport, TraceRecord, TraceRecorder
+    from langchain_opengradient.search import ToolIndex
+    from langchain_opengradient.singleflight import SingleFlight
+    from langchain_opengradient.subscriptions import WorkflowSubscription
+    from langchain_opengradient.tensors import TensorSpec
+    from langchain_opengradient.toolkits import OpenGradientToolkit
+    from langchain_opengradient.verification import Verification, VerificationTracker
+    from langchain_opengradient.wallets import WalletPool
 
 try:
     __version__ = metadata.version(__package__)
@@ -9,7 +38,83 @@ except metadata.PackageNotFoundError:
     __version__ = ""
 del metadata  # optional, avoids polluting the results of dir(__package__)
 
+# Public names are imported on first access so that importing the package does not
+# load the OpenGradient SDK (and with it web3 and numpy).
+_module_lookup = {
+    "AsyncClient": "langchain_opengradient.clients",
+    "CacheStats": "langchain_opengradient.caching",
+    "DeadlinePolicy": "langchain_opengradient.deadlines",
+    "InferenceBatcher": "langchain_opengradient.batching",
+    "InferenceCache": "langchain_opengradient.caching",
+    "InferenceModePolicy": "langchain_opengradient.modes",
+    "InputPrefetcher": "langchain_opengradient.prefetch",
+    "LatencyHistogram": "langchain_opengradient.metrics",
+    "LocalInferenceBackend": "langchain_opengradient.local",
+    "LocalModelStore": "langchain_opengradient.local",
+    "ModeDecision": "langchain_opengradient.modes",
+    "OpenGradientToolkit": "langchain_opengradient.toolkits",
+    "ProcessOffload": "langchain_opengradient.offload",
+    "ReplayReport": "langchain_opengradient.replay",
+    "RollingLatencies": "langchain_opengradient.modes",
+    "SharedResultStore": "langchain_opengradient.persistent",
+    "SingleFlight": "langchain_opengradient.singleflight",
+    "TensorSpec": "langchain_opengradient.tensors",
+    "ToolCallResult": "langchain_opengradient.fanout",
+    "ToolIndex": "langchain_opengradient.search",
+    "ToolManifest": "langchain_opengradient.manifest",
+    "ToolMetrics": "langchain_opengradient.metrics",
+    "TraceRecord": "langchain_opengradient.replay",
+    "TraceRecorder": "langchain_opengradient.replay",
+    "Verification": "langchain_opengradient.verification",
+    "VerificationTracker": "langchain_opengradient.verification",
+    "WalletPool": "langchain_opengradient.wallets",
+    "WorkflowResultCache": "langchain_opengradient.caching",
+    "WorkflowSubscription": "langchain_opengradient.subscriptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _module_lookup:
+        module = import_module(_module_lookup[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(__all__)
+
+
 __all__ = [
+    "AsyncClient",
+    "CacheStats",
+    "DeadlinePolicy",
+    "InferenceBatcher",
+    "InferenceCache",
+    "InferenceModePolicy",
+    "InputPrefetcher",
+    "LatencyHistogram",
+    "LocalInferenceBackend",
+    "LocalModelStore",
+    "ModeDecision",
     "OpenGradientToolkit",
+    "ProcessOffload",
+    "ReplayReport",
+    "RollingLatencies",
+    "SharedResultStore",
+    "SingleFlight",
+    "TensorSpec",
+    "ToolCallResult",
+    "ToolIndex",
+    "ToolManifest",
+    "ToolMetrics",
+    "TraceRecord",
+    "TraceRecorder",
+    "Verification",
+    "VerificationTracker",
+    "WalletPool",
+    "WorkflowResultCache",
+    "WorkflowSubscription",
     "__version__",
 ]
@@ -0,0 +1,342 @@
+"""Micro-batching of concurrent inferences to the same model."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import opengradient as og  # type: ignore
+from opengradient import InferenceResult  # type: ignore
+
+InferFn = Callable[[str, og.InferenceMode, Dict[str, Any]], InferenceResult]
+AsyncInferFn = Callable[[str, og.InferenceMode, Dict[str, Any]], Awaitable[Any]]
+
+
+def _input_signature(model_input: Dict[str, Any]) -> Tuple:
+    """Tensor names, shapes and dtype kinds; only equal signatures can be stacked."""
+    signature = []
+    for name in sorted(model_input):
+        tensor = np.asarray(model_input[name])
+        signature.append((name, tensor.shape, tensor.dtype.kind))
+    return tuple(signature)
+
+
+def _stack_inputs(inputs: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    return {
+        name: np.stack([np.asarray(model_input[name]) for model_input in inputs])
+        for name in inputs[0]
+    }
+
+
+class _BatchAxisError(ValueError):
+    """A batched output cannot be split back into the calls of the batch."""
+
+
+def _split_result(result: InferenceResult, size: int) -> List[InferenceResult]:
+    outputs: List[Dict[str, Any]] = [{} for _ in range(size)]
+    for name, value in result.model_output.items():
+        array = np.asarray(value)
+        if array.ndim == 0 or array.shape[0] != size:
+            raise _BatchAxisError(
+                f"Model output {name!r} with shape {array.shape} does not have a "
+                f"leading batch axis of size {size}"
+            )
+        for index in range(size):
+            outputs[index][name] = array[index]
+    return [InferenceResult(result.transaction_hash, output) for output in outputs]
+
+
+class _SyncBatch:
+    def __init__(self) -> None:
+        self.inputs: List[Dict[str, Any]] = []
+        self.futures: List[Future] = []
+        self.full = threading.Event()
+
+
+class _AsyncBatch:
+    def __init__(self) -> None:
+        self.inputs: List[Dict[str, Any]] = []
+        self.futures: List[asyncio.Future] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class InferenceBatcher:
+    """Coalesces concurrent inferences to the same model into one inference.
+
+    A call for a model CID and inference mode with no inference in flight is
+    sent right away. Calls that arrive while one is in flight wait up to
+    ``max_wait`` seconds for others to join, and up to ``max_batch_size`` of them
+    are sent as a single inference. In a batch of several calls each input
+    tensor is stacked along a new leading batch axis and every ``model_output``
+    array is split back along that axis, so the model must accept and return a
+    leading batch dimension. A call sent on its own uses its own input and
+    result, unchanged. Calls are only batched with inputs of the same tensor
+    names, shapes and dtype kinds.
+
+    A failed batch is retried per call, so one bad input only fails its own call.
+    If a model's output has no leading batch axis, its calls are retried with
+    their own inputs and the model is no longer batched (see ``unbatchable``).
+    Callers of one batch share the transaction hash of the batched inference.
+
+    A batcher can be passed to one or many tools through the
+    ``inference_batcher`` argument of ``OpenGradientToolkit.create_run_model_tool``.
+
+    Args:
+        max_batch_size (int): Maximum number of calls per inference. Defaults to 16.
+        max_wait (float): Seconds the first queued call of a batch waits for
+            others to join. Defaults to 0.005.
+
+    Example usage:
+        from langchain_opengradient import InferenceBatcher
+
+        batcher = InferenceBatcher(max_batch_size=32, max_wait=0.01)
+        tool = toolkit.create_run_model_tool(..., inference_batcher=batcher)
+    """
+
+    def __init__(self, max_batch_size: int = 16, max_wait: float = 0.005):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be non-negative")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        # Model CIDs and inference modes whose outputs cannot be split.
+        self.unbatchable: Set[Tuple[str, Any]] = set()
+        self._sync_pending: Dict[Tuple, _SyncBatch] = {}
+        self._async_pending: Dict[Tuple, _AsyncBatch] = {}
+        # Batches being sent per key.
+        self._in_flight: Dict[Tuple, int] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _started(self, key: Tuple) -> None:
+        # Called with the lock held.
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def _finished(self, key: Tuple) -> None:
+        with self._lock:
+            count = self._in_flight.pop(key) - 1
+            if count:
+                self._in_flight[key] = count
+
+    def infer(
+        self,
+        infer_fn: InferFn,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        """
+        Run an inference as part of a batch.
+
+        Without an inference in flight the call is sent at once. Otherwise the
+        first queued caller of a batch waits up to ``max_wait`` for other
+        callers and then runs the batched inference on its own thread.
+
+        Args:
+            infer_fn (Callable): Runs one inference given model CID, inference mode
+                and model input.
+            model_cid (str): The CID of the model.
+            inference_mode (og.InferenceMode): The inference mode.
+            model_input (Dict[str, Any]): The input tensors of this call.
+
+        Returns:
+            InferenceResult: The slice of the batched result for this call.
+        """
+        if (model_cid, inference_mode) in self.unbatchable:
+            return infer_fn(model_cid, inference_mode, model_input)
+
+        key = (model_cid, inference_mode, _input_signature(model_input))
+        future: Future = Future()
+
+        with self._lock:
+            batch = self._sync_pending.get(key)
+            leader = batch is None
+            alone = leader and not self._in_flight.get(key)
+            if batch is None:
+                batch = _SyncBatch()
+                if not alone:
+                    self._sync_pending[key] = batch
+            batch.inputs.append(model_input)
+            batch.futures.append(future)
+            if not alone and len(batch.inputs) >= self.max_batch_size:
+                del self._sync_pending[key]
+                batch.full.set()
+            if alone:
+                self._started(key)
+
+        if leader:
+            if not alone:
+                batch.full.wait(self.max_wait)
+                with self._lock:
+                    if self._sync_pending.get(key) is batch:
+                        del self._sync_pending[key]
+                    self._started(key)
+            try:
+                self._run_batch(infer_fn, model_cid, inference_mode, batch)
+            finally:
+                self._finished(key)
+
+        return future.result()
+
+    def _run_batch(
+        self,
+        infer_fn: InferFn,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        batch: _SyncBatch,
+    ) -> None:
+        if len(batch.inputs) == 1:
+            # Nothing to split: send the caller's own input.
+            try:
+                result = infer_fn(model_cid, inference_mode, batch.inputs[0])
+            except Exception as e:
+                batch.futures[0].set_exception(e)
+            else:
+                batch.futures[0].set_result(result)
+            return
+        try:
+            result = infer_fn(model_cid, inference_mode, _stack_inputs(batch.inputs))
+            results = _split_result(result, len(batch.inputs))
+        except _BatchAxisError:
+            with self._lock:
+                self.unbatchable.add((model_cid, inference_mode))
+            for model_input, future in zip(batch.inputs, batch.futures):
+                try:
+                    future.set_result(infer_fn(model_cid, inference_mode, model_input))
+                except Exception as e:
+                    future.set_exception(e)
+        except Exception:
+            # Isolate failures by retrying each call as a batch of one.
+            for model_input, future in zip(batch.inputs, batch.futures):
+                single = _SyncBatch()
+                single.inputs.append(model_input)
+                single.futures.append(future)
+                self._run_batch(infer_fn, model_cid, inference_mode, single)
+        else:
+            for future, single_result in zip(batch.futures, results):
+                future.set_result(single_result)
+
+    async def ainfer(
+        self,
+        ainfer_fn: AsyncInferFn,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        """
+        Async version of ``infer``.
+
+        Without an inference in flight the call is sent at once. Otherwise
+        batches are flushed on the caller's event loop once they are full or
+        ``max_wait`` has passed since the first call joined.
+
+        Args:
+            ainfer_fn (Callable): Coroutine function running one inference given
+                model CID, inference mode and model input.
+            model_cid (str): The CID of the model.
+            inference_mode (og.InferenceMode): The inference mode.
+            model_input (Dict[str, Any]): The input tensors of this call.
+
+        Returns:
+            InferenceResult: The slice of the batched result for this call.
+        """
+        if (model_cid, inference_mode) in self.unbatchable:
+            return await ainfer_fn(model_cid, inference_mode, model_input)
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), model_cid, inference_mode, _input_signature(model_input))
+        future = loop.create_future()
+
+        async def run(batch: _AsyncBatch) -> None:
+            try:
+                await self._arun_batch(ainfer_fn, model_cid, inference_mode, batch)
+            finally:
+                self._finished(key)
+
+        def flush(batch: _AsyncBatch) -> None:
+            with self._lock:
+                if self._async_pending.get(key) is batch:
+                    del self._async_pending[key]
+                self._started(key)
+            task = loop.create_task(run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        with self._lock:
+            batch = self._async_pending.get(key)
+            alone = batch is None and not self._in_flight.get(key)
+            if batch is None:
+                batch = _AsyncBatch()
+                if not alone:
+                    self._async_pending[key] = batch
+                    batch.timer = loop.call_later(self.max_wait, flush, batch)
+            batch.inputs.append(model_input)
+            batch.futures.append(future)
+            full = alone or len(batch.inputs) >= self.max_batch_size
+
+        if full:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            flush(batch)
+
+        return await future
+
+    async def _arun_batch(
+        self,
+        ainfer_fn: AsyncInferFn,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        batch: _AsyncBatch,
+    ) -> None:
+        if len(batch.inputs) == 1:
+            # Nothing to split: send the caller's own input.
+            future = batch.futures[0]
+            try:
+                result = await ainfer_fn(model_cid, inference_mode, batch.inputs[0])
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            return
+        try:
+            result = await ainfer_fn(
+                model_cid, inference_mode, _stack_inputs(batch.inputs)
+            )
+            results = _split_result(result, len(batch.inputs))
+        except _BatchAxisError:
+            with self._lock:
+                self.unbatchable.add((model_cid, inference_mode))
+            outcomes = await asyncio.gather(
+                *(
+                    ainfer_fn(model_cid, inference_mode, model_input)
+                    for model_input in batch.inputs
+                ),
+                return_exceptions=True,
+            )
+            for future, outcome in zip(batch.futures, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+        except Exception:
+            # Isolate failures by retrying each call as a batch of one.
+            singles = []
+            for model_input, future in zip(batch.inputs, batch.futures):
+                single = _AsyncBatch()
+                single.inputs.append(model_input)
+                single.futures.append(future)
+                singles.append(
+                    self._arun_batch(ainfer_fn, model_cid, inference_mode, single)
+                )
+            await asyncio.gather(*singles)
+        else:
+            for future, single_result in zip(batch.futures, results):
+                if not future.done():
+                    future.set_result(single_result)
@@ -0,0 +1,481 @@
+"""Result caches for OpenGradient tools."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import opengradient as og  # type: ignore
+    from opengradient import InferenceResult  # type: ignore
+
+    from langchain_opengradient.persistent import SharedResultStore
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used.
+
+    Attributes:
+        hits (int): Lookups answered from the cache, including stale answers.
+        misses (int): Lookups that had to wait for a fresh value.
+        stale_hits (int): Hits that returned a value older than the TTL.
+        refreshes (int): Background refreshes that completed successfully.
+        refresh_errors (int): Background refreshes that raised an exception.
+        evictions (int): Entries dropped to stay within the size bound.
+        store_hits (int): Lookups missing in memory that were answered from the
+            shared store, e.g. with a result fetched by another process.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+    store_hits: int = 0
+
+
+@dataclass
+class _WorkflowEntry:
+    value: Any
+    fetched_at: float
+    refreshing: bool = False
+
+
+class WorkflowResultCache:
+    """TTL cache for workflow results keyed by workflow contract address.
+
+    Values younger than ``ttl`` are returned directly. Older values are still
+    returned (stale-while-revalidate) while a single background refresh per
+    contract address fetches a new one. If ``max_stale`` is set, values older than
+    ``ttl + max_stale`` are treated as misses and fetched inline. The least
+    recently used address is evicted when more than ``max_size`` are cached.
+
+    The cache can be shared by sync and async tools: sync refreshes run on a
+    daemon thread, async refreshes run as tasks on the caller's event loop.
+
+    With a ``store``, fetched results are also written to a
+    ``SharedResultStore``, and addresses missing in memory are looked up there
+    with their original age, so worker processes on a host share reads.
+
+    Args:
+        ttl (float): Seconds a cached value is considered fresh. Defaults to 60.
+        max_size (int): Maximum number of contract addresses kept. Defaults to 256.
+        max_stale (float, optional): Seconds past ``ttl`` a value may still be
+            served while refreshing. Defaults to None (no limit).
+        store (SharedResultStore, optional): Persistent store shared with other
+            processes. Defaults to None.
+
+    Example usage:
+        from langchain_opengradient import OpenGradientToolkit, WorkflowResultCache
+
+        toolkit = OpenGradientToolkit(
+            workflow_cache=WorkflowResultCache(ttl=30, max_size=64),
+        )
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 256,
+        max_stale: Optional[float] = None,
+        store: Optional[SharedResultStore] = None,
+    ):
+        if ttl < 0:
+            raise ValueError("ttl must be non-negative")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_stale = max_stale
+        self.store = store
+        self._entries: "OrderedDict[str, _WorkflowEntry]" = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, contract_address: Optional[str] = None) -> None:
+        """Drop one contract address from the cache, or all of them.
+
+        Only the given address is removed from the shared store, as other
+        entries of the store may belong to other caches.
+        """
+        with self._lock:
+            if contract_address is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(contract_address, None)
+        if self.store is not None and contract_address is not None:
+            self.store.delete(_workflow_store_key(contract_address))
+
+    def _load_from_store(self, contract_address: str) -> None:
+        """Copy the stored result of an address missing in memory, if usable."""
+        if self.store is None:
+            return
+        with self._lock:
+            if contract_address in self._entries:
+                return
+        stored = self.store.get(_workflow_store_key(contract_address))
+        if stored is None:
+            return
+        age, value = stored
+        if self.max_stale is not None and age > self.ttl + self.max_stale:
+            return
+        with self._lock:
+            if contract_address not in self._entries:
+                self._stats.store_hits += 1
+                self._entries[contract_address] = _WorkflowEntry(
+                    value, time.monotonic() - age
+                )
+                self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used addresses. Must be called with the lock held."""
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _lookup(self, contract_address: str) -> Tuple[Optional[Any], bool, bool]:
+        """Return ``(value, found, start_refresh)`` and update the counters.
+
+        Must be called with the lock held.
+        """
+        entry = self._entries.get(contract_address)
+        if entry is None:
+            self._stats.misses += 1
+            return None, False, False
+
+        age = time.monotonic() - entry.fetched_at
+        if age <= self.ttl:
+            self._entries.move_to_end(contract_address)
+            self._stats.hits += 1
+            return entry.value, True, False
+
+        if self.max_stale is not None and age > self.ttl + self.max_stale:
+            self._stats.misses += 1
+            return None, False, False
+
+        self._entries.move_to_end(contract_address)
+        self._stats.hits += 1
+        self._stats.stale_hits += 1
+        start_refresh = not entry.refreshing
+        entry.refreshing = True
+        return entry.value, True, start_refresh
+
+    def _store(self, contract_address: str, value: Any) -> None:
+        with self._lock:
+            self._entries[contract_address] = _WorkflowEntry(value, time.monotonic())
+            self._entries.move_to_end(contract_address)
+            self._evict()
+        if self.store is not None:
+            self.store.put(_workflow_store_key(contract_address), value)
+
+    def _refresh_failed(self, contract_address: str) -> None:
+        with self._lock:
+            self._stats.refresh_errors += 1
+            entry = self._entries.get(contract_address)
+            if entry is not None:
+                entry.refreshing = False
+
+    def _refresh_done(self, contract_address: str, value: Any) -> None:
+        self._store(contract_address, value)
+        with self._lock:
+            self._stats.refreshes += 1
+
+    def get(self, contract_address: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for ``contract_address``.
+
+        Args:
+            contract_address (str): The workflow contract address.
+            fetch (Callable[[], Any]): Reads the current result from the network.
+
+        Returns:
+            Any: The cached or freshly fetched workflow result.
+        """
+        self._load_from_store(contract_address)
+        with self._lock:
+            value, found, start_refresh = self._lookup(contract_address)
+
+        if not found:
+            value = fetch()
+            self._store(contract_address, value)
+        elif start_refresh:
+
+            def refresh() -> None:
+                try:
+                    new_value = fetch()
+                except Exception:
+                    self._refresh_failed(contract_address)
+                else:
+                    self._refresh_done(contract_address, new_value)
+
+            threading.Thread(target=refresh, daemon=True).start()
+
+        return value
+
+    async def aget(
+        self, contract_address: str, afetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Async version of ``get``.
+
+        Args:
+            contract_address (str): The workflow contract address.
+            afetch (Callable[[], Awaitable[Any]]): Reads the current result from
+                the network.
+
+        Returns:
+            Any: The cached or freshly fetched workflow result.
+        """
+        self._load_from_store(contract_address)
+        with self._lock:
+            value, found, start_refresh = self._lookup(contract_address)
+
+        if not found:
+            value = await afetch()
+            self._store(contract_address, value)
+        elif start_refresh:
+
+            async def refresh() -> None:
+                try:
+                    new_value = await afetch()
+                except Exception:
+                    self._refresh_failed(contract_address)
+                else:
+                    self._refresh_done(contract_address, new_value)
+
+            # Keep a reference so the refresh task is not garbage collected.
+            task = asyncio.create_task(refresh())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return value
+
+
+def _workflow_store_key(contract_address: str) -> str:
+    return f"workflow:{contract_address}"
+
+
+def model_input_digest(model_input: Dict[str, Any]) -> str:
+    """
+    Compute a canonical digest of the tensors passed to an inference.
+
+    Tensors are hashed in name order from their dtype, shape and C-ordered bytes,
+    so equal inputs hash equally whether they are given as nested lists, scalars
+    or numpy arrays.
+
+    Args:
+        model_input (Dict[str, Any]): Tensor name to list, scalar or numpy array.
+
+    Returns:
+        str: Hex encoded SHA-256 digest.
+    """
+    import numpy as np
+
+    digest = hashlib.sha256()
+    for name in sorted(model_input):
+        tensor = np.ascontiguousarray(model_input[name])
+        digest.update(name.encode())
+        digest.update(b"\0")
+        digest.update(tensor.dtype.str.encode())
+        digest.update(repr(tensor.shape).encode())
+        if tensor.dtype.hasobject:
+            digest.update(repr(tensor.tolist()).encode())
+        else:
+            digest.update(tensor.tobytes())
+    return digest.hexdigest()
+
+
+def _inference_result_nbytes(result: InferenceResult) -> int:
+    """Approximate memory held by an inference result."""
+    import numpy as np
+
+    return len(result.transaction_hash or "") + sum(
+        np.asarray(value).nbytes for value in result.model_output.values()
+    )
+
+
+@dataclass
+class _InferenceEntry:
+    result: InferenceResult
+    nbytes: int
+    stored_at: float
+
+
+class InferenceCache:
+    """LRU memo cache for inference results with a byte budget.
+
+    Entries are keyed by model CID, inference mode and a canonical digest of the
+    model input, so repeated inferences with equal inputs are answered without a
+    network round-trip or a new transaction. The size of each entry is counted
+    from the numpy arrays in ``model_output``; least recently used entries are
+    evicted once ``max_bytes`` is exceeded. Cached output arrays are read-only
+    copies, so callers may keep modifying the result they stored.
+
+    A cache can be passed to one or many tools through the ``inference_cache``
+    argument of ``OpenGradientToolkit.create_run_model_tool``.
+
+    With a ``store``, results are also written to a ``SharedResultStore`` and
+    keys missing in memory are looked up there, so worker processes on a host
+    share inference results and start warm after a restart.
+
+    Args:
+        max_bytes (int): Memory budget for cached model outputs. Defaults to 64 MiB.
+        ttl (float, optional): Seconds a result stays valid. Defaults to None
+            (results never expire).
+        store (SharedResultStore, optional): Persistent store shared with other
+            processes. Defaults to None.
+
+    Example usage:
+        from langchain_opengradient import InferenceCache
+
+        cache = InferenceCache(max_bytes=16 * 1024 * 1024)
+        tool = toolkit.create_run_model_tool(
+            ...,
+            inference_mode=og.InferenceMode.VANILLA,
+            inference_cache=cache,
+        )
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        store: Optional[SharedResultStore] = None,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.store = store
+        self._entries: "OrderedDict[str, _InferenceEntry]" = OrderedDict()
+        self._nbytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model_cid: str, inference_mode: og.InferenceMode, model_input: Dict[str, Any]
+    ) -> str:
+        """Build the cache key for an inference request."""
+        return f"{model_cid}:{inference_mode.name}:{model_input_digest(model_input)}"
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held by cached model outputs."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def get(self, key: str) -> Optional[InferenceResult]:
+        """Return the cached result for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry.stored_at <= self.ttl
+            ):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry.result
+
+            if entry is not None:
+                self._remove(key)
+            if self.store is None:
+                self._stats.misses += 1
+                return None
+
+        stored = self.store.get(key)
+        if stored is not None and (self.ttl is None or stored[0] <= self.ttl):
+            age, result = stored
+            # Results decoded from the store are not shared with anyone.
+            frozen = self._put_in_memory(
+                key, result, time.monotonic() - age, copy=False
+            )
+            with self._lock:
+                self._stats.hits += 1
+                self._stats.store_hits += 1
+            return frozen
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    def put(self, key: str, result: InferenceResult) -> InferenceResult:
+        """
+        Store a copy of ``result`` under ``key``, evicting old entries to fit.
+
+        Args:
+            key (str): The cache key.
+            result (InferenceResult): The result; it is not modified.
+
+        Returns:
+            InferenceResult: The cached, read-only copy.
+        """
+        frozen = self._put_in_memory(key, result, time.monotonic())
+        if self.store is not None:
+            self.store.put(key, result)
+        return frozen
+
+    def _put_in_memory(
+        self, key: str, result: InferenceResult, stored_at: float, copy: bool = True
+    ) -> InferenceResult:
+        import numpy as np
+        from opengradient import InferenceResult  # type: ignore
+
+        frozen_output = {}
+        for name, value in result.model_output.items():
+            # A copy, so that changes to the caller's arrays (e.g. by an output
+            # formatter) do not reach the cache.
+            array = np.array(value, copy=True) if copy else np.asarray(value).view()
+            array.flags.writeable = False
+            frozen_output[name] = array
+        frozen = InferenceResult(result.transaction_hash, frozen_output)
+        nbytes = _inference_result_nbytes(frozen)
+        if nbytes > self.max_bytes:
+            return frozen
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _InferenceEntry(frozen, nbytes, stored_at)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+        return frozen
+
+    def _remove(self, key: str) -> None:
+        """Remove ``key``. Must be called with the lock held."""
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
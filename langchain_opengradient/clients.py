@@ -0,0 +1,434 @@
+"""OpenGradient clients used by the toolkit."""
+
+import asyncio
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple
+
+import opengradient as og  # type: ignore
+from opengradient import InferenceResult, ModelOutput  # type: ignore
+from opengradient.defaults import (  # type: ignore
+    DEFAULT_INFERENCE_CONTRACT_ADDRESS,
+    DEFAULT_RPC_URL,
+)
+from opengradient.exceptions import OpenGradientError  # type: ignore
+from opengradient.utils import (  # type: ignore
+    convert_array_to_model_output,
+    convert_to_model_output,
+)
+from web3 import AsyncWeb3
+from web3.exceptions import ContractLogicError
+from web3.logs import DISCARD
+
+from langchain_opengradient.tensors import convert_to_model_input
+from langchain_opengradient.transactions import (
+    NonceAllocator,
+    SyncTransactionPipeline,
+    TransactionPipeline,
+    is_nonce_error,
+)
+
+# Mirror the transaction settings used by the synchronous OpenGradient client.
+INFERENCE_TX_TIMEOUT = 60
+DEFAULT_MAX_RETRY = 5
+
+
+def _load_abi(abi_name: str) -> Any:
+    """Load a contract ABI shipped with the OpenGradient SDK."""
+    abi_path = Path(og.__file__).parent / "abi" / abi_name
+    with open(abi_path, "r") as abi_file:
+        return json.load(abi_file)
+
+
+class Client(og.client.Client):
+    """``og.client.Client`` that sends inferences through a nonce pipeline.
+
+    ``og.client.Client.infer`` asks the chain for the wallet's pending nonce on
+    every call, so concurrent calls from several threads can get the same
+    nonce. This client allocates nonces through a ``SyncTransactionPipeline``
+    instead, sharing its ``NonceAllocator`` with the wallet's ``AsyncClient``.
+
+    Args:
+        private_key (str): The private key for the wallet.
+        rpc_url (str, optional): The RPC URL for the OpenGradient network.
+        contract_address (str, optional): The inference contract address.
+        nonces (NonceAllocator, optional): Allocator of the wallet's nonces.
+            Defaults to a new one.
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        rpc_url: str = DEFAULT_RPC_URL,
+        contract_address: str = DEFAULT_INFERENCE_CONTRACT_ADDRESS,
+        nonces: Optional[NonceAllocator] = None,
+    ):
+        super().__init__(
+            private_key=private_key,
+            rpc_url=rpc_url,
+            contract_address=contract_address,
+            email=None,
+            password=None,
+        )
+        self._pipeline = SyncTransactionPipeline(
+            self._blockchain.eth,
+            self._wallet_account,
+            receipt_timeout=INFERENCE_TX_TIMEOUT,
+            max_retries=DEFAULT_MAX_RETRY,
+            nonces=nonces,
+        )
+
+    def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> InferenceResult:
+        """
+        Perform inference on a model.
+
+        Args:
+            model_cid (str): The content identifier of the model.
+            inference_mode (og.InferenceMode): The inference mode.
+            model_input (Dict[str, Any]): The input data for the model.
+            max_retries (int, optional): Maximum number of attempts on nonce
+                conflicts. Defaults to 5.
+
+        Returns:
+            InferenceResult: The transaction hash and model output.
+        """
+        eth = self._blockchain.eth
+        address = self._wallet_account.address
+
+        contract = eth.contract(
+            address=self._inference_hub_contract_address, abi=self._inference_abi
+        )
+        run_function = contract.functions.run(
+            model_cid, inference_mode.value, convert_to_model_input(model_input)
+        )
+
+        estimated_gas = run_function.estimate_gas({"from": address})
+        # The pipeline replaces the placeholder nonce with a locally allocated one.
+        transaction = run_function.build_transaction(
+            {
+                "from": address,
+                "nonce": 0,
+                "gas": int(estimated_gas * 3),
+                "gasPrice": eth.gas_price,
+            }
+        )
+
+        try:
+            tx_hash, tx_receipt = self._pipeline.submit(
+                transaction, max_retries=max_retries
+            )
+        except Exception as e:
+            if is_nonce_error(e):
+                raise OpenGradientError(f"Transaction failed: {e}") from e
+            raise
+
+        if tx_receipt["status"] == 0:
+            raise ContractLogicError(f"Transaction failed. Receipt: {tx_receipt}")
+
+        parsed_logs = contract.events.InferenceResult().process_receipt(
+            tx_receipt, errors=DISCARD
+        )
+        if len(parsed_logs) < 1:
+            raise OpenGradientError(
+                "InferenceResult event not found in transaction logs"
+            )
+
+        model_output = convert_to_model_output(parsed_logs[0]["args"])
+        return InferenceResult(tx_hash.hex(), model_output)
+
+
+class AsyncClient:
+    """Asyncio counterpart of ``og.client.Client`` for the calls made by tools.
+
+    Runs inferences and workflow reads over an ``AsyncWeb3`` connection so a single
+    event loop can keep many tool calls in flight without a thread per call. The
+    wallet account and web3 connection are set up on first use.
+
+    Inference transactions go through a ``TransactionPipeline``: nonces are
+    allocated locally and receipts awaited concurrently, so many inferences from
+    the wallet can be in flight without nonce collisions. Toolkits share one
+    client per private key; it may be used from several event loops and shares
+    its ``NonceAllocator`` with the wallet's shared sync ``Client``.
+
+    Args:
+        private_key (str): The private key for the wallet.
+        rpc_url (str, optional): The RPC URL for the OpenGradient network.
+        contract_address (str, optional): The inference contract address.
+        nonces (NonceAllocator, optional): Allocator of the wallet's nonces.
+            Defaults to a new one.
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        rpc_url: str = DEFAULT_RPC_URL,
+        contract_address: str = DEFAULT_INFERENCE_CONTRACT_ADDRESS,
+        nonces: Optional[NonceAllocator] = None,
+    ):
+        self._private_key = private_key
+        self._rpc_url = rpc_url
+        self._inference_hub_contract_address = contract_address
+        self._nonces = nonces or NonceAllocator()
+        self._blockchain: Any = None
+        self._wallet_account: Any = None
+        self._pipeline: Any = None
+
+    def _connect(self) -> None:
+        if self._blockchain is None:
+            self._blockchain = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self._rpc_url))
+            self._wallet_account = self._blockchain.eth.account.from_key(
+                self._private_key
+            )
+            self._pipeline = TransactionPipeline(
+                self._blockchain.eth,
+                self._wallet_account,
+                receipt_timeout=INFERENCE_TX_TIMEOUT,
+                max_retries=DEFAULT_MAX_RETRY,
+                nonces=self._nonces,
+            )
+
+    async def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> InferenceResult:
+        """
+        Perform inference on a model.
+
+        Args:
+            model_cid (str): The content identifier of the model.
+            inference_mode (og.InferenceMode): The inference mode.
+            model_input (Dict[str, Any]): The input data for the model.
+            max_retries (int, optional): Maximum number of attempts on nonce
+                conflicts. Defaults to 5.
+
+        Returns:
+            InferenceResult: The transaction hash and model output.
+        """
+        self._connect()
+        eth = self._blockchain.eth
+        address = self._wallet_account.address
+
+        contract = eth.contract(
+            address=self._inference_hub_contract_address,
+            abi=_load_abi("inference.abi"),
+        )
+        run_function = contract.functions.run(
+            model_cid, inference_mode.value, convert_to_model_input(model_input)
+        )
+
+        estimated_gas = await run_function.estimate_gas({"from": address})
+        # The pipeline replaces the placeholder nonce with a locally allocated one.
+        transaction = await run_function.build_transaction(
+            {
+                "from": address,
+                "nonce": 0,
+                "gas": int(estimated_gas * 3),
+                "gasPrice": await eth.gas_price,
+            }
+        )
+
+        try:
+            tx_hash, tx_receipt = await self._pipeline.submit(
+                transaction, max_retries=max_retries
+            )
+        except Exception as e:
+            if is_nonce_error(e):
+                raise OpenGradientError(f"Transaction failed: {e}") from e
+            raise
+
+        if tx_receipt["status"] == 0:
+            raise ContractLogicError(f"Transaction failed. Receipt: {tx_receipt}")
+
+        parsed_logs = contract.events.InferenceResult().process_receipt(
+            tx_receipt, errors=DISCARD
+        )
+        if len(parsed_logs) < 1:
+            raise OpenGradientError(
+                "InferenceResult event not found in transaction logs"
+            )
+
+        model_output = convert_to_model_output(parsed_logs[0]["args"])
+        return InferenceResult(tx_hash.hex(), model_output)
+
+    async def read_workflow_result(self, contract_address: str) -> ModelOutput:
+        """
+        Read the latest inference result from a deployed workflow contract.
+
+        Args:
+            contract_address (str): Address of the deployed workflow contract.
+
+        Returns:
+            ModelOutput: The inference result stored by the contract.
+        """
+        self._connect()
+        contract = self._blockchain.eth.contract(
+            address=AsyncWeb3.to_checksum_address(contract_address),
+            abi=_load_abi("PriceHistoryInference.abi"),
+        )
+        result = await contract.functions.getInferenceResult().call()
+
+        return convert_array_to_model_output(result)
+
+    async def block_number(self) -> int:
+        """Return the number of the latest block."""
+        self._connect()
+        return await self._blockchain.eth.block_number
+
+    async def watch_workflow_updates(
+        self,
+        contract_addresses: Sequence[str],
+        poll_interval: float = 2.0,
+        from_block: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield workflow contract addresses as they emit new results.
+
+        Polls the logs of new blocks for ``InferenceResultEmitted`` events of the
+        given contracts, with one ``eth_getLogs`` call per poll for all of them.
+        Errors from the RPC connection are raised to the caller.
+
+        Args:
+            contract_addresses (Sequence[str]): Workflow contracts to watch.
+            poll_interval (float, optional): Seconds between polls. Defaults to 2.
+            from_block (int, optional): First block whose results are reported.
+                Defaults to the block after the latest one.
+
+        Yields:
+            str: The address, as given, of a contract that emitted a new result.
+        """
+        self._connect()
+        eth = self._blockchain.eth
+        by_checksum = {
+            AsyncWeb3.to_checksum_address(address): address
+            for address in contract_addresses
+        }
+        topic = (
+            eth.contract(abi=_load_abi("PriceHistoryInference.abi"))
+            .events.InferenceResultEmitted()
+            .topic
+        )
+
+        last_block = await eth.block_number if from_block is None else from_block - 1
+        while True:
+            await asyncio.sleep(poll_interval)
+            latest = await eth.block_number
+            if latest <= last_block:
+                continue
+            logs = await eth.get_logs(
+                {
+                    "address": list(by_checksum),
+                    "fromBlock": last_block + 1,
+                    "toBlock": latest,
+                    "topics": [topic],
+                }
+            )
+            last_block = latest
+            updated = {AsyncWeb3.to_checksum_address(log["address"]) for log in logs}
+            for checksum in updated:
+                yield by_checksum[checksum]
+
+
+_pool_lock = threading.Lock()
+_client_pool: Dict[Tuple[str, str, str], og.client.Client] = {}
+_async_client_pool: Dict[Tuple[str, str, str], AsyncClient] = {}
+# Nonces are per wallet and chain, whichever client sends the transaction.
+_nonce_pool: Dict[Tuple[str, str], NonceAllocator] = {}
+
+
+def _pool_key(
+    private_key: str, rpc_url: str, contract_address: str
+) -> Tuple[str, str, str]:
+    # Hash the private key so the pool does not keep another copy of it around.
+    key_digest = hashlib.sha256(private_key.encode()).hexdigest()
+    return key_digest, rpc_url, contract_address
+
+
+def _shared_nonces(key: Tuple[str, str, str]) -> NonceAllocator:
+    # Called with _pool_lock held.
+    nonces_key = key[:2]
+    nonces = _nonce_pool.get(nonces_key)
+    if nonces is None:
+        nonces = _nonce_pool[nonces_key] = NonceAllocator()
+    return nonces
+
+
+def get_shared_client(
+    private_key: str,
+    rpc_url: str = DEFAULT_RPC_URL,
+    contract_address: str = DEFAULT_INFERENCE_CONTRACT_ADDRESS,
+) -> og.client.Client:
+    """
+    Return the process-wide OpenGradient client for ``private_key``.
+
+    The client is created on first request and then shared by every toolkit
+    using the same private key, RPC URL and contract address, together with its
+    web3 connection. It allocates nonces together with the wallet's shared
+    ``AsyncClient``.
+
+    Args:
+        private_key (str): The private key for the wallet.
+        rpc_url (str, optional): The RPC URL for the OpenGradient network.
+        contract_address (str, optional): The inference contract address.
+
+    Returns:
+        og.client.Client: The shared client.
+    """
+    key = _pool_key(private_key, rpc_url, contract_address)
+    with _pool_lock:
+        client = _client_pool.get(key)
+        if client is None:
+            client = _client_pool[key] = Client(
+                private_key=private_key,
+                rpc_url=rpc_url,
+                contract_address=contract_address,
+                nonces=_shared_nonces(key),
+            )
+        return client
+
+
+def get_shared_async_client(
+    private_key: str,
+    rpc_url: str = DEFAULT_RPC_URL,
+    contract_address: str = DEFAULT_INFERENCE_CONTRACT_ADDRESS,
+) -> AsyncClient:
+    """
+    Return the process-wide ``AsyncClient`` for ``private_key``.
+
+    Args:
+        private_key (str): The private key for the wallet.
+        rpc_url (str, optional): The RPC URL for the OpenGradient network.
+        contract_address (str, optional): The inference contract address.
+
+    Returns:
+        AsyncClient: The shared async client.
+    """
+    key = _pool_key(private_key, rpc_url, contract_address)
+    with _pool_lock:
+        client = _async_client_pool.get(key)
+        if client is None:
+            client = _async_client_pool[key] = AsyncClient(
+                private_key=private_key,
+                rpc_url=rpc_url,
+                contract_address=contract_address,
+                nonces=_shared_nonces(key),
+            )
+        return client
+
+
+def clear_client_pool() -> None:
+    """Drop all shared clients, e.g. after rotating keys or in tests."""
+    with _pool_lock:
+        _client_pool.clear()
+        _async_client_pool.clear()
+        _nonce_pool.clear()
@@ -0,0 +1,357 @@
+"""Deadlines, hedged attempts and last-good fallback for tool calls."""
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from langchain_opengradient.metrics import LatencyHistogram
+
+# Set while a hedge attempt runs, so it skips request coalescing.
+_hedge_attempt: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "opengradient_hedge_attempt", default=False
+)
+
+
+def is_hedge_attempt() -> bool:
+    """Whether the current code runs as the second attempt of a hedged call."""
+    return _hedge_attempt.get()
+
+
+def mark_stale(output: Any, age: float) -> str:
+    """Default marker for a last-good result returned after a deadline."""
+    return f"{output} (stale: last good result from {age:.0f}s ago)"
+
+
+class DeadlinePolicy:
+    """Bounds the latency of a tool call.
+
+    Each call runs as an attempt. With ``hedge_after`` or ``hedge_quantile``, a
+    second attempt is started when the first one is still running after that
+    delay, and whichever finishes first answers the call. With ``timeout``, a
+    call that has no answer after that many seconds raises ``TimeoutError``, or,
+    with ``fallback``, returns the last good result of the same tool and input
+    passed through ``stale_marker``.
+
+    Async attempts that lose or time out are cancelled. Sync attempts run on the
+    policy's thread pools and cannot be interrupted; they finish in the
+    background, and their results still update the last good result. First
+    attempts and hedges use separate pools, so first attempts stuck past their
+    deadline do not hold up hedges.
+
+    Pass an instance to ``create_run_model_tool(deadline=...)`` or
+    ``create_read_workflow_tool(deadline=...)``. An attempt covers the whole tool
+    call (input provider, inference or read, output formatter). Hedge attempts
+    skip the toolkit's ``single_flight``, which would only join them to the
+    slow first attempt. Read-workflow tools are hedged; run-model tools only
+    with ``hedge_inferences``, since a hedge sends a second inference
+    transaction. A policy may be shared between tools; last good results are
+    kept per tool and input, and attempt latencies per tool.
+
+    Args:
+        timeout (float, optional): Seconds a call may take. Defaults to None (no
+            deadline).
+        hedge_after (float, optional): Seconds after which a second attempt is
+            started. Defaults to None.
+        hedge_quantile (float, optional): Start the second attempt once the first
+            has run longer than this quantile (e.g. 0.95) of past attempt
+            latencies of the same tool. Until ``min_samples`` attempts of the
+            tool succeeded, ``hedge_after`` is used. Defaults to None.
+        min_samples (int, optional): Successful attempts needed before
+            ``hedge_quantile`` applies. Defaults to 20.
+        hedge_inferences (bool, optional): Also hedge run-model tools, paying
+            for a second inference transaction on each hedged call. Defaults to
+            False.
+        fallback (bool, optional): Return the last good result when the deadline
+            passes. Requires ``timeout``. Defaults to False.
+        max_staleness (float, optional): Maximum age in seconds of a last good
+            result used as fallback; older results are dropped. Defaults to None
+            (any age).
+        max_last_good (int, optional): Maximum number of last good results kept,
+            least recently updated dropped first. Defaults to 1024.
+        stale_marker (Callable[[Any, float], Any], optional): Builds the returned
+            value from a last good result and its age in seconds. Defaults to
+            appending a note that the result is stale.
+        max_workers (int, optional): Threads running sync first attempts, and
+            as many for hedges. Defaults to 32.
+
+    Example usage:
+        from langchain_opengradient import DeadlinePolicy
+
+        tool = toolkit.create_run_model_tool(
+            ...,
+            deadline=DeadlinePolicy(timeout=10, fallback=True),
+        )
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        hedge_after: Optional[float] = None,
+        hedge_quantile: Optional[float] = None,
+        min_samples: int = 20,
+        hedge_inferences: bool = False,
+        fallback: bool = False,
+        max_staleness: Optional[float] = None,
+        stale_marker: Callable[[Any, float], Any] = mark_stale,
+        max_workers: int = 32,
+        max_last_good: int = 1024,
+    ):
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if hedge_after is not None and hedge_after < 0:
+            raise ValueError("hedge_after must not be negative")
+        if hedge_quantile is not None and not 0 < hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_last_good < 1:
+            raise ValueError("max_last_good must be at least 1")
+        if fallback and timeout is None:
+            raise ValueError("fallback requires a timeout")
+
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.hedge_quantile = hedge_quantile
+        self.min_samples = min_samples
+        self.hedge_inferences = hedge_inferences
+        self.fallback = fallback
+        self.max_staleness = max_staleness
+        self.stale_marker = stale_marker
+        self.max_workers = max_workers
+        self.max_last_good = max_last_good
+        # Attempt latencies per group, e.g. per tool.
+        self.latencies: Dict[Hashable, LatencyHistogram] = {}
+        self.timeouts = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.fallbacks = 0
+        self._lock = threading.Lock()
+        # Last good results by key, least recently updated first.
+        self._last_good: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+
+    @staticmethod
+    def make_key(tool_name: str, tool_input: Dict[str, Any]) -> str:
+        """Build the key of the last good result of a tool call."""
+        return f"{tool_name}:{json.dumps(tool_input, sort_keys=True, default=repr)}"
+
+    def hedge_delay(self, group: Hashable = None) -> Optional[float]:
+        """Seconds after which a call of ``group`` starts its second attempt."""
+        if self.hedge_quantile is not None:
+            with self._lock:
+                latency = self.latencies.get(group)
+                if latency is not None and latency.count >= self.min_samples:
+                    return latency.quantile(self.hedge_quantile)
+        return self.hedge_after
+
+    def _succeeded(
+        self, key: Hashable, group: Hashable, start: float, result: Any
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            latency = self.latencies.get(group)
+            if latency is None:
+                latency = self.latencies[group] = LatencyHistogram()
+            latency.observe(now - start)
+            if not self.fallback:
+                return
+            self._last_good[key] = (now, result)
+            self._last_good.move_to_end(key)
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        while len(self._last_good) > self.max_last_good:
+            self._last_good.popitem(last=False)
+        if self.max_staleness is not None:
+            while self._last_good:
+                stored_at, _ = next(iter(self._last_good.values()))
+                if now - stored_at <= self.max_staleness:
+                    break
+                self._last_good.popitem(last=False)
+
+    def _expired(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            self.timeouts += 1
+            now = time.monotonic()
+            self._prune(now)
+            last_good = self._last_good.get(key)
+            if last_good is not None:
+                age = now - last_good[0]
+                if self.max_staleness is None or age <= self.max_staleness:
+                    self.fallbacks += 1
+                    return True, self.stale_marker(last_good[1], age)
+        return False, None
+
+    def _timeout_error(self) -> TimeoutError:
+        return TimeoutError(f"Tool call exceeded deadline of {self.timeout}s")
+
+    def _get_executor(self, kind: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(kind)
+            if executor is None:
+                executor = self._executors[kind] = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"opengradient-deadline-{kind}",
+                )
+            return executor
+
+    def run(
+        self,
+        key: Hashable,
+        attempt: Callable[[], Any],
+        group: Hashable = None,
+        hedge: bool = True,
+    ) -> Any:
+        """
+        Run a sync tool call under the policy.
+
+        Args:
+            key (Hashable): Identifies the tool and input, see ``make_key``.
+            attempt (Callable[[], Any]): Runs the tool call once.
+            group (Hashable, optional): Calls whose latencies set the hedge
+                delay, e.g. the tool name. Defaults to None (one group).
+            hedge (bool, optional): Whether the call may be hedged. Defaults to
+                True.
+
+        Returns:
+            Any: The result of the first successful attempt, or the marked last
+                good result.
+        """
+
+        def run_attempt(hedged: bool) -> Any:
+            if hedged:
+                _hedge_attempt.set(True)
+            start = time.monotonic()
+            result = attempt()
+            self._succeeded(key, group, start, result)
+            return result
+
+        hedge_delay = self.hedge_delay(group) if hedge else None
+        if self.timeout is None and hedge_delay is None:
+            return run_attempt(False)
+
+        def submit(hedged: bool) -> Future:
+            executor = self._get_executor("hedge" if hedged else "attempt")
+            # Keep callbacks and tracing context of the caller in the attempt.
+            return executor.submit(contextvars.copy_context().run, run_attempt, hedged)
+
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        hedge_at = None if hedge_delay is None else start + hedge_delay
+        first = submit(False)
+        pending: Set[Future] = {first}
+        error: Optional[BaseException] = None
+        while pending:
+            wakeups = [at for at in (deadline, hedge_at) if at is not None]
+            wait_timeout = (
+                max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+            )
+            done, pending = wait(
+                pending, timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    if future is not first:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = error or future.exception()
+
+            now = time.monotonic()
+            if pending and hedge_at is not None and now >= hedge_at:
+                hedge_at = None
+                with self._lock:
+                    self.hedges += 1
+                pending.add(submit(True))
+            if pending and deadline is not None and now >= deadline:
+                found, value = self._expired(key)
+                if found:
+                    return value
+                raise self._timeout_error()
+
+        assert error is not None
+        raise error
+
+    async def arun(
+        self,
+        key: Hashable,
+        attempt: Callable[[], Awaitable[Any]],
+        group: Hashable = None,
+        hedge: bool = True,
+    ) -> Any:
+        """
+        Async version of ``run``; unfinished attempts are cancelled.
+
+        Args:
+            key (Hashable): Identifies the tool and input, see ``make_key``.
+            attempt (Callable[[], Awaitable[Any]]): Runs the tool call once.
+            group (Hashable, optional): Calls whose latencies set the hedge
+                delay, e.g. the tool name. Defaults to None (one group).
+            hedge (bool, optional): Whether the call may be hedged. Defaults to
+                True.
+
+        Returns:
+            Any: The result of the first successful attempt, or the marked last
+                good result.
+        """
+
+        async def run_attempt(hedged: bool) -> Any:
+            if hedged:
+                # Tasks run in a copy of the context, so this stays in the hedge.
+                _hedge_attempt.set(True)
+            start = time.monotonic()
+            result = await attempt()
+            self._succeeded(key, group, start, result)
+            return result
+
+        hedge_delay = self.hedge_delay(group) if hedge else None
+        if self.timeout is None and hedge_delay is None:
+            return await run_attempt(False)
+
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        hedge_at = None if hedge_delay is None else start + hedge_delay
+        first = asyncio.ensure_future(run_attempt(False))
+        pending: Set["asyncio.Future[Any]"] = {first}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                wakeups = [at for at in (deadline, hedge_at) if at is not None]
+                wait_timeout = (
+                    max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+                )
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+                    error = error or task.exception()
+
+                now = time.monotonic()
+                if pending and hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    with self._lock:
+                        self.hedges += 1
+                    pending.add(asyncio.ensure_future(run_attempt(True)))
+                if pending and deadline is not None and now >= deadline:
+                    found, value = self._expired(key)
+                    if found:
+                        return value
+                    raise self._timeout_error()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        assert error is not None
+        raise error
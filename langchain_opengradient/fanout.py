@@ -0,0 +1,181 @@
+"""Concurrent invocation of many tools."""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.tools import BaseTool
+
+ToolCall = Tuple[BaseTool, Dict[str, Any]]
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of one tool call in a fan-out.
+
+    Attributes:
+        tool_name (str): Name of the invoked tool.
+        output (Any): The tool output, or None if the call failed.
+        error (BaseException, optional): The exception raised by the call, or a
+            ``TimeoutError`` if it exceeded the per-call timeout.
+        latency (float): Seconds from the start of the call until it finished or
+            timed out.
+    """
+
+    tool_name: str
+    output: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call completed without an error."""
+        return self.error is None
+
+
+def _check_limits(max_concurrency: int, timeout: Optional[float]) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive")
+
+
+def invoke_tools(
+    calls: Sequence[ToolCall],
+    max_concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> List[ToolCallResult]:
+    """
+    Invoke tools concurrently on a thread pool.
+
+    Calls that exceed ``timeout`` are reported as failed, but threads cannot be
+    interrupted: a timed-out call keeps running in the background, including
+    any inference transaction it sent, and its result is discarded. Its slot is
+    handed to the next call, so timed-out calls do not hold up the rest of the
+    fan-out. Each fan-out uses its own threads.
+
+    Args:
+        calls (Sequence[Tuple[BaseTool, Dict[str, Any]]]): Tools and their input.
+        max_concurrency (int): Maximum number of calls running at once, not
+            counting timed-out calls.
+        timeout (float, optional): Seconds each call may run after it starts.
+
+    Returns:
+        List[ToolCallResult]: One result per call, in the order of ``calls``.
+    """
+    _check_limits(max_concurrency, timeout)
+    results: List[Optional[ToolCallResult]] = [None] * len(calls)
+    started: Dict[int, float] = {}
+
+    def run(index: int, tool: BaseTool, tool_input: Dict[str, Any]) -> Any:
+        started[index] = time.monotonic()
+        return tool.invoke(tool_input)
+
+    # Calls are submitted as slots free up, so the pool starts a new thread
+    # for a call whenever the ones it has are stuck in timed-out calls.
+    executor = ThreadPoolExecutor(max_workers=max(1, len(calls)))
+    futures: Dict[Future, int] = {}
+    pending: Set[Future] = set()
+    next_index = 0
+
+    def submit_ready() -> None:
+        nonlocal next_index
+        while len(pending) < max_concurrency and next_index < len(calls):
+            tool, tool_input = calls[next_index]
+            future = executor.submit(run, next_index, tool, tool_input)
+            futures[future] = next_index
+            pending.add(future)
+            next_index += 1
+
+    try:
+        submit_ready()
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                now = time.monotonic()
+                remaining = [
+                    started[futures[f]] + timeout - now
+                    for f in pending
+                    if futures[f] in started
+                ]
+                wait_timeout = max(0.0, min(remaining)) if remaining else timeout
+
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                pending.discard(future)
+                index = futures[future]
+                tool_name = calls[index][0].name
+                latency = now - started.get(index, now)
+                error = future.exception()
+                if error is None:
+                    results[index] = ToolCallResult(
+                        tool_name, future.result(), latency=latency
+                    )
+                else:
+                    results[index] = ToolCallResult(
+                        tool_name, error=error, latency=latency
+                    )
+
+            if timeout is not None:
+                for future in list(pending):
+                    index = futures[future]
+                    if index in started and now - started[index] >= timeout:
+                        pending.discard(future)
+                        results[index] = ToolCallResult(
+                            calls[index][0].name,
+                            error=TimeoutError(
+                                f"Tool call exceeded timeout of {timeout}s"
+                            ),
+                            latency=now - started[index],
+                        )
+            submit_ready()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [result for result in results if result is not None]
+
+
+async def ainvoke_tools(
+    calls: Sequence[ToolCall],
+    max_concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> List[ToolCallResult]:
+    """
+    Invoke tools concurrently on the running event loop.
+
+    Calls that exceed ``timeout`` are cancelled and reported as failed.
+
+    Args:
+        calls (Sequence[Tuple[BaseTool, Dict[str, Any]]]): Tools and their input.
+        max_concurrency (int): Maximum number of calls running at once.
+        timeout (float, optional): Seconds each call may run after it starts.
+
+    Returns:
+        List[ToolCallResult]: One result per call, in the order of ``calls``.
+    """
+    _check_limits(max_concurrency, timeout)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(tool: BaseTool, tool_input: Dict[str, Any]) -> ToolCallResult:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                output = await asyncio.wait_for(tool.ainvoke(tool_input), timeout)
+            except asyncio.TimeoutError:
+                return ToolCallResult(
+                    tool.name,
+                    error=TimeoutError(f"Tool call exceeded timeout of {timeout}s"),
+                    latency=time.monotonic() - start,
+                )
+            except Exception as e:
+                return ToolCallResult(
+                    tool.name, error=e, latency=time.monotonic() - start
+                )
+            return ToolCallResult(tool.name, output, latency=time.monotonic() - start)
+
+    return list(
+        await asyncio.gather(*(run(tool, tool_input) for tool, tool_input in calls))
+    )
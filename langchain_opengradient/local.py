@@ -0,0 +1,379 @@
+"""On-host execution of ONNX models for VANILLA inferences."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import opengradient as og  # type: ignore
+from langchain_core.runnables.config import run_in_executor
+from opengradient import InferenceResult  # type: ignore
+
+# Transaction hash of results computed on the host; nothing is sent on-chain.
+LOCAL_TRANSACTION_HASH = "local"
+
+_ONNX_DTYPES = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(float16)": np.float16,
+    "tensor(int8)": np.int8,
+    "tensor(int16)": np.int16,
+    "tensor(int32)": np.int32,
+    "tensor(int64)": np.int64,
+    "tensor(uint8)": np.uint8,
+    "tensor(bool)": np.bool_,
+    "tensor(string)": np.object_,
+}
+
+
+# Name of the model file in a stored model's directory.
+MODEL_FILE = "model.onnx"
+
+ModelSource = Union[str, Path, bytes]
+
+
+class LocalModelStore:
+    """On-disk store of ONNX models keyed by model CID.
+
+    Each model is stored once per SHA-256 digest of its content in
+    ``<root>/blobs/<digest>/``, as ``model.onnx`` next to its external-data
+    files, so onnxruntime memory-maps large weights instead of reading them
+    into memory. ``<root>/cids/<model_cid>`` records which digest a CID refers
+    to, so the same model registered under several CIDs is stored once. Models
+    are written atomically and verified against their digest the first time a
+    backend loads them.
+
+    Whether a CID is stored is cached per store after the first lookup; call
+    ``refresh`` to see models added or removed by other processes.
+
+    Args:
+        root (Union[str, Path]): Directory of the store; created if missing.
+
+    Example usage:
+        from langchain_opengradient import LocalModelStore
+
+        store = LocalModelStore("~/.cache/opengradient/models")
+        store.add("QmbUqS93oc4JTLMHwpVxsE39mhNxy6hpf6Py3r9oANr8aZ", "model.onnx")
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).expanduser()
+        self._blobs = self.root / "blobs"
+        self._cids = self.root / "cids"
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        self._cids.mkdir(parents=True, exist_ok=True)
+        self._paths: Dict[str, Optional[Path]] = {}
+
+    def add(
+        self,
+        model_cid: str,
+        model: ModelSource,
+        external_data: Optional[Mapping[str, ModelSource]] = None,
+    ) -> Path:
+        """
+        Store a model under ``model_cid``, replacing any earlier model for it.
+
+        Args:
+            model_cid (str): The CID of the model on the OpenGradient network.
+            model (Union[str, Path, bytes]): Path to an ONNX file or its content.
+            external_data (Mapping[str, Union[str, Path, bytes]], optional):
+                External-data files of the model by the location recorded in
+                the model, as paths or content. Defaults to the files the model
+                at path ``model`` refers to, found with the ``onnx`` package if
+                it is installed.
+
+        Returns:
+            Path: The path of the stored model file.
+        """
+        cid_path = self._cid_path(model_cid)
+        if external_data is None:
+            external_data = _external_data_files(model)
+        files = {MODEL_FILE: model}
+        for location, source in external_data.items():
+            files[_check_location(location)] = source
+
+        digest = _digest(files)
+        directory = self._blobs / digest
+        if not directory.exists():
+            tmp = Path(tempfile.mkdtemp(dir=self._blobs, prefix=".tmp-"))
+            try:
+                for name, source in files.items():
+                    target = tmp / name
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    if isinstance(source, bytes):
+                        target.write_bytes(source)
+                    else:
+                        shutil.copyfile(source, target)
+                os.replace(tmp, directory)
+            except OSError:
+                # Another writer stored the same model first.
+                if not directory.exists():
+                    raise
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+        _write_atomic(cid_path, digest.encode())
+        self._paths[model_cid] = directory / MODEL_FILE
+        return directory / MODEL_FILE
+
+    def digest(self, model_cid: str) -> Optional[str]:
+        """Return the SHA-256 digest stored for ``model_cid``, or None."""
+        try:
+            return self._cid_path(model_cid).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def path(self, model_cid: str) -> Optional[Path]:
+        """Return the model file of ``model_cid``, or None if it is not stored."""
+        try:
+            return self._paths[model_cid]
+        except KeyError:
+            pass
+        digest = self.digest(model_cid)
+        path = None if digest is None else self._blobs / digest / MODEL_FILE
+        if path is not None and not path.exists():
+            path = None
+        self._paths[model_cid] = path
+        return path
+
+    def files(self, model_cid: str) -> Dict[str, Path]:
+        """Return the stored files of ``model_cid`` by name, or {} if not stored."""
+        path = self.path(model_cid)
+        if path is None:
+            return {}
+        return {
+            file.relative_to(path.parent).as_posix(): file
+            for file in sorted(path.parent.rglob("*"))
+            if file.is_file()
+        }
+
+    def remove(self, model_cid: str) -> None:
+        """Forget ``model_cid``; the model is kept while other CIDs use it."""
+        digest = self.digest(model_cid)
+        self._cid_path(model_cid).unlink(missing_ok=True)
+        self._paths[model_cid] = None
+        if digest is not None and digest not in {
+            cid.read_text().strip() for cid in self._cids.iterdir()
+        }:
+            shutil.rmtree(self._blobs / digest, ignore_errors=True)
+
+    def refresh(self) -> None:
+        """Forget cached lookups, e.g. after other processes changed the store."""
+        self._paths.clear()
+
+    def __contains__(self, model_cid: object) -> bool:
+        return isinstance(model_cid, str) and self.path(model_cid) is not None
+
+    def _cid_path(self, model_cid: str) -> Path:
+        if not model_cid or os.sep in model_cid or model_cid in (".", ".."):
+            raise ValueError(f"Invalid model CID {model_cid!r}")
+        return self._cids / model_cid
+
+
+def _external_data_files(model: ModelSource) -> Dict[str, Path]:
+    """External-data files referenced by the ONNX file at ``model``."""
+    if isinstance(model, bytes):
+        return {}
+    try:
+        import onnx  # type: ignore
+    except ImportError:
+        return {}
+
+    path = Path(model)
+    proto = onnx.load(str(path), load_external_data=False)
+    graphs = [proto.graph]
+    locations = set()
+    while graphs:
+        graph = graphs.pop()
+        for tensor in graph.initializer:
+            if tensor.data_location == onnx.TensorProto.EXTERNAL:
+                for entry in tensor.external_data:
+                    if entry.key == "location":
+                        locations.add(entry.value)
+        for node in graph.node:
+            for attribute in node.attribute:
+                if attribute.HasField("g"):
+                    graphs.append(attribute.g)
+                graphs.extend(attribute.graphs)
+    return {location: path.parent / location for location in sorted(locations)}
+
+
+def _check_location(location: str) -> str:
+    parts = Path(location).parts
+    if (
+        not parts
+        or Path(location).is_absolute()
+        or ".." in parts
+        or location == MODEL_FILE
+    ):
+        raise ValueError(f"Invalid external data location {location!r}")
+    return Path(location).as_posix()
+
+
+def _file_digest(source: ModelSource) -> str:
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _digest(files: Mapping[str, ModelSource]) -> str:
+    """Digest of a model's files; that of ``model.onnx`` if it has no others."""
+    model_digest = _file_digest(files[MODEL_FILE])
+    others = sorted(name for name in files if name != MODEL_FILE)
+    if not others:
+        return model_digest
+    digest = hashlib.sha256(model_digest.encode())
+    for name in others:
+        digest.update(f"\0{name}\0{_file_digest(files[name])}".encode())
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class LocalInferenceBackend:
+    """Runs VANILLA inferences in-process with onnxruntime.
+
+    Models must be in the ``LocalModelStore``. Each model is loaded into an
+    ``onnxruntime.InferenceSession`` once, from its file on disk, so weights
+    stored as external data next to it are memory-mapped by onnxruntime
+    instead of copied into Python. Results are returned as ``InferenceResult``
+    with the output tensors of the model keyed by output name, as on the
+    network, and ``transaction_hash`` set to ``LOCAL_TRANSACTION_HASH``.
+
+    Requires the ``onnxruntime`` package.
+
+    Pass a backend to ``OpenGradientToolkit(local_backend=...)`` to run VANILLA
+    inferences of stored models locally. ZKML and TEE inferences, and models not
+    in the store, still go to the network.
+
+    Args:
+        store (LocalModelStore): Where models are looked up.
+        providers (Sequence[str], optional): onnxruntime execution providers.
+            Defaults to onnxruntime's default.
+        session_options (Any, optional): ``onnxruntime.SessionOptions`` used for
+            every session.
+
+    Example usage:
+        from langchain_opengradient import (
+            LocalInferenceBackend,
+            LocalModelStore,
+            OpenGradientToolkit,
+        )
+
+        backend = LocalInferenceBackend(LocalModelStore("~/.cache/og-models"))
+        toolkit = OpenGradientToolkit(local_backend=backend)
+    """
+
+    def __init__(
+        self,
+        store: LocalModelStore,
+        providers: Optional[Sequence[str]] = None,
+        session_options: Any = None,
+    ):
+        self.store = store
+        self.providers = list(providers) if providers is not None else None
+        self.session_options = session_options
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Any] = {}
+
+    def can_run(self, model_cid: str, inference_mode: og.InferenceMode) -> bool:
+        """Whether the inference can run locally: VANILLA and the model is stored."""
+        return inference_mode == og.InferenceMode.VANILLA and (
+            model_cid in self._sessions or model_cid in self.store
+        )
+
+    def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        """
+        Run an inference locally.
+
+        Args:
+            model_cid (str): The CID of a stored model.
+            inference_mode (og.InferenceMode): Must be VANILLA.
+            model_input (Dict[str, Any]): Input tensors by input name.
+
+        Returns:
+            InferenceResult: The output tensors by output name.
+        """
+        if inference_mode != og.InferenceMode.VANILLA:
+            raise ValueError(
+                f"Local inference only supports VANILLA mode, got {inference_mode}"
+            )
+        session = self._session(model_cid)
+
+        feed = {}
+        for model_arg in session.get_inputs():
+            if model_arg.name not in model_input:
+                raise ValueError(
+                    f"Model {model_cid} expects input {model_arg.name!r}, "
+                    f"got {sorted(model_input)}"
+                )
+            feed[model_arg.name] = np.asarray(
+                model_input[model_arg.name], dtype=_ONNX_DTYPES.get(model_arg.type)
+            )
+
+        names: List[str] = [output.name for output in session.get_outputs()]
+        outputs = session.run(names, feed)
+        return InferenceResult(LOCAL_TRANSACTION_HASH, dict(zip(names, outputs)))
+
+    async def ainfer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        """Async version of ``infer``; runs on the default executor."""
+        return await run_in_executor(
+            None, self.infer, model_cid, inference_mode, model_input
+        )
+
+    def _session(self, model_cid: str) -> Any:
+        session = self._sessions.get(model_cid)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(model_cid)
+            if session is None:
+                session = self._sessions[model_cid] = self._load(model_cid)
+            return session
+
+    def _load(self, model_cid: str) -> Any:
+        try:
+            import onnxruntime  # type: ignore
+        except ImportError as e:
+            raise ImportError(
+                "Could not import onnxruntime python package. "
+                "Please install it with `pip install onnxruntime`."
+            ) from e
+
+        path = self.store.path(model_cid)
+        files = self.store.files(model_cid)
+        if path is None or MODEL_FILE not in files:
+            raise ValueError(f"Model {model_cid} is not in the local model store")
+        if _digest(files) != self.store.digest(model_cid):
+            raise ValueError(f"Stored model {model_cid} does not match its digest")
+
+        return onnxruntime.InferenceSession(
+            str(path), sess_options=self.session_options, providers=self.providers
+        )
@@ -0,0 +1,206 @@
+"""Declarative manifests of OpenGradient tools."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Union
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from langchain_opengradient.toolkits import OpenGradientToolkit
+
+# "package.module:attribute", e.g. "my_agents.features:eth_ohlc_window".
+REFERENCE_PATTERN = r"^[A-Za-z_][\w.]*:[A-Za-z_][\w.]*$"
+
+
+def resolve_reference(reference: str) -> Any:
+    """
+    Import the object a ``"package.module:attribute"`` reference points to.
+
+    Args:
+        reference (str): Module path and attribute path separated by a colon.
+
+    Returns:
+        Any: The referenced object.
+    """
+    module_name, _, attribute = reference.partition(":")
+    value: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        value = getattr(value, part)
+    return value
+
+
+class ModelToolSpec(BaseModel):
+    """Manifest entry for a tool created with ``create_run_model_tool``.
+
+    Attributes:
+        name (str): The tool name.
+        model_cid (str): The CID of the model to run.
+        input_provider (str): Reference to the ``model_input_provider``.
+        output_formatter (str): Reference to the ``model_output_formatter``.
+        input_schema (str, optional): Reference to the pydantic model used as
+            ``tool_input_schema``.
+        description (str): The tool description.
+        inference_mode (str): ``"VANILLA"``, ``"ZKML"`` or ``"TEE"``.
+    """
+
+    model_config = ConfigDict(extra="forbid", protected_namespaces=())
+
+    type: Literal["model"]
+    name: str = Field(min_length=1)
+    model_cid: str = Field(min_length=1)
+    input_provider: str = Field(pattern=REFERENCE_PATTERN)
+    output_formatter: str = Field(pattern=REFERENCE_PATTERN)
+    input_schema: Optional[str] = Field(default=None, pattern=REFERENCE_PATTERN)
+    description: str = "Executes the given ML model"
+    inference_mode: Literal["VANILLA", "ZKML", "TEE"] = "VANILLA"
+
+    def build(self, toolkit: OpenGradientToolkit) -> BaseTool:
+        """Import the referenced callables and create the tool."""
+        import opengradient as og  # type: ignore
+
+        return toolkit.create_run_model_tool(
+            model_cid=self.model_cid,
+            tool_name=self.name,
+            model_input_provider=resolve_reference(self.input_provider),
+            model_output_formatter=resolve_reference(self.output_formatter),
+            tool_input_schema=(
+                resolve_reference(self.input_schema) if self.input_schema else None
+            ),
+            tool_description=self.description,
+            inference_mode=og.InferenceMode[self.inference_mode],
+        )
+
+
+class WorkflowToolSpec(BaseModel):
+    """Manifest entry for a tool created with ``create_read_workflow_tool``.
+
+    Attributes:
+        name (str): The tool name.
+        contract_address (str): The workflow contract to read.
+        description (str): The tool description.
+        output_formatter (str, optional): Reference to the ``output_formatter``;
+            the workflow output is returned as is without one.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: Literal["workflow"]
+    name: str = Field(min_length=1)
+    contract_address: str = Field(min_length=1)
+    description: str
+    output_formatter: Optional[str] = Field(default=None, pattern=REFERENCE_PATTERN)
+
+    def build(self, toolkit: OpenGradientToolkit) -> BaseTool:
+        """Import the referenced formatter and create the tool."""
+        if self.output_formatter is None:
+            return toolkit.create_read_workflow_tool(
+                workflow_contract_address=self.contract_address,
+                tool_name=self.name,
+                tool_description=self.description,
+            )
+        return toolkit.create_read_workflow_tool(
+            workflow_contract_address=self.contract_address,
+            tool_name=self.name,
+            tool_description=self.description,
+            output_formatter=resolve_reference(self.output_formatter),
+        )
+
+
+ToolSpec = Annotated[
+    Union[ModelToolSpec, WorkflowToolSpec], Field(discriminator="type")
+]
+
+
+class ToolManifest(BaseModel):
+    """A validated list of tool specs.
+
+    Manifests are JSON or YAML documents with a ``tools`` list. Callables and
+    input schemas are given as ``"package.module:attribute"`` references, which
+    are only imported when a tool is built.
+
+    .. code-block:: yaml
+
+        tools:
+          - type: model
+            name: eth_usdt_volatility
+            model_cid: QmRhcpDXfYCKsimTmJYrAVM4Bbvck59Zb2onj3MHv9Kw5N
+            input_provider: my_agents.features:eth_ohlc_window
+            output_formatter: my_agents.formatters:percent
+            description: Generates volatility measurement for ETH/USDT
+          - type: workflow
+            name: ETH_Price_Forecast
+            contract_address: "0x6e0641925b845A1ca8aA9a890C4DEF388E9197e0"
+            description: Reads latest forecast for ETH price
+
+    Attributes:
+        tools (List[ModelToolSpec | WorkflowToolSpec]): The tools, in order.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    tools: List[ToolSpec] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_unique_names(self) -> ToolManifest:
+        names = set()
+        for spec in self.tools:
+            if spec.name in names:
+                raise ValueError(f"Tool {spec.name!r} is defined more than once")
+            names.add(spec.name)
+        return self
+
+
+def parse_manifest(text: str, format: str = "json") -> ToolManifest:
+    """
+    Parse and validate a manifest document.
+
+    Args:
+        text (str): The manifest.
+        format (str, optional): ``"json"`` or ``"yaml"``. Defaults to ``"json"``.
+
+    Returns:
+        ToolManifest: The validated manifest.
+    """
+    if format == "json":
+        data = json.loads(text)
+    elif format == "yaml":
+        import yaml  # type: ignore[import-untyped]
+
+        data = yaml.safe_load(text)
+    else:
+        raise ValueError(f"Unknown manifest format {format!r}")
+    return ToolManifest.model_validate(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_manifest(path: str, mtime_ns: int, size: int) -> ToolManifest:
+    suffix = Path(path).suffix.lower()
+    format = "yaml" if suffix in (".yaml", ".yml") else "json"
+    return parse_manifest(Path(path).read_text(), format=format)
+
+
+def load_manifest(path: Union[str, os.PathLike]) -> ToolManifest:
+    """
+    Load a manifest file, parsing each version of the file only once.
+
+    ``.yaml`` and ``.yml`` files are read as YAML, other files as JSON. Parsed
+    manifests are cached by path, modification time and size, so toolkits
+    created from the same file share one validated manifest.
+
+    Args:
+        path (str | os.PathLike): The manifest file.
+
+    Returns:
+        ToolManifest: The validated manifest.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _load_manifest(str(resolved), stat.st_mtime_ns, stat.st_size)
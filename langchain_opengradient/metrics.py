@@ -0,0 +1,195 @@
+"""Per-phase latency metrics for OpenGradient tools."""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Phases of a run-model tool call.
+INPUT_PHASE = "input"
+INFERENCE_PHASE = "inference"
+FORMAT_PHASE = "format"
+# Phase of a read-workflow tool call that reads the workflow result.
+READ_PHASE = "read"
+# Background verified inference of a two-phase run-model tool call.
+VERIFICATION_PHASE = "verification"
+# The whole tool call, from the first phase to the last.
+TOTAL_PHASE = "total"
+
+# Upper bounds in seconds, roughly doubling from 1ms to about 2 minutes.
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(0.001 * 2**i for i in range(18))
+
+PhaseHook = Callable[[str, str, float, Optional[BaseException]], None]
+
+
+@dataclass
+class LatencyHistogram:
+    """Bucketed latencies of one phase of one tool.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the buckets in seconds. One
+            more overflow bucket counts latencies above the last bound.
+        counts (List[int]): Number of observations per bucket.
+        count (int): Number of observations.
+        total (float): Sum of all observed latencies in seconds.
+        max (float): Largest observed latency in seconds.
+        errors (int): Observations whose phase raised an exception.
+    """
+
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    errors: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float, failed: bool = False) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if failed:
+            self.errors += 1
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds, or 0 without observations."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.99 for p99).
+
+        Returns:
+            float: The upper bound of the bucket holding the quantile, capped at
+                the largest observed latency. 0 without observations.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            seen += bucket_count
+            if seen >= rank and seen > 0:
+                return min(bound, self.max)
+        return self.max
+
+
+class ToolMetrics:
+    """Latency histograms and error counts for each phase of every tool call.
+
+    Run-model tools record the ``input`` (``model_input_provider``),
+    ``inference`` and ``format`` (``model_output_formatter``) phases; read-workflow
+    tools record ``read`` and ``format``. Both record ``total`` for the whole call.
+    A phase that raises is recorded with its latency and counted as an error.
+
+    Hooks added with ``add_hook`` are called after each phase with the tool name,
+    phase, latency in seconds and the exception raised by the phase (or None), for
+    example to export to an external metrics system. Hooks run on the thread or
+    event loop that made the tool call, so they should be quick.
+
+    Metrics are only collected when an instance is passed to
+    ``OpenGradientToolkit(metrics=...)``; without one, tool calls are not timed.
+
+    Args:
+        buckets (Sequence[float], optional): Increasing upper bounds of the
+            histogram buckets in seconds. Defaults to ``DEFAULT_BUCKETS``.
+
+    Example usage:
+        from langchain_opengradient import OpenGradientToolkit, ToolMetrics
+
+        metrics = ToolMetrics()
+        toolkit = OpenGradientToolkit(metrics=metrics)
+        ...
+        for tool_name, phases in metrics.snapshot().items():
+            for phase, histogram in phases.items():
+                print(tool_name, phase, histogram.quantile(0.99), histogram.errors)
+    """
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        bounds = tuple(DEFAULT_BUCKETS if buckets is None else buckets)
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("buckets must be a non-empty increasing sequence")
+
+        self.buckets = bounds
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._hooks: List[PhaseHook] = []
+
+    def add_hook(self, hook: PhaseHook) -> None:
+        """
+        Call ``hook(tool_name, phase, seconds, error)`` after every recorded phase.
+
+        Args:
+            hook (Callable[[str, str, float, Optional[BaseException]], None]): The
+                hook. Exceptions raised by it propagate to the tool call.
+        """
+        with self._lock:
+            self._hooks = [*self._hooks, hook]
+
+    def record(
+        self,
+        tool_name: str,
+        phase: str,
+        seconds: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record the latency of one phase of a tool call.
+
+        Args:
+            tool_name (str): Name of the tool.
+            phase (str): Name of the phase.
+            seconds (float): Latency of the phase.
+            error (BaseException, optional): Exception raised by the phase.
+        """
+        key = (tool_name, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+            histogram.observe(seconds, failed=error is not None)
+            hooks = self._hooks
+
+        for hook in hooks:
+            hook(tool_name, phase, seconds, error)
+
+    def histogram(self, tool_name: str, phase: str) -> Optional[LatencyHistogram]:
+        """Return a copy of the histogram of a phase, or None if never recorded."""
+        with self._lock:
+            histogram = self._histograms.get((tool_name, phase))
+            return None if histogram is None else _copy(histogram)
+
+    def snapshot(self) -> Dict[str, Dict[str, LatencyHistogram]]:
+        """Return copies of all histograms, keyed by tool name and then phase."""
+        snapshot: Dict[str, Dict[str, LatencyHistogram]] = {}
+        with self._lock:
+            for (tool_name, phase), histogram in self._histograms.items():
+                snapshot.setdefault(tool_name, {})[phase] = _copy(histogram)
+        return snapshot
+
+    def reset(self) -> None:
+        """Drop all recorded latencies; hooks are kept."""
+        with self._lock:
+            self._histograms.clear()
+
+
+def _copy(histogram: LatencyHistogram) -> LatencyHistogram:
+    return LatencyHistogram(
+        buckets=histogram.buckets,
+        counts=list(histogram.counts),
+        count=histogram.count,
+        total=histogram.total,
+        max=histogram.max,
+        errors=histogram.errors,
+    )
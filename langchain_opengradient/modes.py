@@ -0,0 +1,304 @@
+"""Choosing inference modes per call from a latency budget."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Inference modes from least to most trusted, which is also fastest to slowest.
+TRUST_ORDER = ("VANILLA", "TEE", "ZKML")
+
+# Reasons recorded with a decision.
+WITHIN_BUDGET = "within_budget"
+NO_SAMPLES = "no_samples"
+OVER_BUDGET = "over_budget"
+PROBE = "probe"
+
+
+class RollingLatencies:
+    """Latencies of the most recent inferences per model CID and mode.
+
+    ``OpenGradientToolkit`` records every successful inference it sends,
+    whichever tool sends it, so a mode's latency is known once any tool has
+    used it. Latencies older than ``max_age`` are dropped, so a mode that has
+    not been used for a while counts as unknown again.
+
+    Args:
+        window (int): Latencies kept per model CID and mode. Defaults to 100.
+        max_age (float, optional): Seconds a latency is kept. Defaults to 600;
+            None keeps latencies until the window is full.
+    """
+
+    def __init__(self, window: int = 100, max_age: Optional[float] = 600.0):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+
+        self.window = window
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # Monotonic time and latency of each inference, oldest first.
+        self._samples: Dict[Tuple[str, str], Deque[Tuple[float, float]]] = {}
+
+    def observe(self, model_cid: str, inference_mode: Any, seconds: float) -> None:
+        """Record the latency of one inference."""
+        key = (model_cid, inference_mode.name)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append((time.monotonic(), seconds))
+
+    def _fresh(self, model_cid: str, inference_mode: Any) -> List[float]:
+        # Called with the lock held.
+        samples = self._samples.get((model_cid, inference_mode.name))
+        if not samples:
+            return []
+        if self.max_age is not None:
+            cutoff = time.monotonic() - self.max_age
+            while samples and samples[0][0] < cutoff:
+                samples.popleft()
+        return [seconds for _, seconds in samples]
+
+    def count(self, model_cid: str, inference_mode: Any) -> int:
+        """Number of latencies in the window."""
+        with self._lock:
+            return len(self._fresh(model_cid, inference_mode))
+
+    def quantile(
+        self, model_cid: str, inference_mode: Any, q: float
+    ) -> Optional[float]:
+        """
+        Estimate a latency quantile from the window.
+
+        Args:
+            model_cid (str): The model.
+            inference_mode (og.InferenceMode): The mode.
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float, optional: The latency in seconds, or None without samples.
+        """
+        with self._lock:
+            samples = sorted(self._fresh(model_cid, inference_mode))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+@dataclass
+class ModeDecision:
+    """The inference mode chosen for one tool call.
+
+    Attributes:
+        tool_name (str): The tool that was called.
+        model_cid (str): The model that was run.
+        mode (og.InferenceMode): The chosen mode.
+        reason (str): ``"within_budget"`` if the mode's latency estimate fits
+            the remaining budget, ``"over_budget"`` if no allowed mode fits and
+            the least trusted one was used, ``"no_samples"`` if no allowed mode
+            has enough recorded latencies to estimate and the least trusted one
+            was used, or ``"probe"`` if a more trusted mode that was skipped
+            was used to refresh its latencies.
+        estimate (float, optional): Latency estimate of the chosen mode.
+        remaining (float): Budget left when the mode was chosen.
+        fallback (bool): Whether a more trusted mode was skipped.
+        timestamp (float): Wall clock time of the decision.
+    """
+
+    tool_name: str
+    model_cid: str
+    mode: Any
+    reason: str
+    estimate: Optional[float]
+    remaining: float
+    fallback: bool
+    timestamp: float
+
+
+class InferenceModePolicy:
+    """Picks the most trusted inference mode a call can afford.
+
+    For each call, the modes at least as trusted as ``min_trust`` are tried from
+    most to least trusted (ZKML, TEE, VANILLA). The first mode whose latency
+    estimate, the ``quantile`` of the latencies the toolkit recorded for the
+    model CID and mode, fits the budget left after the input provider ran is
+    used. Modes with fewer than ``min_samples`` recorded latencies are skipped,
+    and if no mode fits, the least trusted allowed mode is used, so calls stay
+    within the budget while latencies are unknown.
+
+    To learn the latencies of skipped modes, and to notice when a mode that was
+    over budget got faster, one call in ``probe_interval`` per model runs in a
+    skipped mode instead, taking turns between them. Only these probes can
+    exceed the budget. Recorded latencies expire after the
+    ``RollingLatencies.max_age``, so modes are probed again after a while.
+
+    Every decision is kept in ``decisions`` (the most recent ``max_decisions``),
+    counted in ``counts`` by mode name and passed to ``on_decision``.
+
+    Pass an instance to ``create_run_model_tool(mode_policy=...)`` instead of an
+    ``inference_mode``. A policy may be shared between tools.
+
+    Args:
+        latency_budget (float): Seconds a tool call may take up to the end of the
+            inference.
+        min_trust (og.InferenceMode, optional): Least trusted acceptable mode.
+            Defaults to None (VANILLA).
+        modes (Sequence[og.InferenceMode], optional): Modes to choose from.
+            Defaults to all modes.
+        quantile (float): Quantile of recorded latencies compared with the
+            budget. Defaults to 0.95.
+        min_samples (int): Recorded latencies needed to estimate a mode.
+            Defaults to 5.
+        probe_interval (int, optional): One call in this many per model probes
+            a skipped mode. Defaults to 20; None never probes.
+        max_decisions (int): Decisions kept in ``decisions``. Defaults to 1000.
+        on_decision (Callable[[ModeDecision], None], optional): Called with each
+            decision. Exceptions raised by it propagate to the tool call.
+
+    Example usage:
+        import opengradient as og
+        from langchain_opengradient import InferenceModePolicy
+
+        tool = toolkit.create_run_model_tool(
+            ...,
+            mode_policy=InferenceModePolicy(
+                latency_budget=2.0, min_trust=og.InferenceMode.VANILLA
+            ),
+        )
+    """
+
+    def __init__(
+        self,
+        latency_budget: float,
+        min_trust: Any = None,
+        modes: Optional[Sequence[Any]] = None,
+        quantile: float = 0.95,
+        min_samples: int = 5,
+        probe_interval: Optional[int] = 20,
+        max_decisions: int = 1000,
+        on_decision: Optional[Callable[[ModeDecision], None]] = None,
+    ):
+        import opengradient as og  # type: ignore
+
+        if latency_budget <= 0:
+            raise ValueError("latency_budget must be positive")
+        if not 0 < quantile <= 1:
+            raise ValueError("quantile must be in (0, 1]")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        if probe_interval is not None and probe_interval < 1:
+            raise ValueError("probe_interval must be at least 1")
+        if min_trust is None:
+            min_trust = og.InferenceMode.VANILLA
+        if modes is None:
+            modes = list(og.InferenceMode)
+
+        allowed = [
+            mode
+            for mode in modes
+            if TRUST_ORDER.index(mode.name) >= TRUST_ORDER.index(min_trust.name)
+        ]
+        if not allowed:
+            raise ValueError(f"No mode in modes is at least as trusted as {min_trust}")
+
+        self.latency_budget = latency_budget
+        self.min_trust = min_trust
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.probe_interval = probe_interval
+        self.on_decision = on_decision
+        # Most trusted first.
+        self.candidates = sorted(
+            allowed, key=lambda mode: TRUST_ORDER.index(mode.name), reverse=True
+        )
+        self.decisions: Deque[ModeDecision] = deque(maxlen=max_decisions)
+        self.counts: Dict[str, int] = {}
+        self.fallbacks = 0
+        self.probes = 0
+        self._lock = threading.Lock()
+        # Calls and probes per model CID.
+        self._calls: Dict[str, int] = {}
+        self._probes: Dict[str, int] = {}
+
+    def _probe_turn(self, model_cid: str) -> Optional[int]:
+        """Number of the probe if this call should probe, otherwise None."""
+        with self._lock:
+            calls = self._calls[model_cid] = self._calls.get(model_cid, 0) + 1
+            if self.probe_interval is None or calls % self.probe_interval:
+                return None
+            probes = self._probes.get(model_cid, 0)
+            self._probes[model_cid] = probes + 1
+            return probes
+
+    def choose(
+        self,
+        tool_name: str,
+        model_cid: str,
+        latencies: RollingLatencies,
+        elapsed: float = 0.0,
+    ) -> ModeDecision:
+        """
+        Choose the mode of one call and record the decision.
+
+        Args:
+            tool_name (str): The tool being called.
+            model_cid (str): The model to run.
+            latencies (RollingLatencies): Recorded inference latencies.
+            elapsed (float, optional): Seconds of the budget already used.
+
+        Returns:
+            ModeDecision: The decision.
+        """
+        remaining = self.latency_budget - elapsed
+        chosen = None
+        estimate = None
+        skipped = []
+        for mode in self.candidates:
+            if latencies.count(model_cid, mode) < self.min_samples:
+                skipped.append(mode)
+                continue
+            estimate = latencies.quantile(model_cid, mode, self.quantile)
+            if estimate is not None and estimate <= remaining:
+                chosen, reason = mode, WITHIN_BUDGET
+                break
+            skipped.append(mode)
+        if chosen is None:
+            # Nothing fits; the least trusted mode is the fastest.
+            chosen = skipped.pop()
+            known = latencies.count(model_cid, chosen) >= self.min_samples
+            estimate = latencies.quantile(model_cid, chosen, self.quantile)
+            reason = OVER_BUDGET if known else NO_SAMPLES
+        probe = self._probe_turn(model_cid) if skipped else None
+        if probe is not None:
+            chosen = skipped[probe % len(skipped)]
+            estimate = latencies.quantile(model_cid, chosen, self.quantile)
+            reason = PROBE
+        decision = ModeDecision(
+            tool_name=tool_name,
+            model_cid=model_cid,
+            mode=chosen,
+            reason=reason,
+            estimate=estimate,
+            remaining=remaining,
+            fallback=chosen is not self.candidates[0],
+            timestamp=time.time(),
+        )
+
+        with self._lock:
+            self.decisions.append(decision)
+            self.counts[chosen.name] = self.counts.get(chosen.name, 0) + 1
+            if decision.fallback:
+                self.fallbacks += 1
+            if reason == PROBE:
+                self.probes += 1
+        if self.on_decision is not None:
+            self.on_decision(decision)
+        return decision
+
+    def recent_decisions(self) -> List[ModeDecision]:
+        """Copy of the recorded decisions, oldest first."""
+        with self._lock:
+            return list(self.decisions)
@@ -0,0 +1,276 @@
+"""Running CPU-heavy tool callbacks in a process pool."""
+
+import asyncio
+import dataclasses
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Arrays smaller than this are cheaper to pickle than to map.
+DEFAULT_SHM_THRESHOLD = 64 * 1024
+
+
+class _SharedArray(NamedTuple):
+    """Reference to an array placed in a shared memory block."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _share(value: Any, threshold: int, blocks: List[shared_memory.SharedMemory]) -> Any:
+    """Replace large arrays in ``value`` with shared memory references.
+
+    Dicts, lists, tuples and dataclasses are walked; the created blocks are
+    appended to ``blocks``.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject or value.nbytes < max(threshold, 1):
+            return value
+        block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        blocks.append(block)
+        np.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+        return _SharedArray(block.name, value.shape, value.dtype.str)
+    if isinstance(value, dict):
+        return {key: _share(item, threshold, blocks) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return type(value)(_share(item, threshold, blocks) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.replace(
+            value,
+            **{
+                field.name: _share(getattr(value, field.name), threshold, blocks)
+                for field in dataclasses.fields(value)
+                if field.init
+            },
+        )
+    return value
+
+
+def _attach(
+    value: Any, blocks: List[shared_memory.SharedMemory], owned: bool = False
+) -> Any:
+    """Replace shared memory references in ``value`` with array views.
+
+    With ``owned``, each block is closed once its array is garbage collected;
+    otherwise the caller closes the blocks appended to ``blocks``.
+    """
+    if isinstance(value, _SharedArray):
+        block = shared_memory.SharedMemory(name=value.name)
+        blocks.append(block)
+        array = np.ndarray(value.shape, np.dtype(value.dtype), buffer=block.buf)
+        if owned:
+            weakref.finalize(array, _close, [block])
+        return array
+    if isinstance(value, dict):
+        return {key: _attach(item, blocks, owned) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return type(value)(_attach(item, blocks, owned) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.replace(
+            value,
+            **{
+                field.name: _attach(getattr(value, field.name), blocks, owned)
+                for field in dataclasses.fields(value)
+                if field.init
+            },
+        )
+    return value
+
+
+def _close(blocks: List[shared_memory.SharedMemory]) -> None:
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass  # A view escaped, e.g. into a global; the OS unmaps on exit.
+
+
+def _run_in_worker(
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    threshold: int,
+) -> Any:
+    """Call ``fn`` in a pool process on shared inputs and share its result."""
+    input_blocks: List[shared_memory.SharedMemory] = []
+    output_blocks: List[shared_memory.SharedMemory] = []
+    try:
+        result = fn(*_attach(args, input_blocks), **_attach(kwargs, input_blocks))
+        # Copy the result out before the input views are released, since it
+        # may be a view of an input.
+        shared = _share(result, threshold, output_blocks)
+    except BaseException:
+        _close(output_blocks)
+        for block in output_blocks:
+            block.unlink()
+        raise
+    finally:
+        result = None
+        _close(input_blocks)
+    # The caller maps and unlinks the result blocks.
+    _close(output_blocks)
+    return shared
+
+
+def _receive(shared: Any) -> Any:
+    """Map the result blocks of a call and unlink them.
+
+    The arrays stay valid until they are garbage collected.
+    """
+    blocks: List[shared_memory.SharedMemory] = []
+    result = _attach(shared, blocks, owned=True)
+    for block in blocks:
+        block.unlink()
+    return result
+
+
+def _discard(blocks: List[shared_memory.SharedMemory]) -> None:
+    """Close and unlink blocks; safe to call more than once."""
+    while True:
+        try:
+            block = blocks.pop()
+        except IndexError:
+            return
+        block.close()
+        block.unlink()
+
+
+def _drop_result(future: "Future[Any]") -> None:
+    """Free the result blocks of a call nobody waits for anymore."""
+    if not future.cancelled() and future.exception() is None:
+        _receive(future.result())
+
+
+class ProcessOffload:
+    """Runs ``model_input_provider`` and ``model_output_formatter`` in processes.
+
+    CPU-bound providers and formatters hold the GIL and stall every other tool
+    call of the process. With an offload, run-model tools call them in a managed
+    ``ProcessPoolExecutor`` instead, so heavy tools scale across cores while the
+    calling thread or event loop stays free.
+
+    Numpy arrays of at least ``shm_threshold`` bytes in the arguments and results
+    (including the ``model_output`` of an ``InferenceResult``) are passed through
+    shared memory blocks rather than pickled: the sender writes the array once
+    into a block and the receiver maps it. Results returned to the tool are
+    views of their blocks, which are released when the arrays are garbage
+    collected. Smaller arrays and other values are pickled as usual.
+
+    Offloaded callables must be picklable, i.e. defined at module level, and
+    must not be coroutine functions.
+
+    Pass an instance to ``create_run_model_tool(offload=...)``; one offload may
+    serve many tools. The pool is started on first use.
+
+    Args:
+        max_workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs.
+        mp_context (str, optional): Multiprocessing start method. Defaults to
+            ``"spawn"``, which is safe in processes running threads.
+        shm_threshold (int, optional): Minimum array size in bytes passed through
+            shared memory. Defaults to 64 KiB.
+
+    Example usage:
+        from langchain_opengradient import ProcessOffload
+
+        offload = ProcessOffload(max_workers=4)
+        tool = toolkit.create_run_model_tool(
+            ...,
+            model_input_provider=compute_rolling_features,  # module-level function
+            offload=offload,
+        )
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mp_context: str = "spawn",
+        shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if shm_threshold < 0:
+            raise ValueError("shm_threshold must not be negative")
+
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.shm_threshold = shm_threshold
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.mp_context),
+                )
+            self.calls += 1
+            return self._executor
+
+    def _submit(
+        self, fn: Callable[..., Any], args: Any, kwargs: Any
+    ) -> Tuple["Future[Any]", List[shared_memory.SharedMemory]]:
+        blocks: List[shared_memory.SharedMemory] = []
+        try:
+            future = self._get_executor().submit(
+                _run_in_worker,
+                fn,
+                _share(args, self.shm_threshold, blocks),
+                _share(kwargs, self.shm_threshold, blocks),
+                self.shm_threshold,
+            )
+        except BaseException:
+            _discard(blocks)
+            raise
+        # Input blocks are freed once the worker is done with them.
+        future.add_done_callback(lambda _: _discard(blocks))
+        return future, blocks
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``fn(*args, **kwargs)`` in a worker process and wait for the result.
+
+        Args:
+            fn (Callable): A picklable function.
+            *args (Any): Positional arguments.
+            **kwargs (Any): Keyword arguments.
+
+        Returns:
+            Any: The return value of ``fn``.
+        """
+        future, blocks = self._submit(fn, args, kwargs)
+        try:
+            shared = future.result()
+        except BaseException:
+            future.add_done_callback(_drop_result)
+            raise
+        # The done callback may not have run yet when the result is available.
+        _discard(blocks)
+        return _receive(shared)
+
+    async def arun(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Async version of ``run``; the event loop is not blocked while waiting."""
+        future, blocks = self._submit(fn, args, kwargs)
+        try:
+            shared = await asyncio.wrap_future(future)
+        except BaseException:
+            # Cancelled callers still free the result blocks once it arrives.
+            future.add_done_callback(_drop_result)
+            raise
+        _discard(blocks)
+        return _receive(shared)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; the pool is started again on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,304 @@
+"""SQLite store sharing cached results between processes on a host."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+INFERENCE_KIND = "inference"
+MODEL_OUTPUT_KIND = "model_output"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    nbytes INTEGER NOT NULL,
+    meta TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+# Hits refresh the LRU position at most this often, to keep reads mostly
+# read-only under concurrent access.
+_TOUCH_INTERVAL = 1.0
+
+
+def _encode_tensors(groups: Dict[str, Dict[str, Any]]) -> Tuple[List[Any], bytes]:
+    """Write tensors as consecutive ``.npy`` records; object arrays go to JSON."""
+    import numpy as np
+
+    buffer = io.BytesIO()
+    layout: List[Any] = []
+    for group, tensors in groups.items():
+        for name, value in tensors.items():
+            array = np.asarray(value)
+            if array.dtype.hasobject:
+                layout.append([group, name, array.tolist()])
+            else:
+                np.lib.format.write_array(
+                    buffer, np.ascontiguousarray(array), allow_pickle=False
+                )
+                layout.append([group, name, None])
+    return layout, buffer.getvalue()
+
+
+def _decode_tensors(layout: List[Any], payload: bytes) -> Dict[str, Dict[str, Any]]:
+    import numpy as np
+
+    buffer = io.BytesIO(payload)
+    groups: Dict[str, Dict[str, Any]] = {}
+    for group, name, json_value in layout:
+        if json_value is None:
+            array = np.lib.format.read_array(buffer, allow_pickle=False)
+        else:
+            array = np.array(json_value)
+        groups.setdefault(group, {})[name] = array
+    return groups
+
+
+def _encode(value: Any) -> Tuple[str, Dict[str, Any], bytes]:
+    from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+    if isinstance(value, InferenceResult):
+        layout, payload = _encode_tensors({"model_output": value.model_output})
+        meta = {"transaction_hash": value.transaction_hash, "layout": layout}
+        return INFERENCE_KIND, meta, payload
+    if isinstance(value, ModelOutput):
+        layout, payload = _encode_tensors(
+            {"numbers": value.numbers, "strings": value.strings, "jsons": value.jsons}
+        )
+        meta = {
+            "is_simulation_result": bool(value.is_simulation_result),
+            "layout": layout,
+        }
+        return MODEL_OUTPUT_KIND, meta, payload
+    raise TypeError(f"Cannot store values of type {type(value).__name__}")
+
+
+def _decode(
+    kind: str, meta: Dict[str, Any], payload: bytes
+) -> Union[InferenceResult, ModelOutput]:
+    from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+    groups = _decode_tensors(meta["layout"], payload)
+    if kind == INFERENCE_KIND:
+        return InferenceResult(meta["transaction_hash"], groups.get("model_output", {}))
+    return ModelOutput(
+        numbers=groups.get("numbers", {}),
+        strings=groups.get("strings", {}),
+        jsons=groups.get("jsons", {}),
+        is_simulation_result=meta["is_simulation_result"],
+    )
+
+
+class SharedResultStore:
+    """Size-bounded result store in a SQLite file shared by local processes.
+
+    Worker processes on a host that open the same ``path`` share inference
+    results and workflow reads, so a result fetched by one worker is a hit for
+    the others and survives restarts. Pass the store to
+    ``InferenceCache(store=...)`` and ``WorkflowResultCache(store=...)``; the
+    in-memory caches keep serving hot entries and fall back to the store on a
+    miss.
+
+    ``InferenceResult`` and workflow ``ModelOutput`` values are stored as raw
+    ``.npy`` tensor records, never pickled. Tensors of Python objects (parsed
+    JSON outputs) are stored as JSON. Other values are not stored.
+
+    The database runs in WAL mode so readers do not block the writer, and each
+    thread uses its own connection. Least recently used entries are evicted once
+    the stored tensors exceed ``max_bytes``. Expiry is left to the caches, which
+    compare an entry's age with their own TTL. A store that is busy or broken
+    behaves as a miss, and skips deletes, rather than failing the tool call;
+    see ``errors``.
+
+    Args:
+        path (str | Path): The SQLite database file; created if missing.
+        max_bytes (int): Budget for stored payloads. Defaults to 256 MiB.
+        timeout (float): Seconds to wait for a lock held by another process.
+            Defaults to 5.
+
+    Example usage:
+        from langchain_opengradient import (
+            InferenceCache,
+            SharedResultStore,
+            WorkflowResultCache,
+        )
+
+        store = SharedResultStore("/var/cache/opengradient/results.db")
+        toolkit = OpenGradientToolkit(workflow_cache=WorkflowResultCache(store=store))
+        tool = toolkit.create_run_model_tool(
+            ..., inference_cache=InferenceCache(store=store)
+        )
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        timeout: float = 5.0,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and are not reused in a forked child.
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _failed(self, error: BaseException) -> None:
+        self.errors += 1
+        self.last_error = error
+
+    def __len__(self) -> int:
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()
+        return count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of stored payloads."""
+        (total,) = (
+            self._connection()
+            .execute("SELECT COALESCE(SUM(nbytes), 0) FROM results")
+            .fetchone()
+        )
+        return total
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """
+        Look up a stored value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Tuple[float, Any], optional: The age of the value in seconds and the
+                value, or None if it is not stored.
+        """
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT kind, stored_at, accessed_at, meta, payload FROM results "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            kind, stored_at, accessed_at, meta, payload = row
+            now = time.time()
+            if now - accessed_at > _TOUCH_INTERVAL:
+                connection.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            value = _decode(kind, json.loads(meta), payload)
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            self._failed(e)
+            return None
+        return max(0.0, now - stored_at), value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store a value, evicting least recently used entries to fit the budget.
+
+        Args:
+            key (str): The cache key.
+            value (InferenceResult | ModelOutput): The value to store.
+
+        Returns:
+            bool: Whether the value was stored.
+        """
+        try:
+            kind, meta, payload = _encode(value)
+            meta_text = json.dumps(meta)
+        except (TypeError, ValueError):
+            return False
+        nbytes = len(payload) + len(meta_text)
+        if nbytes > self.max_bytes:
+            return False
+
+        now = time.time()
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(key, kind, stored_at, accessed_at, nbytes, meta, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, now, now, nbytes, meta_text, payload),
+                )
+                self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self._failed(e)
+            return False
+        return True
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(nbytes), 0) FROM results"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, nbytes in connection.execute(
+            "SELECT key, nbytes FROM results ORDER BY accessed_at"
+        ):
+            evicted.append((key,))
+            total -= nbytes
+            if total <= self.max_bytes:
+                break
+        connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def delete(self, key: str) -> None:
+        """Drop one stored value."""
+        try:
+            self._connection().execute("DELETE FROM results WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            self._failed(e)
+
+    def clear(self) -> None:
+        """Drop all stored values."""
+        try:
+            self._connection().execute("DELETE FROM results")
+        except sqlite3.Error as e:
+            self._failed(e)
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,174 @@
+"""Background prefetching of model input data."""
+
+import asyncio
+import inspect
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from langchain_core.runnables.config import run_in_executor
+
+
+def _is_async_callable(func: Callable) -> bool:
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+class InputPrefetcher:
+    """Keeps a fresh snapshot of a ``model_input_provider``'s output.
+
+    A background thread calls the provider every ``interval`` seconds, and
+    ``refresh()`` triggers an extra refresh at any time. Tool calls use the latest
+    snapshot as long as it is at most ``max_staleness`` seconds old; otherwise
+    (or before the first refresh finished) they call the provider inline and
+    store the result as the new snapshot. A failed background refresh keeps the
+    previous snapshot.
+
+    Only providers without arguments can be prefetched, i.e. tools without a
+    ``tool_input_schema``. Coroutine function providers are run on a private
+    event loop of the background thread.
+
+    Pass an instance to ``OpenGradientToolkit.create_run_model_tool`` through
+    ``input_prefetcher``; each prefetcher serves a single tool.
+
+    Args:
+        interval (float, optional): Seconds between background refreshes.
+            Defaults to None (refresh only when triggered).
+        max_staleness (float, optional): Maximum age in seconds of a snapshot
+            used by a tool call. Defaults to None (any age).
+
+    Example usage:
+        from langchain_opengradient import InputPrefetcher
+
+        prefetcher = InputPrefetcher(interval=5, max_staleness=30)
+        tool = toolkit.create_run_model_tool(
+            ...,
+            model_input_provider=fetch_ohlc,
+            input_prefetcher=prefetcher,
+        )
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive")
+        if max_staleness is not None and max_staleness < 0:
+            raise ValueError("max_staleness must be non-negative")
+
+        self.interval = interval
+        self.max_staleness = max_staleness
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._provider: Optional[Callable[[], Any]] = None
+        self._lock = threading.Lock()
+        self._snapshot: Any = None
+        self._fetched_at: Optional[float] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def bind(self, provider: Callable[[], Any]) -> None:
+        """
+        Attach the provider to prefetch and start background refreshes.
+
+        Called by ``create_run_model_tool``.
+
+        Args:
+            provider (Callable[[], Any]): The model input provider.
+        """
+        with self._lock:
+            if self._provider is not None:
+                raise ValueError("InputPrefetcher is already bound to a provider")
+            self._provider = provider
+            if self.interval is not None:
+                self._start()
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the snapshot was taken, or None without a snapshot."""
+        fetched_at = self._fetched_at
+        return None if fetched_at is None else time.monotonic() - fetched_at
+
+    def refresh(self) -> None:
+        """Trigger a background refresh without waiting for it."""
+        with self._lock:
+            started = self._start()
+        if not started:
+            self._wake.set()
+
+    def stop(self) -> None:
+        """Stop background refreshes; tool calls then fetch inline when stale."""
+        self._stopped.set()
+        self._wake.set()
+
+    def get(self) -> Any:
+        """Return a fresh enough snapshot, fetching it inline if needed."""
+        found, snapshot = self._fresh_snapshot()
+        if found:
+            return snapshot
+        return self._store(self._get_provider()())
+
+    async def aget(self) -> Any:
+        """Async version of ``get``; sync providers run on the default executor."""
+        found, snapshot = self._fresh_snapshot()
+        if found:
+            return snapshot
+        provider = self._get_provider()
+        if _is_async_callable(provider):
+            return self._store(await provider())
+        return self._store(await run_in_executor(None, provider))
+
+    def _get_provider(self) -> Callable[[], Any]:
+        if self._provider is None:
+            raise ValueError("InputPrefetcher is not bound to a provider")
+        return self._provider
+
+    def _fresh_snapshot(self) -> Tuple[bool, Any]:
+        with self._lock:
+            if self._fetched_at is None:
+                return False, None
+            age = time.monotonic() - self._fetched_at
+            if self.max_staleness is not None and age > self.max_staleness:
+                return False, None
+            return True, self._snapshot
+
+    def _store(self, snapshot: Any) -> Any:
+        with self._lock:
+            self._snapshot = snapshot
+            self._fetched_at = time.monotonic()
+        return snapshot
+
+    def _start(self) -> bool:
+        """Start the background thread unless it runs. Call with the lock held."""
+        if self._thread is not None or self._provider is None:
+            return False
+        self._thread = threading.Thread(
+            target=self._run, name="opengradient-input-prefetch", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _run(self) -> None:
+        provider = self._get_provider()
+        while not self._stopped.is_set():
+            self._wake.clear()
+            try:
+                if _is_async_callable(provider):
+                    snapshot = asyncio.run(provider())
+                else:
+                    snapshot = provider()
+            except Exception as e:
+                with self._lock:
+                    self.refresh_errors += 1
+                    self.last_error = e
+            else:
+                self._store(snapshot)
+                with self._lock:
+                    self.refreshes += 1
+
+            self._wake.wait(self.interval)
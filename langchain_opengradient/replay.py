@@ -0,0 +1,328 @@
+"""Recording tool-call traces and replaying them as load."""
+
+import asyncio
+import gzip
+import json
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, List, Mapping, Optional, Sequence, Union, cast
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+
+def _open(path: Union[str, os.PathLike], mode: str) -> IO[str]:
+    """Open a trace file, gzip-compressed if its name ends with ``.gz``."""
+    if str(path).endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+@dataclass
+class TraceRecord:
+    """One recorded tool call.
+
+    Attributes:
+        offset (float): Seconds from the start of the recording to the call.
+        tool_name (str): Name of the called tool.
+        args (Dict[str, Any]): The tool input.
+        latency (float): Seconds the call took.
+        output (str, optional): The tool output as text, if recorded.
+        error (str, optional): The exception raised by the call, if any.
+    """
+
+    offset: float
+    tool_name: str
+    args: Dict[str, Any]
+    latency: float
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+class TraceRecorder:
+    """Records the calls agents make to toolkit tools into a trace file.
+
+    Wrapped tools behave like the originals and append one JSON line per call
+    with its start offset, tool name, input, latency and output or error. Files
+    ending with ``.gz`` are gzip-compressed. Replay traces with
+    ``replay_trace``.
+
+    Args:
+        path (str | os.PathLike): The trace file; overwritten if it exists.
+        record_outputs (bool): Store tool outputs. Defaults to True.
+        max_output_chars (int): Outputs are truncated to this many characters.
+            Defaults to 1000.
+
+    Example usage:
+        from langchain_opengradient import TraceRecorder
+
+        with TraceRecorder("trace.jsonl.gz") as recorder:
+            agent = create_react_agent(llm, recorder.wrap_tools(toolkit.get_tools()))
+            agent.invoke({"messages": [...]})
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        record_outputs: bool = True,
+        max_output_chars: int = 1000,
+    ):
+        self.path = Path(path)
+        self.record_outputs = record_outputs
+        self.max_output_chars = max_output_chars
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = _open(self.path, "w")
+        self._start = time.monotonic()
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def record(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        started: float,
+        latency: float,
+        output: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Append a call that started at monotonic time ``started``."""
+        entry: Dict[str, Any] = {
+            "t": round(started - self._start, 6),
+            "tool": tool_name,
+            "args": args,
+            "latency": round(latency, 6),
+        }
+        if error is not None:
+            entry["error"] = f"{type(error).__name__}: {error}"
+        elif self.record_outputs:
+            entry["output"] = str(output)[: self.max_output_chars]
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("TraceRecorder is closed")
+            self._file.write(line + "\n")
+            self.calls += 1
+
+    def wrap(self, tool: BaseTool) -> BaseTool:
+        """
+        Return a tool that records each call to ``tool``.
+
+        Args:
+            tool (BaseTool): A toolkit tool.
+
+        Returns:
+            BaseTool: A tool with the same name, description and input schema.
+        """
+
+        def run(**kwargs: Any) -> Any:
+            started = time.monotonic()
+            try:
+                output = tool.invoke(kwargs)
+            except Exception as e:
+                self.record(
+                    tool.name, kwargs, started, time.monotonic() - started, error=e
+                )
+                raise
+            self.record(tool.name, kwargs, started, time.monotonic() - started, output)
+            return output
+
+        async def arun(**kwargs: Any) -> Any:
+            started = time.monotonic()
+            try:
+                output = await tool.ainvoke(kwargs)
+            except Exception as e:
+                self.record(
+                    tool.name, kwargs, started, time.monotonic() - started, error=e
+                )
+                raise
+            self.record(tool.name, kwargs, started, time.monotonic() - started, output)
+            return output
+
+        sync_supported = not (isinstance(tool, StructuredTool) and tool.func is None)
+        return StructuredTool.from_function(
+            func=run if sync_supported else None,
+            coroutine=arun,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,  # type: ignore[arg-type]
+        )
+
+    def wrap_tools(self, tools: Sequence[BaseTool]) -> List[BaseTool]:
+        """Wrap several tools, e.g. ``toolkit.get_tools()``."""
+        return [self.wrap(tool) for tool in tools]
+
+    def close(self) -> None:
+        """Flush and close the trace file."""
+        with self._lock:
+            file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+
+def load_trace(path: Union[str, os.PathLike]) -> List[TraceRecord]:
+    """
+    Read a trace file written by ``TraceRecorder``.
+
+    Args:
+        path (str | os.PathLike): The trace file.
+
+    Returns:
+        List[TraceRecord]: The calls, in the order they started.
+    """
+    records = []
+    with _open(path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            records.append(
+                TraceRecord(
+                    offset=entry["t"],
+                    tool_name=entry["tool"],
+                    args=entry["args"],
+                    latency=entry["latency"],
+                    output=entry.get("output"),
+                    error=entry.get("error"),
+                )
+            )
+    records.sort(key=lambda record: record.offset)
+    return records
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of replaying a trace.
+
+    Attributes:
+        calls (int): Calls issued.
+        errors (int): Calls that raised.
+        seconds (float): Wall time of the replay.
+        latencies (List[float]): Latency of each call, in trace order.
+        lags (List[float]): How late each call started compared with its
+            scheduled time, e.g. while waiting for a concurrency slot.
+        errors_by_tool (Dict[str, int]): Failed calls per tool.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    lags: List[float] = field(default_factory=list)
+    errors_by_tool: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def calls_per_second(self) -> float:
+        """Throughput of the replay."""
+        return self.calls / self.seconds if self.seconds else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency quantile in seconds, e.g. ``percentile(0.99)``."""
+        if not self.latencies:
+            return 0.0
+        return _percentile(sorted(self.latencies), q)
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput and latency percentiles as a JSON-serializable dict."""
+        ordered = sorted(self.latencies)
+        summary: Dict[str, Any] = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "seconds": self.seconds,
+            "calls_per_second": self.calls_per_second,
+            "errors_by_tool": dict(self.errors_by_tool),
+        }
+        if ordered:
+            summary["mean_ms"] = statistics.fmean(ordered) * 1e3
+            for q in (0.5, 0.9, 0.99):
+                summary[f"p{round(q * 100)}_ms"] = _percentile(ordered, q) * 1e3
+            summary["max_lag_ms"] = max(self.lags) * 1e3
+        return summary
+
+
+async def areplay_trace(
+    records: Sequence[TraceRecord],
+    tools: Union[Mapping[str, BaseTool], Sequence[BaseTool]],
+    speed: Optional[float] = 1.0,
+    max_concurrency: int = 8,
+) -> ReplayReport:
+    """
+    Re-issue recorded calls on the running event loop.
+
+    Calls start at their recorded offsets divided by ``speed`` and run with
+    ``ainvoke``; a call waits while ``max_concurrency`` calls are running.
+
+    Args:
+        records (Sequence[TraceRecord]): The calls, e.g. from ``load_trace``.
+        tools (Mapping[str, BaseTool] | Sequence[BaseTool]): The tools to call,
+            e.g. ``toolkit.get_tools()`` of a toolkit using real or stand-in
+            clients.
+        speed (float, optional): Speed multiplier of the recorded timing; 2
+            replays twice as fast. None issues calls as fast as concurrency
+            allows. Defaults to 1.
+        max_concurrency (int): Maximum number of calls running at once.
+            Defaults to 8.
+
+    Returns:
+        ReplayReport: Throughput, latencies and errors.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if not isinstance(tools, Mapping):
+        tools = {tool.name: tool for tool in tools}
+    missing = sorted({r.tool_name for r in records} - set(tools))
+    if missing:
+        raise ValueError(f"Tools {missing} are not available for replay")
+
+    report = ReplayReport(
+        calls=len(records),
+        latencies=[0.0] * len(records),
+        lags=[0.0] * len(records),
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    start = time.monotonic()
+    first = records[0].offset if records else 0.0
+
+    async def run(index: int, record: TraceRecord) -> None:
+        scheduled = 0.0 if speed is None else (record.offset - first) / speed
+        await asyncio.sleep(max(0.0, scheduled - (time.monotonic() - start)))
+        async with semaphore:
+            started = time.monotonic()
+            report.lags[index] = max(0.0, started - start - scheduled)
+            try:
+                await tools[record.tool_name].ainvoke(record.args)
+            except Exception:
+                report.errors += 1
+                report.errors_by_tool[record.tool_name] = (
+                    report.errors_by_tool.get(record.tool_name, 0) + 1
+                )
+            report.latencies[index] = time.monotonic() - started
+
+    await asyncio.gather(*(run(index, record) for index, record in enumerate(records)))
+    report.seconds = time.monotonic() - start
+    return report
+
+
+def replay_trace(
+    records: Sequence[TraceRecord],
+    tools: Union[Mapping[str, BaseTool], Sequence[BaseTool]],
+    speed: Optional[float] = 1.0,
+    max_concurrency: int = 8,
+) -> ReplayReport:
+    """Sync version of ``areplay_trace``; runs its own event loop."""
+    return asyncio.run(
+        areplay_trace(records, tools, speed=speed, max_concurrency=max_concurrency)
+    )
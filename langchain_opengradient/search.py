@@ -0,0 +1,156 @@
+"""Offline lexical search over the tools of a toolkit."""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from langchain_core.tools import BaseTool
+
+# Splits snake_case, camelCase and acronyms: "getETH_Price" -> get, eth, price.
+_TOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+# Function words carry no signal about which tool is meant.
+STOP_WORDS = frozenset(
+    "a an and are as at be by can do for from get how i in is it me my of on or "
+    "the this to what when which will with you".split()
+)
+
+# Name terms are counted this many times, so a query term in a tool's name
+# outweighs the same term in a long description.
+NAME_WEIGHT = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into lowercase terms without stop words or plural "s"."""
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text):
+        term = token.lower()
+        if term in STOP_WORDS:
+            continue
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+def tool_text(tool: BaseTool) -> str:
+    """The text a tool is indexed by: its description and input fields."""
+    parts = [tool.description]
+    for field, schema in tool.args.items():
+        parts.append(field)
+        for key in ("title", "description"):
+            if isinstance(schema.get(key), str):
+                parts.append(schema[key])
+    return "\n".join(parts)
+
+
+class ToolIndex:
+    """BM25 index of tool names and descriptions.
+
+    Documents are added, replaced and removed one at a time; term statistics
+    are kept up to date incrementally, so changing one tool does not re-index
+    the others. Everything runs in process without an embedding service.
+
+    The index is not thread-safe; ``OpenGradientToolkit`` guards its index with
+    the toolkit's lock.
+
+    Args:
+        k1 (float): BM25 term frequency saturation. Defaults to 1.2.
+        b (float): BM25 document length normalization. Defaults to 0.75.
+
+    Example usage:
+        from langchain_opengradient import ToolIndex
+
+        index = ToolIndex()
+        index.add("ETH_Price_Forecast", "Reads latest forecast for ETH price")
+        index.search("what will the ETH price be tomorrow", k=3)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # Term -> document name -> term frequency.
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._terms: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._lengths
+
+    def add(self, name: str, text: str = "") -> None:
+        """
+        Index a document, replacing any document with the same name.
+
+        A replaced document keeps its position for breaking ties.
+
+        Args:
+            name (str): The tool name, which is indexed as well.
+            text (str, optional): Description and other text of the tool.
+        """
+        self._unindex(name)
+        terms = Counter(tokenize(text))
+        for term in tokenize(name):
+            terms[term] += NAME_WEIGHT
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[name] = frequency
+        length = sum(terms.values())
+        self._terms[name] = terms
+        self._lengths[name] = length
+        self._total_length += length
+
+    def remove(self, name: str) -> None:
+        """Drop a document; unknown names are ignored."""
+        self._unindex(name)
+        self._lengths.pop(name, None)
+
+    def _unindex(self, name: str) -> None:
+        terms = self._terms.pop(name, None)
+        if terms is None:
+            return
+        self._total_length -= self._lengths[name]
+        for term in terms:
+            postings = self._postings[term]
+            del postings[name]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank documents by relevance to ``query``.
+
+        Args:
+            query (str): Free text, e.g. the user's request.
+            k (int, optional): Maximum number of results. Defaults to 5.
+
+        Returns:
+            List[Tuple[str, float]]: Names and scores of the best matching
+                documents, best first. Documents matching no query term are
+                left out; equal scores keep insertion order.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        count = len(self._lengths)
+        if count == 0:
+            return []
+        average_length = max(self._total_length / count, 1.0)
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for name, frequency in postings.items():
+                norm = 1 - self.b + self.b * self._lengths[name] / average_length
+                scores[name] = scores.get(name, 0.0) + idf * frequency * (
+                    self.k1 + 1
+                ) / (frequency + self.k1 * norm)
+        order = {name: position for position, name in enumerate(self._lengths)}
+        return heapq.nsmallest(
+            k, scores.items(), key=lambda item: (-item[1], order[item[0]])
+        )
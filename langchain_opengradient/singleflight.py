@@ -0,0 +1,104 @@
+"""Single-flight deduplication of identical in-flight requests."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Collapses concurrent requests with an equal key into one request.
+
+    The first caller for a key runs the request. Callers that arrive with the
+    same key while it is in flight wait for it and receive the same result or
+    exception. Once the request finishes the key is released, so later calls run
+    a new request; combine with a cache to reuse results across time.
+
+    Sync and async callers are tracked separately. Cancelling one async caller
+    does not cancel the shared request for the others.
+
+    Pass an instance to ``OpenGradientToolkit(single_flight=...)`` to deduplicate
+    inferences (by model CID, inference mode and model input) and workflow reads
+    (by contract address) made by the toolkit's tools.
+
+    Example usage:
+        from langchain_opengradient import OpenGradientToolkit, SingleFlight
+
+        toolkit = OpenGradientToolkit(single_flight=SingleFlight())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._acalls: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self.requests = 0
+        self.shared = 0
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        with self._lock:
+            return len(self._calls) + len(self._acalls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a request with ``key`` is already in flight.
+
+        Args:
+            key (Hashable): Identifies equal requests.
+            fn (Callable[[], Any]): Sends the request.
+
+        Returns:
+            Any: The result of the shared request.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+                self.requests += 1
+            else:
+                self.shared += 1
+
+        if leader:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+
+        return future.result()
+
+    async def ado(self, key: Hashable, afn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async version of ``do``.
+
+        Args:
+            key (Hashable): Identifies equal requests.
+            afn (Callable[[], Awaitable[Any]]): Sends the request.
+
+        Returns:
+            Any: The result of the shared request.
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+
+        with self._lock:
+            task = self._acalls.get(loop_key)
+            if task is None:
+                task = self._acalls[loop_key] = asyncio.ensure_future(afn())
+                task.add_done_callback(lambda done: self._release(loop_key, done))
+                self.requests += 1
+            else:
+                self.shared += 1
+
+        return await asyncio.shield(task)
+
+    def _release(
+        self, loop_key: Tuple[int, Hashable], task: "asyncio.Future[Any]"
+    ) -> None:
+        with self._lock:
+            self._acalls.pop(loop_key, None)
+        # Mark the exception as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,197 @@
+"""Push-based views of the latest workflow results."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Sequence
+
+# Yields the address of a watched workflow contract each time it has a new result.
+# Called with the watched addresses, and ``from_block`` if the subscription has a
+# ``block_number`` function.
+WorkflowEventSource = Callable[..., AsyncIterator[str]]
+
+
+class WorkflowSubscription:
+    """Keeps the latest result of a set of workflow contracts in memory.
+
+    On start, every contract is read once. Afterwards the event source reports
+    which contracts emitted a new result, and only those are read again, so RPC
+    load follows how often workflows run rather than how often tools are called.
+    When the event stream fails or ends, the subscription waits with exponential
+    backoff and jitter, reads every contract again to pick up updates missed
+    while disconnected, and reconnects. Once it has been disconnected for longer
+    than ``max_staleness``, the view is ``stale`` and tools read the contracts
+    directly until it reconnects.
+
+    With ``block_number``, the latest block is taken before contracts are read
+    and the event source is asked for results from the next block on, so a
+    result emitted between the read and the start of the stream is not missed.
+
+    The subscription runs on its own daemon thread and event loop, so sync and
+    async tools can read the view without blocking on the network.
+
+    Usually created with ``OpenGradientToolkit.subscribe_workflows``.
+
+    Args:
+        contract_addresses (Sequence[str]): Workflow contracts to watch.
+        event_source (Callable[[Sequence[str]], AsyncIterator[str]]): Streams the
+            addresses of contracts with new results.
+        aread (Callable[[str], Awaitable[Any]]): Reads the latest result of a
+            contract.
+        initial_backoff (float, optional): Seconds to wait before the first
+            reconnect. Defaults to 0.5.
+        max_backoff (float, optional): Upper bound of the reconnect delay.
+            Defaults to 30.
+        max_staleness (float, optional): Seconds the subscription may be
+            disconnected before its view is no longer used. Defaults to 60;
+            None serves the last results however long it is disconnected.
+        block_number (Callable[[], Awaitable[int]], optional): Returns the
+            latest block; the event source is then called with
+            ``from_block``. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        contract_addresses: Sequence[str],
+        event_source: WorkflowEventSource,
+        aread: Callable[[str], Awaitable[Any]],
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_staleness: Optional[float] = 60.0,
+        block_number: Optional[Callable[[], Awaitable[int]]] = None,
+    ):
+        if initial_backoff <= 0 or max_backoff < initial_backoff:
+            raise ValueError("backoff must satisfy 0 < initial_backoff <= max_backoff")
+        if max_staleness is not None and max_staleness < 0:
+            raise ValueError("max_staleness must not be negative")
+
+        self.contract_addresses = list(dict.fromkeys(contract_addresses))
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.max_staleness = max_staleness
+        self.updates = 0
+        self.reconnects = 0
+        self.last_error: Optional[BaseException] = None
+        self._event_source = event_source
+        self._aread = aread
+        self._block_number = block_number
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        # Monotonic time the event stream went down, or None while it is up.
+        self._down_since: Optional[float] = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def __contains__(self, contract_address: object) -> bool:
+        with self._lock:
+            return contract_address in self._values
+
+    def get(self, contract_address: str) -> Any:
+        """
+        Return the latest known result of a contract.
+
+        Args:
+            contract_address (str): A watched workflow contract.
+
+        Returns:
+            Any: The latest result read for the contract.
+        """
+        with self._lock:
+            if contract_address not in self._values:
+                raise KeyError(contract_address)
+            return self._values[contract_address]
+
+    @property
+    def stale(self) -> bool:
+        """Whether the subscription has been disconnected for over max_staleness."""
+        down_since = self._down_since
+        return (
+            down_since is not None
+            and self.max_staleness is not None
+            and time.monotonic() - down_since > self.max_staleness
+        )
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every contract was read once; return whether it happened."""
+        return self._ready.wait(timeout)
+
+    def start(self) -> None:
+        """Start watching on a background thread."""
+        if self._thread is not None:
+            raise ValueError("WorkflowSubscription was already started")
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._main(),),
+            name="opengradient-workflow-subscription",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching; the last known results stay readable."""
+        self._stopped.set()
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # The loop already finished.
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        if self._stopped.is_set():
+            return
+        try:
+            await self._run()
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        backoff = self.initial_backoff
+        while not self._stopped.is_set():
+            try:
+                # Take the block before reading, so no result falls between
+                # the reads and the start of the stream.
+                block = None
+                if self._block_number is not None:
+                    block = await self._block_number()
+                await self._read_all()
+                if block is None:
+                    events = self._event_source(self.contract_addresses)
+                else:
+                    events = self._event_source(
+                        self.contract_addresses, from_block=block + 1
+                    )
+                self._down_since = None
+                self._ready.set()
+                async for contract_address in events:
+                    await self._read(contract_address)
+                    backoff = self.initial_backoff
+                raise ConnectionError("Workflow event stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._down_since is None:
+                    self._down_since = time.monotonic()
+                self.last_error = e
+                self.reconnects += 1
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+                backoff = min(backoff * 2, self.max_backoff)
+
+    async def _read_all(self) -> None:
+        await asyncio.gather(
+            *(self._read(address) for address in self.contract_addresses)
+        )
+
+    async def _read(self, contract_address: str) -> None:
+        value = await self._aread(contract_address)
+        with self._lock:
+            self._values[contract_address] = value
+            self.updates += 1
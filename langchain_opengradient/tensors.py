@@ -0,0 +1,189 @@
+"""Model input tensors: declared specs, zero-copy coercion and on-chain encoding."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from opengradient.utils import convert_to_fixed_point  # type: ignore
+from opengradient.utils import (
+    convert_to_model_input as sdk_convert_to_model_input,
+)
+
+
+@dataclass(frozen=True)
+class TensorSpec:
+    """Declared dtype, shape and layout of one model input tensor.
+
+    Attributes:
+        dtype (Any, optional): Required numpy dtype, e.g. ``np.float32`` or
+            ``"int64"``. None accepts any numeric dtype.
+        shape (Sequence[Optional[int]], optional): Required shape; None entries
+            match any size along that axis. None accepts any shape.
+        contiguous (bool): Whether the array must be C-contiguous. Defaults to
+            True.
+    """
+
+    dtype: Any = None
+    shape: Optional[Tuple[Optional[int], ...]] = None
+    contiguous: bool = True
+
+    def __post_init__(self) -> None:
+        if self.dtype is not None:
+            object.__setattr__(self, "dtype", np.dtype(self.dtype))
+        if self.shape is not None:
+            shape = tuple(self.shape)
+            if any(dim is not None and (int(dim) != dim or dim < 0) for dim in shape):
+                raise ValueError(f"Invalid tensor shape {shape}")
+            object.__setattr__(self, "shape", shape)
+
+    def check(self, name: str, tensor: np.ndarray) -> None:
+        """Raise ValueError if ``tensor`` does not match the spec."""
+        if self.dtype is not None and tensor.dtype != self.dtype:
+            raise ValueError(
+                f"Input {name!r} has dtype {tensor.dtype}, expected {self.dtype}"
+            )
+        if self.shape is not None and (
+            len(tensor.shape) != len(self.shape)
+            or any(
+                expected is not None and expected != actual
+                for expected, actual in zip(self.shape, tensor.shape)
+            )
+        ):
+            raise ValueError(
+                f"Input {name!r} has shape {tensor.shape}, expected {self.shape}"
+            )
+        if self.contiguous and not tensor.flags.c_contiguous:
+            raise ValueError(f"Input {name!r} is not C-contiguous")
+
+
+InputSpec = Mapping[str, TensorSpec]
+
+
+def as_tensor(value: Any, dtype: Any = None) -> Any:
+    """
+    Return ``value`` as a numpy array, without copying where possible.
+
+    Arrays are returned as they are, and objects supporting the buffer protocol
+    (``memoryview``, ``array.array``, ...) are wrapped without copying. Lists are
+    converted once, and scalars become one-element arrays of shape ``(1,)`` as in
+    the SDK; strings are left as they are.
+
+    Args:
+        value (Any): A tensor given by a model input provider.
+        dtype (Any, optional): Target dtype for lists and scalars.
+
+    Returns:
+        Any: A numpy array, or ``value`` if it is a string.
+    """
+    if isinstance(value, np.ndarray) or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, np.number, np.bool_)):
+        return np.asarray([value], dtype=dtype)
+    if not isinstance(value, (list, tuple, int, float, bool)):
+        try:
+            view = memoryview(value)
+        except TypeError:
+            pass
+        else:
+            return np.asarray(view)
+    return np.asarray(value, dtype=dtype)
+
+
+def prepare_model_input(
+    model_input: Dict[str, Any], input_spec: Optional[InputSpec] = None
+) -> Dict[str, Any]:
+    """
+    Coerce the tensors of a model input to numpy arrays and check them.
+
+    Args:
+        model_input (Dict[str, Any]): Tensors returned by a model input provider.
+        input_spec (Mapping[str, TensorSpec], optional): Declared tensors. When
+            given, the input must have exactly these tensors, each matching its
+            spec.
+
+    Returns:
+        Dict[str, Any]: The input with array tensors.
+    """
+    if input_spec is None:
+        return {name: as_tensor(value) for name, value in model_input.items()}
+
+    if set(model_input) != set(input_spec):
+        raise ValueError(
+            f"Model input has tensors {sorted(model_input)}, "
+            f"expected {sorted(input_spec)}"
+        )
+    prepared = {}
+    for name, spec in input_spec.items():
+        tensor = as_tensor(model_input[name], dtype=spec.dtype)
+        spec.check(name, tensor)
+        prepared[name] = tensor
+    return prepared
+
+
+def _fixed_point(text: str) -> Tuple[int, int]:
+    """Parse a decimal literal into ``(value, decimals)`` like the SDK does."""
+    negative = text.startswith("-")
+    mantissa, _, exponent_text = text.lstrip("+-").partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    digits = (whole + fraction).lstrip("0")
+    if not digits.isdigit():
+        # nan, inf and anything unusual take the SDK's path.
+        return convert_to_fixed_point(text)
+
+    exponent = int(exponent_text or 0) - len(fraction)
+    stripped = digits.rstrip("0")
+    exponent += len(digits) - len(stripped)
+    value = int(stripped) if stripped else 0
+    if negative:
+        value = -value
+    if exponent >= 0:
+        return value * 10**exponent, 0
+    return value, -exponent
+
+
+def convert_to_model_input(
+    inputs: Dict[str, Any],
+) -> Tuple[List[Any], List[Any]]:
+    """
+    Encode model input for the inference contract.
+
+    Produces the same ``(number tensors, string tensors)`` as
+    ``opengradient.utils.convert_to_model_input`` without going through a
+    ``Decimal`` per element: integer tensors are encoded in one pass and float
+    tensors from the shortest repr of each element.
+
+    Args:
+        inputs (Dict[str, Any]): Tensor name to array, list or scalar.
+
+    Returns:
+        Tuple[List, List]: Number and string tensors.
+    """
+    number_tensors: List[Any] = []
+    string_tensors: List[Any] = []
+    for name, value in inputs.items():
+        tensor = value
+        if isinstance(value, list):
+            tensor = np.array(value)
+        elif isinstance(value, (str, int, float)):
+            tensor = np.array([value])
+        if not isinstance(tensor, np.ndarray):
+            # Let the SDK raise its usual error for unsupported types.
+            return sdk_convert_to_model_input(inputs)
+
+        flat = tensor.ravel()
+        if issubclass(tensor.dtype.type, np.integer):
+            encoded = [(int(item), 0) for item in flat.tolist()]
+        elif issubclass(tensor.dtype.type, np.floating):
+            if tensor.dtype == np.float64:
+                texts: Sequence[str] = [repr(item) for item in flat.tolist()]
+            else:
+                # The SDK formats numpy scalars, i.e. at their own precision.
+                texts = [str(item) for item in flat]
+            encoded = [_fixed_point(text) for text in texts]
+        elif issubclass(tensor.dtype.type, np.str_):
+            string_tensors.append((name, [item for item in flat]))
+            continue
+        else:
+            raise TypeError(f"Data type {tensor.dtype.type} not recognized")
+        number_tensors.append((name, encoded, tensor.shape))
+    return number_tensors, string_tensors
@@ -1,17 +1,87 @@
 """OpenGradient toolkits."""
 
+from __future__ import annotations
+
+import functools
+import inspect
 import os
-from typing import Callable, List, Optional, Type
-
-import opengradient as og  # type: ignore
-from langchain_core.tools import BaseTool, BaseToolkit
-from opengradient import InferenceResult  # type: ignore
-from opengradient.alphasense import (  # type: ignore
-    ToolType,
-    create_read_workflow_tool,
-    create_run_model_tool,
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from langchain_core.runnables.config import run_in_executor
+from langchain_core.tools import BaseTool, BaseToolkit, StructuredTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+from langchain_opengradient import fanout
+from langchain_opengradient.caching import InferenceCache, WorkflowResultCache
+from langchain_opengradient.deadlines import DeadlinePolicy, is_hedge_attempt
+from langchain_opengradient.metrics import (
+    FORMAT_PHASE,
+    INFERENCE_PHASE,
+    INPUT_PHASE,
+    READ_PHASE,
+    TOTAL_PHASE,
+    VERIFICATION_PHASE,
+    ToolMetrics,
 )
-from pydantic import BaseModel, Field
+from langchain_opengradient.modes import InferenceModePolicy, RollingLatencies
+from langchain_opengradient.search import ToolIndex, tokenize, tool_text
+from langchain_opengradient.singleflight import SingleFlight
+from langchain_opengradient.subscriptions import (
+    WorkflowEventSource,
+    WorkflowSubscription,
+)
+from langchain_opengradient.wallets import WalletPool
+
+if TYPE_CHECKING:
+    # The OpenGradient SDK pulls in web3 and numpy, so it is only imported once a
+    # toolkit is created.
+    import opengradient as og  # type: ignore
+    from opengradient import InferenceResult  # type: ignore
+
+    from langchain_opengradient.batching import InferenceBatcher
+    from langchain_opengradient.clients import AsyncClient
+    from langchain_opengradient.local import LocalInferenceBackend
+    from langchain_opengradient.manifest import ToolManifest
+    from langchain_opengradient.offload import ProcessOffload
+    from langchain_opengradient.prefetch import InputPrefetcher
+    from langchain_opengradient.tensors import TensorSpec
+    from langchain_opengradient.verification import VerificationTracker
+
+
+def _is_async_callable(func: Callable) -> bool:
+    """Check whether calling ``func`` returns an awaitable."""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+async def _acall(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Await ``func`` if it is a coroutine function, otherwise call it directly."""
+    if _is_async_callable(func):
+        return await func(*args, **kwargs)
+    return func(*args, **kwargs)
+
+
+class _LazyTool:
+    """Placeholder for a tool that is built on first access."""
+
+    def __init__(self, build: Callable[[], BaseTool]):
+        self.build = build
 
 
 class OpenGradientToolkit(BaseToolkit):
@@ -26,15 +96,58 @@ class OpenGradientToolkit(BaseToolkit):
         export OPENGRADIENT_PRIVATE_KEY="your-api-key"
 
     Key init args:
-        private_key: str
+        private_key: str | Sequence[str]
             Your OpenGradient API private key for authentication. If not provided,
-            the OPENGRADIENT_PRIVATE_KEY environment variable will be used.
+            the OPENGRADIENT_PRIVATE_KEY environment variable will be used. A list
+            of keys spreads inferences across the wallets in turn.
 
             You can get your own OpenGradient API key by running
             .. code-block:: bash
 
                 opengradient config init
 
+        workflow_cache: Optional[WorkflowResultCache]
+            Opt-in cache for workflow results read by tools created with
+            ``create_read_workflow_tool``. Results are keyed by contract address,
+            expire after a TTL and are refreshed in the background while the stale
+            value is served.
+
+        client / async_client: optional
+            OpenGradient clients to use instead of the shared ones. By default the
+            clients are created on first tool invocation and shared by every
+            toolkit in the process that uses the same private key.
+
+        single_flight: Optional[SingleFlight]
+            Opt-in deduplication of identical in-flight requests. Concurrent
+            inferences with the same model CID, inference mode and model input, or
+            concurrent reads of the same workflow contract, share one request.
+
+        metrics: Optional[ToolMetrics]
+            Opt-in latency histograms and error counts for each phase of every
+            tool call (input provider, inference or workflow read, output
+            formatter). Tool calls are not timed without it.
+
+        local_backend: Optional[LocalInferenceBackend]
+            Opt-in on-host execution of VANILLA inferences for models kept in a
+            ``LocalModelStore``. Results have the same ``InferenceResult`` shape,
+            so output formatters work unchanged. Other inferences use the network.
+
+        wallet_pool: Optional[WalletPool]
+            Opt-in sharding of inferences across several wallets, with
+            round-robin, least-outstanding or model-affinity selection and
+            backoff of failing wallets. Workflow reads use the first key.
+
+        inference_latencies: Optional[RollingLatencies]
+            Latencies of the most recent inferences per model CID and inference
+            mode, recorded for every inference the toolkit sends. Tools with a
+            ``mode_policy`` choose their inference mode from them. Pass one
+            instance to several toolkits to share the statistics.
+
+        workflow_subscription: Optional[WorkflowSubscription]
+            Set by ``subscribe_workflows``. Watched workflow contracts are read
+            when they emit a new result, and read-workflow tools return the latest
+            result from memory.
+
     Instantiate:
         .. code-block:: python
 
@@ -56,6 +169,14 @@ class OpenGradientToolkit(BaseToolkit):
                 ETH_Price_Forecast({}): Reads latest forecast for ETH price
             ]
 
+        Tools are indexed by name, so names must be unique within a toolkit:
+
+        .. code-block:: python
+
+            toolkit.get_tool("ETH_Price_Forecast")
+            toolkit.replace_tool(new_forecast_tool)  # same name, same position
+            toolkit.remove_tool("one_hour_eth_usdt_volatility")
+
     Use within an agent:
         .. code-block:: python
 
@@ -120,48 +241,723 @@ class OpenGradientToolkit(BaseToolkit):
     """  # noqa: E501
 
     model_config = {"arbitrary_types_allowed": True}
-    client: Optional[og.client.Client] = Field(
-        default=None, description="OpenGradient client"
+    client: Any = Field(default=None, description="OpenGradient client")
+    async_client: Any = Field(
+        default=None, description="OpenGradient client used by async tool calls"
     )
     tools: List[BaseTool] = Field(
         default_factory=list,
-        description="List of OpenGradient tools currently in the toolkit",
+        description="List of OpenGradient tools currently in the toolkit; "
+        "use get_tools, which refreshes it after tools are added or removed",
+    )
+    workflow_cache: Optional[WorkflowResultCache] = Field(
+        default=None, description="Cache for workflow results keyed by address"
+    )
+    single_flight: Optional[SingleFlight] = Field(
+        default=None, description="Deduplicates identical in-flight requests"
+    )
+    metrics: Optional[ToolMetrics] = Field(
+        default=None, description="Records per-phase latency of tool calls"
+    )
+    # Typed as Any so that the onnxruntime backend module stays unimported.
+    local_backend: Any = Field(
+        default=None, description="Runs VANILLA inferences of stored models locally"
     )
+    workflow_subscription: Optional[WorkflowSubscription] = Field(
+        default=None, description="Pushed latest results of watched workflows"
+    )
+    wallet_pool: Optional[WalletPool] = Field(
+        default=None, description="Wallets that inferences are spread across"
+    )
+    inference_latencies: RollingLatencies = Field(
+        default_factory=RollingLatencies,
+        description="Recent inference latencies per model CID and inference mode",
+    )
+    _private_key: str = PrivateAttr(default="")
+    _tools_by_name: Dict[str, Union[BaseTool, _LazyTool]] = PrivateAttr(
+        default_factory=dict
+    )
+    _tools_lock: Any = PrivateAttr(default_factory=threading.RLock)
+    _tools_stale: bool = PrivateAttr(default=False)
+    _tool_index: ToolIndex = PrivateAttr(default_factory=ToolIndex)
 
-    def __init__(self, private_key: str | None = None):
+    def __init__(
+        self,
+        private_key: str | Sequence[str] | None = None,
+        workflow_cache: Optional[WorkflowResultCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        client: Any = None,
+        async_client: Any = None,
+        metrics: Optional[ToolMetrics] = None,
+        local_backend: Optional[LocalInferenceBackend] = None,
+        wallet_pool: Optional[WalletPool] = None,
+        inference_latencies: Optional[RollingLatencies] = None,
+    ):
         super().__init__()
 
-        # Initialize OpenGradient client
-        private_key = private_key or os.getenv("OPENGRADIENT_PRIVATE_KEY")
-        if not private_key:
+        if private_key is not None and not isinstance(private_key, str):
+            if wallet_pool is not None:
+                raise ValueError("Pass either a list of private keys or wallet_pool")
+            wallet_pool = WalletPool(private_key)
+        key = private_key if isinstance(private_key, str) else None
+        if wallet_pool is not None and key is None:
+            # Workflow reads send no transactions and use the first wallet.
+            key = wallet_pool.private_keys[0]
+        key = key or os.getenv("OPENGRADIENT_PRIVATE_KEY")
+        if not key:
             raise ValueError("OPENGRADIENT_PRIVATE_KEY environment variable is not set")
 
-        self.client = og.init(private_key=private_key, email=None, password=None)
+        # OpenGradient clients are created on first tool invocation.
+        self._private_key = key
+        self.client = client
+        self.async_client = async_client
         self.tools = []
+        self.workflow_cache = workflow_cache
+        self.single_flight = single_flight
+        self.metrics = metrics
+        self.local_backend = local_backend
+        self.wallet_pool = wallet_pool
+        if inference_latencies is not None:
+            self.inference_latencies = inference_latencies
+
+    def _get_client(self) -> og.client.Client:
+        if self.client is None:
+            from langchain_opengradient.clients import get_shared_client
+
+            self.client = get_shared_client(self._private_key)
+        return self.client
+
+    def _get_async_client(self) -> AsyncClient:
+        if self.async_client is None:
+            from langchain_opengradient.clients import get_shared_async_client
+
+            self.async_client = get_shared_async_client(self._private_key)
+        return self.async_client
+
+    def _timed(self, tool_name: str, phase: str, fn: Callable[[], Any]) -> Any:
+        if self.metrics is None:
+            return fn()
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            self.metrics.record(tool_name, phase, time.perf_counter() - start, e)
+            raise
+        self.metrics.record(tool_name, phase, time.perf_counter() - start)
+        return result
+
+    async def _atimed(
+        self, tool_name: str, phase: str, afn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.metrics is None:
+            return await afn()
+        start = time.perf_counter()
+        try:
+            result = await afn()
+        except Exception as e:
+            self.metrics.record(tool_name, phase, time.perf_counter() - start, e)
+            raise
+        self.metrics.record(tool_name, phase, time.perf_counter() - start)
+        return result
+
+    def _client_infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        start = time.perf_counter()
+        result = self._send_inference(model_cid, inference_mode, model_input)
+        self.inference_latencies.observe(
+            model_cid, inference_mode, time.perf_counter() - start
+        )
+        return result
+
+    async def _aclient_infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        start = time.perf_counter()
+        result = await self._asend_inference(model_cid, inference_mode, model_input)
+        self.inference_latencies.observe(
+            model_cid, inference_mode, time.perf_counter() - start
+        )
+        return result
+
+    def _send_inference(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        local_backend = self.local_backend
+        if local_backend is not None and local_backend.can_run(
+            model_cid, inference_mode
+        ):
+            return local_backend.infer(model_cid, inference_mode, model_input)
+        if self.wallet_pool is not None:
+            with self.wallet_pool.use(model_cid) as wallet:
+                return wallet.client.infer(
+                    model_cid=model_cid,
+                    inference_mode=inference_mode,
+                    model_input=model_input,
+                )
+        return self._get_client().infer(
+            model_cid=model_cid,
+            inference_mode=inference_mode,
+            model_input=model_input,
+        )
+
+    async def _asend_inference(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        local_backend = self.local_backend
+        if local_backend is not None and local_backend.can_run(
+            model_cid, inference_mode
+        ):
+            return await local_backend.ainfer(model_cid, inference_mode, model_input)
+        if self.wallet_pool is not None:
+            async with self.wallet_pool.ause(model_cid) as wallet:
+                return await wallet.async_client.infer(
+                    model_cid=model_cid,
+                    inference_mode=inference_mode,
+                    model_input=model_input,
+                )
+        return await self._get_async_client().infer(
+            model_cid=model_cid,
+            inference_mode=inference_mode,
+            model_input=model_input,
+        )
+
+    def _infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        inference_cache: Optional[InferenceCache] = None,
+        inference_batcher: Optional[InferenceBatcher] = None,
+    ) -> InferenceResult:
+        key = None
+        if inference_cache is not None or self.single_flight is not None:
+            key = InferenceCache.make_key(model_cid, inference_mode, model_input)
+        if inference_cache is not None and key is not None:
+            cached = inference_cache.get(key)
+            if cached is not None:
+                return cached
+
+        def send() -> InferenceResult:
+            if inference_batcher is not None:
+                return inference_batcher.infer(
+                    self._client_infer, model_cid, inference_mode, model_input
+                )
+            return self._client_infer(model_cid, inference_mode, model_input)
+
+        if (
+            self.single_flight is not None
+            and key is not None
+            and not is_hedge_attempt()
+        ):
+            inference_result = self.single_flight.do(("infer", key), send)
+        else:
+            inference_result = send()
+
+        if inference_cache is not None and key is not None:
+            inference_cache.put(key, inference_result)
+        return inference_result
+
+    async def _ainfer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        inference_cache: Optional[InferenceCache] = None,
+        inference_batcher: Optional[InferenceBatcher] = None,
+    ) -> InferenceResult:
+        key = None
+        if inference_cache is not None or self.single_flight is not None:
+            key = InferenceCache.make_key(model_cid, inference_mode, model_input)
+        if inference_cache is not None and key is not None:
+            cached = inference_cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def send() -> InferenceResult:
+            if inference_batcher is not None:
+                return await inference_batcher.ainfer(
+                    self._aclient_infer, model_cid, inference_mode, model_input
+                )
+            return await self._aclient_infer(model_cid, inference_mode, model_input)
+
+        if (
+            self.single_flight is not None
+            and key is not None
+            and not is_hedge_attempt()
+        ):
+            inference_result = await self.single_flight.ado(("infer", key), send)
+        else:
+            inference_result = await send()
+
+        if inference_cache is not None and key is not None:
+            inference_cache.put(key, inference_result)
+        return inference_result
+
+    def subscribe_workflows(
+        self,
+        contract_addresses: Sequence[str],
+        event_source: Optional[WorkflowEventSource] = None,
+        async_client: Any = None,
+        poll_interval: float = 2.0,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_staleness: Optional[float] = 60.0,
+    ) -> WorkflowSubscription:
+        """
+        Keep the latest results of workflow contracts in memory.
+
+        Read-workflow tools for a watched contract return the in-memory result
+        instead of reading the contract, once the subscription has read it,
+        unless the subscription has been disconnected for over
+        ``max_staleness``. A previous subscription of the toolkit is stopped.
+
+        Args:
+            contract_addresses (Sequence[str]): Workflow contracts to watch.
+            event_source (Callable[[Sequence[str]], AsyncIterator[str]], optional):
+                Streams addresses of contracts with new results. Defaults to
+                polling the logs of new blocks for result events.
+            async_client (optional): Client used by the subscription for reads and
+                the default event source. Defaults to a new ``AsyncClient``, as
+                the subscription runs on its own event loop.
+            poll_interval (float, optional): Seconds between log polls of the
+                default event source. Defaults to 2.
+            initial_backoff (float, optional): Seconds before the first reconnect
+                after the event stream drops. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound of the reconnect delay.
+                Defaults to 30.
+            max_staleness (float, optional): Seconds the subscription may be
+                disconnected before tools read contracts directly again.
+                Defaults to 60; None keeps serving the last results.
+
+        Returns:
+            WorkflowSubscription: The started subscription.
+
+        Example usage:
+            subscription = toolkit.subscribe_workflows(
+                ["0x6e0641925b845A1ca8aA9a890C4DEF388E9197e0"]
+            )
+            subscription.wait_ready(timeout=30)
+        """
+        if async_client is None:
+            from langchain_opengradient.clients import AsyncClient
+
+            async_client = AsyncClient(private_key=self._private_key)
+        block_number = None
+        if event_source is None:
+            event_source = functools.partial(
+                async_client.watch_workflow_updates, poll_interval=poll_interval
+            )
+            block_number = async_client.block_number
+
+        subscription = WorkflowSubscription(
+            contract_addresses,
+            event_source=event_source,
+            aread=async_client.read_workflow_result,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+            max_staleness=max_staleness,
+            block_number=block_number,
+        )
+        self.unsubscribe_workflows()
+        subscription.start()
+        self.workflow_subscription = subscription
+        return subscription
+
+    def unsubscribe_workflows(self) -> None:
+        """Stop the workflow subscription; tools read contracts directly again."""
+        subscription = self.workflow_subscription
+        self.workflow_subscription = None
+        if subscription is not None:
+            subscription.stop()
+
+    def _subscribed_result(self, contract_address: str) -> Tuple[bool, Any]:
+        subscription = self.workflow_subscription
+        if subscription is None or subscription.stale:
+            return False, None
+        try:
+            return True, subscription.get(contract_address)
+        except KeyError:
+            return False, None
+
+    def _read_workflow_result(self, contract_address: str) -> Any:
+        found, value = self._subscribed_result(contract_address)
+        if found:
+            return value
+
+        def read() -> Any:
+            return self._get_client().read_workflow_result(
+                contract_address=contract_address
+            )
+
+        def fetch() -> Any:
+            if self.single_flight is None or is_hedge_attempt():
+                return read()
+            return self.single_flight.do(("workflow", contract_address), read)
+
+        if self.workflow_cache is None:
+            return fetch()
+        return self.workflow_cache.get(contract_address, fetch)
+
+    async def _aread_workflow_result(self, contract_address: str) -> Any:
+        found, value = self._subscribed_result(contract_address)
+        if found:
+            return value
+
+        async def aread() -> Any:
+            return await self._get_async_client().read_workflow_result(
+                contract_address=contract_address
+            )
+
+        async def afetch() -> Any:
+            if self.single_flight is None or is_hedge_attempt():
+                return await aread()
+            return await self.single_flight.ado(("workflow", contract_address), aread)
+
+        if self.workflow_cache is None:
+            return await afetch()
+        return await self.workflow_cache.aget(contract_address, afetch)
+
+    def get_tools(self, query: Optional[str] = None, k: int = 5) -> List[BaseTool]:
+        """
+        Get list of tools available in OpenGradient toolkit.
+
+        With a ``query``, only the ``k`` tools most relevant to it are returned,
+        best first, so an agent's prompt carries a few tool schemas instead of
+        the whole catalog. Tools are ranked with BM25 over their names,
+        descriptions and input fields, fully offline; tools matching no query
+        term are left out. A query without searchable terms, e.g. empty or
+        only stop words, returns the first ``k`` tools in registration order.
+        Lazy tools are ranked by name and description and only built when
+        selected.
+
+        Args:
+            query (str, optional): Free text, e.g. the user's request.
+            k (int, optional): Maximum number of tools returned for a query.
+                Defaults to 5.
+
+        Returns:
+            List[BaseTool]: The tools.
+        """
+        with self._tools_lock:
+            if query is not None:
+                if tokenize(query):
+                    names = [name for name, _ in self._tool_index.search(query, k)]
+                elif k < 1:
+                    raise ValueError("k must be at least 1")
+                else:
+                    names = list(self._tools_by_name)[:k]
+                return [self.get_tool(name) for name in names]
+            for name, tool in list(self._tools_by_name.items()):
+                if isinstance(tool, _LazyTool):
+                    self._materialize(name, tool)
+            if self._tools_stale:
+                # Rebuilt once per batch of changes; callers holding the previous
+                # list are not affected by later changes.
+                self.tools = [
+                    tool
+                    for tool in self._tools_by_name.values()
+                    if isinstance(tool, BaseTool)
+                ]
+                self._tools_stale = False
+            return self.tools
+
+    def get_tool(self, name: str) -> BaseTool:
+        """
+        Get a tool in the toolkit by name.
+
+        Args:
+            name (str): The name of the tool.
+
+        Returns:
+            BaseTool: The tool registered under ``name``.
+        """
+        with self._tools_lock:
+            if name not in self._tools_by_name:
+                raise ValueError(f"Tool {name!r} is not in the toolkit")
+            tool = self._tools_by_name[name]
+            if isinstance(tool, _LazyTool):
+                return self._materialize(name, tool)
+            return tool
+
+    def tool_names(self) -> List[str]:
+        """Names of the tools in the toolkit, without building lazy tools."""
+        with self._tools_lock:
+            return list(self._tools_by_name)
+
+    def _materialize(self, name: str, lazy_tool: _LazyTool) -> BaseTool:
+        """Build a lazy tool in place. Must be called with the tools lock held."""
+        tool = lazy_tool.build()
+        if tool.name != name:
+            raise ValueError(f"Lazy tool {name!r} built a tool named {tool.name!r}")
+        self._tools_by_name[name] = tool
+        self._tool_index.add(name, tool_text(tool))
+        self._tools_stale = True
+        return tool
+
+    def add_lazy_tools(
+        self,
+        builders: Mapping[str, Callable[[], BaseTool]],
+        descriptions: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Register tools that are built on first access.
+
+        A tool is built the first time it is looked up with ``get_tool`` (which
+        also happens when ``invoke_tools`` is given its name) or when
+        ``get_tools`` is called, so tools an agent never uses cost nothing.
+        Either all tools are registered or, if a name is already taken, none are.
+
+        Args:
+            builders (Mapping[str, Callable[[], BaseTool]]): Tool name to a
+                function creating the tool with that name, in order.
+            descriptions (Mapping[str, str], optional): Tool name to the tool
+                description, used by ``get_tools(query=...)`` until the tool is
+                built.
+        """
+        with self._tools_lock:
+            for name in builders:
+                if name in self._tools_by_name:
+                    raise ValueError(f"Tool {name!r} is already in the toolkit")
+            for name, build in builders.items():
+                self._tools_by_name[name] = _LazyTool(build)
+                self._tool_index.add(name, (descriptions or {}).get(name, ""))
+            self._tools_stale = True
 
-    def get_tools(self) -> List[BaseTool]:
-        """Get list of tools available in OpenGradient toolkit."""
-        return self.tools
+    def add_manifest(self, manifest: Union[str, os.PathLike, ToolManifest]) -> None:
+        """
+        Register the tools of a manifest as lazy tools.
+
+        Args:
+            manifest (str | os.PathLike | ToolManifest): A JSON or YAML manifest
+                file, or a parsed manifest. See ``ToolManifest`` for the format.
+        """
+        from langchain_opengradient.manifest import ToolManifest, load_manifest
+
+        if not isinstance(manifest, ToolManifest):
+            manifest = load_manifest(manifest)
+        self.add_lazy_tools(
+            {spec.name: functools.partial(spec.build, self) for spec in manifest.tools},
+            descriptions={spec.name: spec.description for spec in manifest.tools},
+        )
+
+    @classmethod
+    def from_manifest(
+        cls, manifest: Union[str, os.PathLike, ToolManifest], **kwargs: Any
+    ) -> OpenGradientToolkit:
+        """
+        Create a toolkit with the tools of a manifest.
+
+        The manifest is validated when the toolkit is created; tools are built
+        on first use. Parsed manifest files are cached, so creating many
+        toolkits from one file parses it once.
+
+        Args:
+            manifest (str | os.PathLike | ToolManifest): A JSON or YAML manifest
+                file, or a parsed manifest. See ``ToolManifest`` for the format.
+            **kwargs (Any): Arguments of ``OpenGradientToolkit``.
+
+        Returns:
+            OpenGradientToolkit: The toolkit.
+
+        Example usage:
+            toolkit = OpenGradientToolkit.from_manifest("tools.yaml")
+            tools = toolkit.get_tools()
+        """
+        toolkit = cls(**kwargs)
+        toolkit.add_manifest(manifest)
+        return toolkit
 
     def add_tool(self, tool: BaseTool) -> None:
         """Add tool to the list of tools for the OpenGradient Agentkit."""
-        self.tools.append(tool)
+        self.add_tools([tool])
+
+    def add_tools(self, tools: Sequence[BaseTool]) -> None:
+        """
+        Add several tools to the toolkit at once.
+
+        Either all tools are added or, if a name is already taken or repeated in
+        ``tools``, none are.
+
+        Args:
+            tools (Sequence[BaseTool]): The tools to add, in order.
+        """
+        with self._tools_lock:
+            names = set()
+            for tool in tools:
+                if tool.name in self._tools_by_name or tool.name in names:
+                    raise ValueError(f"Tool {tool.name!r} is already in the toolkit")
+                names.add(tool.name)
+            for tool in tools:
+                self._tools_by_name[tool.name] = tool
+                self._tool_index.add(tool.name, tool_text(tool))
+            self._tools_stale = True
+
+    def replace_tool(self, tool: BaseTool) -> Optional[BaseTool]:
+        """
+        Replace the tool with the same name, keeping its position in ``get_tools``.
+
+        A lazy tool that was not built yet is replaced without building it.
+
+        Args:
+            tool (BaseTool): The new tool.
+
+        Returns:
+            BaseTool, optional: The tool that was replaced, or None if it was a
+                lazy tool that was never built.
+        """
+        with self._tools_lock:
+            previous = self._registered(tool.name)
+            self._tools_by_name[tool.name] = tool
+            self._tool_index.add(tool.name, tool_text(tool))
+            self._tools_stale = True
+            return previous
+
+    def remove_tool(self, name: str) -> Optional[BaseTool]:
+        """
+        Remove a tool from the toolkit by name.
+
+        A lazy tool that was not built yet is removed without building it.
+
+        Args:
+            name (str): The name of the tool.
+
+        Returns:
+            BaseTool, optional: The removed tool, or None if it was a lazy tool
+                that was never built.
+        """
+        with self._tools_lock:
+            tool = self._registered(name)
+            del self._tools_by_name[name]
+            self._tool_index.remove(name)
+            self._tools_stale = True
+            return tool
+
+    def _registered(self, name: str) -> Optional[BaseTool]:
+        """The tool registered under ``name``, or None if it is lazy and unbuilt."""
+        if name not in self._tools_by_name:
+            raise ValueError(f"Tool {name!r} is not in the toolkit")
+        tool = self._tools_by_name[name]
+        return None if isinstance(tool, _LazyTool) else tool
+
+    def _resolve_calls(
+        self, calls: Sequence[Tuple[Union[BaseTool, str], Dict[str, Any]]]
+    ) -> List[fanout.ToolCall]:
+        resolved = []
+        for tool, tool_input in calls:
+            if isinstance(tool, str):
+                tool = self.get_tool(tool)
+            resolved.append((tool, tool_input))
+        return resolved
+
+    def invoke_tools(
+        self,
+        calls: Sequence[Tuple[Union[BaseTool, str], Dict[str, Any]]],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[fanout.ToolCallResult]:
+        """
+        Invoke many tools concurrently and collect their results in order.
+
+        A failing or timed out call is reported in its own ``ToolCallResult``
+        instead of failing the whole batch.
+
+        Args:
+            calls (Sequence[Tuple[Union[BaseTool, str], Dict[str, Any]]]): Pairs of
+                tool (or name of a tool in the toolkit) and tool input.
+            max_concurrency (int, optional): Maximum number of calls running at
+                once. Defaults to 8.
+            timeout (float, optional): Seconds each call may run after it starts.
+                Timed out calls keep running on their thread in the background,
+                including any inference transaction they sent, but give their
+                slot to the next call. Defaults to None (no timeout).
+
+        Returns:
+            List[ToolCallResult]: One result per call, in the order of ``calls``.
+
+        Example usage:
+            results = toolkit.invoke_tools(
+                [
+                    ("eth_usdt_volatility", {}),
+                    ("token_volatility", {"token": "bitcoin"}),
+                    ("ETH_Price_Forecast", {}),
+                ],
+                max_concurrency=4,
+                timeout=30,
+            )
+            for result in results:
+                print(result.tool_name, result.output if result.ok else result.error)
+        """
+        return fanout.invoke_tools(
+            self._resolve_calls(calls), max_concurrency=max_concurrency, timeout=timeout
+        )
+
+    async def ainvoke_tools(
+        self,
+        calls: Sequence[Tuple[Union[BaseTool, str], Dict[str, Any]]],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[fanout.ToolCallResult]:
+        """
+        Async version of ``invoke_tools``.
+
+        Calls run on the current event loop; timed out calls are cancelled.
+
+        Args:
+            calls (Sequence[Tuple[Union[BaseTool, str], Dict[str, Any]]]): Pairs of
+                tool (or name of a tool in the toolkit) and tool input.
+            max_concurrency (int, optional): Maximum number of calls running at
+                once. Defaults to 8.
+            timeout (float, optional): Seconds each call may run after it starts.
+                Defaults to None (no timeout).
+
+        Returns:
+            List[ToolCallResult]: One result per call, in the order of ``calls``.
+        """
+        return await fanout.ainvoke_tools(
+            self._resolve_calls(calls), max_concurrency=max_concurrency, timeout=timeout
+        )
 
     def create_run_model_tool(
         self,
         model_cid: str,
         tool_name: str,
         model_input_provider: Callable[..., InferenceResult],
-        model_output_formatter: Callable[..., str],
+        model_output_formatter: Callable[..., Union[str, Awaitable[str]]],
         tool_input_schema: Optional[Type[BaseModel]] = None,
         tool_description: str = "Executes the given ML model",
-        inference_mode: og.InferenceMode = og.InferenceMode.VANILLA,
+        inference_mode: Optional[og.InferenceMode] = None,
+        inference_cache: Optional[InferenceCache] = None,
+        inference_batcher: Optional[InferenceBatcher] = None,
+        input_prefetcher: Optional[InputPrefetcher] = None,
+        input_spec: Optional[Mapping[str, TensorSpec]] = None,
+        deadline: Optional[DeadlinePolicy] = None,
+        offload: Optional[ProcessOffload] = None,
+        verification: Optional[VerificationTracker] = None,
+        mode_policy: Optional[InferenceModePolicy] = None,
     ) -> BaseTool:
         """
-        Wrapper for create_run_model_tool from OpenGradient AlphaSense library.
+        Create a langchain compatible tool to run inferences on the OpenGradient
+        network.
 
-        This function creates a langchain compatible tool to run inferences on the
-        OpenGradient network.
+        The tool supports both ``invoke`` and ``ainvoke``. Async invocations go
+        through the toolkit's ``AsyncClient`` so many tool calls can share one event
+        loop. ``model_input_provider`` and ``model_output_formatter`` may be
+        coroutine functions, in which case the tool can only be invoked
+        asynchronously. Synchronous providers are run in an executor thread during
+        async invocations.
 
         Args:
             model_cid (str): The CID of the OpenGradient model to be executed.
@@ -195,7 +991,70 @@ class OpenGradientToolkit(BaseToolkit):
             tool_description (str, optional): A description of what the tool does.
                 Defaults to "Executes the given ML model".
             inference_mode (og.InferenceMode, optional): The inference mode to use 
-                when running the model. Defaults to VANILLA.
+                when running the model. Defaults to None, which runs VANILLA
+                inference.
+            inference_cache (InferenceCache, optional): Memo cache for inference
+                results. Calls with the same model CID, inference mode and model
+                input are answered from the cache instead of sending a new
+                inference. The cache may be shared between tools.
+
+                Default is None -- every call runs a new inference.
+            inference_batcher (InferenceBatcher, optional): Coalesces concurrent
+                calls to the same model into one inference by stacking their inputs
+                along a new leading batch axis. Only use it with models that accept
+                and return a leading batch dimension.
+
+                Default is None -- every call is sent as its own inference.
+            input_prefetcher (InputPrefetcher, optional): Refreshes the output of
+                ``model_input_provider`` in the background so tool calls use the
+                latest snapshot instead of waiting for the provider. Requires a
+                provider without arguments, i.e. no ``tool_input_schema``.
+
+                Default is None -- the provider is called on every tool call.
+            input_spec (Mapping[str, TensorSpec], optional): Declares the tensors
+                ``model_input_provider`` returns, with their dtype, shape and
+                whether they must be C-contiguous. Every model input is checked
+                against it, and lists are converted once to arrays of the
+                declared dtype.
+
+                Providers may return numpy arrays or any object supporting the
+                buffer protocol (``memoryview``, ``array.array``, ...) with or
+                without a spec; they are passed on without being copied into
+                lists.
+
+                Default is None -- model input is not checked.
+            deadline (DeadlinePolicy, optional): Bounds the latency of each call
+                with a timeout, optionally hedging slow calls with a second
+                attempt (with the policy's ``hedge_inferences``, since a hedge
+                sends a second inference) and falling back to the last good
+                result, marked as stale, when the timeout passes.
+
+                Default is None -- calls run once without a timeout.
+            offload (ProcessOffload, optional): Runs ``model_input_provider`` and
+                ``model_output_formatter`` in a process pool, for providers and
+                formatters whose CPU work would otherwise hold the GIL. Large
+                arrays are passed through shared memory. Both callables must be
+                picklable (defined at module level) and not coroutine functions.
+
+                Default is None -- they run on the calling thread.
+            verification (VerificationTracker, optional): Answers calls with a
+                TEE or ZKML ``inference_mode`` in two phases: the verified
+                inference runs in the background while a VANILLA inference of the
+                same input is formatted and returned right away, marked with the
+                id of the pending verification. The VANILLA inference runs on
+                ``local_backend``, or on chain as a second transaction if the
+                tracker has ``on_chain_provisional`` set; otherwise the call waits
+                for the verified result. The tracker reports finished
+                verifications to its ``on_complete`` callback.
+
+                Default is None -- calls wait for the verified inference.
+            mode_policy (InferenceModePolicy, optional): Chooses the inference
+                mode of each call instead of ``inference_mode``: the most trusted
+                mode at or above the policy's ``min_trust`` whose recent latency
+                for this model fits the policy's latency budget, falling back to
+                a faster mode otherwise. Every decision is recorded by the policy.
+
+                Default is None -- every call uses ``inference_mode``.
                 
         Example usage:
             from og_langchain.toolkits import OpenGradientToolkit
@@ -232,31 +1091,299 @@ class OpenGradientToolkit(BaseToolkit):
             for tool in toolkit.get_tools():
                 print(tool)
         """
-        tool = create_run_model_tool(
-            tool_type=ToolType.LANGCHAIN,
-            model_cid=model_cid,
-            tool_name=tool_name,
-            model_input_provider=model_input_provider,
-            model_output_formatter=model_output_formatter,
-            tool_input_schema=tool_input_schema,
-            tool_description=tool_description,
-            inference_mode=inference_mode,
+        import opengradient as og  # type: ignore
+
+        from langchain_opengradient.tensors import TensorSpec, prepare_model_input
+
+        if mode_policy is not None and inference_mode is not None:
+            raise ValueError("Pass either inference_mode or mode_policy")
+        if mode_policy is not None and verification is not None:
+            raise ValueError("verification requires a fixed inference_mode")
+        if inference_mode is None:
+            inference_mode = og.InferenceMode.VANILLA
+        if input_spec is not None:
+            for name, spec in input_spec.items():
+                if not isinstance(spec, TensorSpec):
+                    raise TypeError(
+                        f"input_spec[{name!r}] must be a TensorSpec, got {spec!r}"
+                    )
+        # The provider and formatter called by sync and async tool calls.
+        input_provider: Callable[..., Any] = model_input_provider
+        ainput_provider: Callable[..., Any] = model_input_provider
+        output_formatter: Callable[..., Any] = model_output_formatter
+        aoutput_formatter: Callable[..., Any] = model_output_formatter
+        if offload is not None:
+            if _is_async_callable(model_input_provider) or _is_async_callable(
+                model_output_formatter
+            ):
+                raise ValueError(
+                    "offload requires a synchronous model_input_provider and "
+                    "model_output_formatter"
+                )
+            input_provider = functools.partial(offload.run, model_input_provider)
+            ainput_provider = functools.partial(offload.arun, model_input_provider)
+            output_formatter = functools.partial(offload.run, model_output_formatter)
+            aoutput_formatter = functools.partial(offload.arun, model_output_formatter)
+        if verification is not None and inference_mode not in (
+            og.InferenceMode.TEE,
+            og.InferenceMode.ZKML,
+        ):
+            raise ValueError("verification requires a TEE or ZKML inference_mode")
+        if input_prefetcher is not None:
+            if tool_input_schema:
+                raise ValueError(
+                    "input_prefetcher requires a model_input_provider without "
+                    "arguments, but tool_input_schema is set"
+                )
+            input_prefetcher.bind(input_provider)
+        if not tool_input_schema:
+            tool_input_schema = type("EmptyInputSchema", (BaseModel,), {})
+
+        def choose_mode(started: float) -> og.InferenceMode:
+            if mode_policy is None:
+                return inference_mode
+            return mode_policy.choose(
+                tool_name,
+                model_cid,
+                self.inference_latencies,
+                elapsed=time.perf_counter() - started,
+            ).mode
+
+        def run_model(**llm_input: Any) -> Any:
+            started = time.perf_counter()
+            # Pass LLM input arguments (formatted based on tool_input_schema) as
+            # parameters into model_input_provider
+            if input_prefetcher is not None:
+                model_input = self._timed(tool_name, INPUT_PHASE, input_prefetcher.get)
+            else:
+                model_input = self._timed(
+                    tool_name, INPUT_PHASE, lambda: input_provider(**llm_input)
+                )
+            model_input = prepare_model_input(model_input, input_spec)
+            if verification is not None:
+                return run_two_phase(model_input)
+            mode = choose_mode(started)
+
+            inference_result = self._timed(
+                tool_name,
+                INFERENCE_PHASE,
+                lambda: self._infer(
+                    model_cid,
+                    mode,
+                    model_input,
+                    inference_cache=inference_cache,
+                    inference_batcher=inference_batcher,
+                ),
+            )
+
+            return self._timed(
+                tool_name,
+                FORMAT_PHASE,
+                lambda: output_formatter(inference_result),
+            )
+
+        async def arun_model(**llm_input: Any) -> str:
+            started = time.perf_counter()
+            # Blocking providers are moved off the event loop, async providers are
+            # awaited in place.
+            if input_prefetcher is not None:
+                model_input = await self._atimed(
+                    tool_name, INPUT_PHASE, input_prefetcher.aget
+                )
+            elif _is_async_callable(ainput_provider):
+                model_input = await self._atimed(
+                    tool_name, INPUT_PHASE, lambda: ainput_provider(**llm_input)
+                )
+            else:
+                model_input = await self._atimed(
+                    tool_name,
+                    INPUT_PHASE,
+                    lambda: run_in_executor(None, ainput_provider, **llm_input),
+                )
+            model_input = prepare_model_input(model_input, input_spec)
+            if verification is not None:
+                return await arun_two_phase(model_input)
+            mode = choose_mode(started)
+
+            inference_result = await self._atimed(
+                tool_name,
+                INFERENCE_PHASE,
+                lambda: self._ainfer(
+                    model_cid,
+                    mode,
+                    model_input,
+                    inference_cache=inference_cache,
+                    inference_batcher=inference_batcher,
+                ),
+            )
+
+            return await self._atimed(
+                tool_name,
+                FORMAT_PHASE,
+                lambda: _acall(aoutput_formatter, inference_result),
+            )
+
+        def infer(mode: og.InferenceMode, model_input: Dict[str, Any]) -> Any:
+            return self._infer(
+                model_cid,
+                mode,
+                model_input,
+                inference_cache=inference_cache,
+                inference_batcher=inference_batcher,
+            )
+
+        async def ainfer(mode: og.InferenceMode, model_input: Dict[str, Any]) -> Any:
+            return await self._ainfer(
+                model_cid,
+                mode,
+                model_input,
+                inference_cache=inference_cache,
+                inference_batcher=inference_batcher,
+            )
+
+        def can_answer_provisionally() -> bool:
+            assert verification is not None
+            if verification.on_chain_provisional:
+                return True
+            local_backend = self.local_backend
+            return local_backend is not None and local_backend.can_run(
+                model_cid, og.InferenceMode.VANILLA
+            )
+
+        def run_two_phase(model_input: Dict[str, Any]) -> Any:
+            assert verification is not None
+            handle = verification.start(
+                tool_name,
+                model_cid,
+                inference_mode,
+                lambda: self._timed(
+                    tool_name,
+                    VERIFICATION_PHASE,
+                    lambda: infer(inference_mode, model_input),
+                ),
+            )
+            provisional = None
+            try:
+                if can_answer_provisionally():
+                    try:
+                        provisional = self._timed(
+                            tool_name,
+                            INFERENCE_PHASE,
+                            lambda: infer(og.InferenceMode.VANILLA, model_input),
+                        )
+                    except Exception:
+                        pass
+            finally:
+                verification.set_provisional(handle, provisional)
+            if provisional is None:
+                verified = handle.result()
+                return self._timed(
+                    tool_name, FORMAT_PHASE, lambda: output_formatter(verified)
+                )
+            output = self._timed(
+                tool_name, FORMAT_PHASE, lambda: output_formatter(provisional)
+            )
+            return verification.provisional_marker(output, handle)
+
+        async def arun_two_phase(model_input: Dict[str, Any]) -> Any:
+            assert verification is not None
+            handle = verification.astart(
+                tool_name,
+                model_cid,
+                inference_mode,
+                lambda: self._atimed(
+                    tool_name,
+                    VERIFICATION_PHASE,
+                    lambda: ainfer(inference_mode, model_input),
+                ),
+            )
+            provisional = None
+            try:
+                if can_answer_provisionally():
+                    try:
+                        provisional = await self._atimed(
+                            tool_name,
+                            INFERENCE_PHASE,
+                            lambda: ainfer(og.InferenceMode.VANILLA, model_input),
+                        )
+                    except Exception:
+                        pass
+            finally:
+                # Settle even when cancelled, so on_complete still fires.
+                verification.set_provisional(handle, provisional)
+            if provisional is None:
+                verified = await handle
+                return await self._atimed(
+                    tool_name,
+                    FORMAT_PHASE,
+                    lambda: _acall(aoutput_formatter, verified),
+                )
+            output = await self._atimed(
+                tool_name,
+                FORMAT_PHASE,
+                lambda: _acall(aoutput_formatter, provisional),
+            )
+            return verification.provisional_marker(output, handle)
+
+        def run_model_with_deadline(**llm_input: Any) -> Any:
+            if deadline is None:
+                return run_model(**llm_input)
+            return deadline.run(
+                DeadlinePolicy.make_key(tool_name, llm_input),
+                lambda: run_model(**llm_input),
+                group=tool_name,
+                hedge=deadline.hedge_inferences,
+            )
+
+        async def arun_model_with_deadline(**llm_input: Any) -> str:
+            if deadline is None:
+                return await arun_model(**llm_input)
+            return await deadline.arun(
+                DeadlinePolicy.make_key(tool_name, llm_input),
+                lambda: arun_model(**llm_input),
+                group=tool_name,
+                hedge=deadline.hedge_inferences,
+            )
+
+        def model_executor(**llm_input: Any) -> Any:
+            return self._timed(
+                tool_name, TOTAL_PHASE, lambda: run_model_with_deadline(**llm_input)
+            )
+
+        async def amodel_executor(**llm_input: Any) -> str:
+            return await self._atimed(
+                tool_name, TOTAL_PHASE, lambda: arun_model_with_deadline(**llm_input)
+            )
+
+        # Tools built from async callables can only be invoked asynchronously.
+        sync_supported = not (
+            _is_async_callable(model_input_provider)
+            or _is_async_callable(model_output_formatter)
         )
 
-        return tool
+        return StructuredTool.from_function(
+            func=model_executor if sync_supported else None,
+            coroutine=amodel_executor,
+            name=tool_name,
+            description=tool_description,
+            args_schema=tool_input_schema,
+        )
 
     def create_read_workflow_tool(
         self,
         workflow_contract_address: str,
         tool_name: str,
         tool_description: str,
-        output_formatter: Callable[..., str] = lambda x: x,
+        output_formatter: Callable[..., Union[str, Awaitable[str]]] = lambda x: x,
+        deadline: Optional[DeadlinePolicy] = None,
     ) -> BaseTool:
         """
-        Wrapper for create_read_workflow_tool from OpenGradient AlphaSense library.
+        Create a langchain compatible tool to read workflows on the OpenGradient
+        network.
 
-        This function creates a langchain compatible tool to read workflows on the
-        OpenGradient network.
+        The tool supports both ``invoke`` and ``ainvoke``. If ``output_formatter``
+        is a coroutine function the tool can only be invoked asynchronously. Reads
+        go through the toolkit's ``workflow_cache`` when one is configured.
 
         Args:
             workflow_contract_address (str): The address of the workflow contract
@@ -270,6 +1397,10 @@ class OpenGradientToolkit(BaseToolkit):
                 output is compatible with the tool framework.
 
                 Default returns string as is.
+            deadline (DeadlinePolicy, optional): Bounds the latency of each call,
+                see ``create_run_model_tool``.
+
+                Default is None -- calls run once without a timeout.
 
         Example usage:
             from og_langchain.toolkits import OpenGradientToolkit
@@ -288,12 +1419,57 @@ class OpenGradientToolkit(BaseToolkit):
             for tool in toolkit.get_tools():
                 print(tool)
         """
-        tool = create_read_workflow_tool(
-            tool_type=ToolType.LANGCHAIN,
-            workflow_contract_address=workflow_contract_address,
-            tool_name=tool_name,
-            tool_description=tool_description,
-            output_formatter=output_formatter,
-        )
 
-        return tool
+        def run_read_workflow() -> Any:
+            output = self._timed(
+                tool_name,
+                READ_PHASE,
+                lambda: self._read_workflow_result(workflow_contract_address),
+            )
+            return self._timed(
+                tool_name, FORMAT_PHASE, lambda: output_formatter(output)
+            )
+
+        async def arun_read_workflow() -> str:
+            output = await self._atimed(
+                tool_name,
+                READ_PHASE,
+                lambda: self._aread_workflow_result(workflow_contract_address),
+            )
+            return await self._atimed(
+                tool_name, FORMAT_PHASE, lambda: _acall(output_formatter, output)
+            )
+
+        def run_read_workflow_with_deadline() -> Any:
+            if deadline is None:
+                return run_read_workflow()
+            return deadline.run(
+                DeadlinePolicy.make_key(tool_name, {}),
+                run_read_workflow,
+                group=tool_name,
+            )
+
+        async def arun_read_workflow_with_deadline() -> str:
+            if deadline is None:
+                return await arun_read_workflow()
+            return await deadline.arun(
+                DeadlinePolicy.make_key(tool_name, {}),
+                arun_read_workflow,
+                group=tool_name,
+            )
+
+        def read_workflow() -> Any:
+            return self._timed(tool_name, TOTAL_PHASE, run_read_workflow_with_deadline)
+
+        async def aread_workflow() -> str:
+            return await self._atimed(
+                tool_name, TOTAL_PHASE, arun_read_workflow_with_deadline
+            )
+
+        return StructuredTool.from_function(
+            func=None if _is_async_callable(output_formatter) else read_workflow,
+            coroutine=aread_workflow,
+            name=tool_name,
+            description=tool_description,
+            args_schema=None,
+        )
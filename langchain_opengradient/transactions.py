@@ -0,0 +1,334 @@
+"""Pipelined transaction submission from one wallet with local nonces."""
+
+import asyncio
+import heapq
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, overload
+
+# Errors returned by nodes when a transaction's nonce is already used.
+USED_NONCE_ERRORS = (
+    "nonce too low",
+    "already known",
+    "replacement transaction underpriced",
+)
+# Errors returned by nodes when a transaction's nonce does not fit the account.
+NONCE_ERRORS = USED_NONCE_ERRORS + ("invalid nonce", "nonce too high")
+
+
+def is_nonce_error(error: BaseException) -> bool:
+    """Whether ``error`` means the transaction's nonce was rejected."""
+    message = str(error).lower()
+    return any(nonce_error in message for nonce_error in NONCE_ERRORS)
+
+
+def _is_used_nonce_error(error: BaseException) -> bool:
+    message = str(error).lower()
+    return any(used in message for used in USED_NONCE_ERRORS)
+
+
+class NonceAllocator:
+    """Hands out the nonces of one wallet to transactions from any thread.
+
+    The allocator is shared by every pipeline sending from the wallet, sync or
+    async and on any event loop, so no two transactions get the same nonce.
+    Nonces of transactions the node rejected are released and handed out
+    again before new ones.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next: Optional[int] = None
+        self._released: List[int] = []
+
+    @property
+    def synced(self) -> bool:
+        """Whether the next nonce is known without asking the chain."""
+        return self._next is not None
+
+    @overload
+    def allocate(self) -> Optional[int]: ...
+
+    @overload
+    def allocate(self, chain_nonce: int) -> int: ...
+
+    def allocate(self, chain_nonce: Optional[int] = None) -> Optional[int]:
+        """
+        Take the next nonce.
+
+        Args:
+            chain_nonce (int, optional): The wallet's pending transaction count,
+                used if the allocator is not synced.
+
+        Returns:
+            int, optional: The nonce, or None if the allocator is not synced and
+                no ``chain_nonce`` was given.
+        """
+        with self._lock:
+            if self._next is None:
+                if chain_nonce is None:
+                    return None
+                self._next = chain_nonce
+            if self._released:
+                return heapq.heappop(self._released)
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def release(self, nonce: int) -> None:
+        """Return the nonce of a transaction that was not accepted."""
+        with self._lock:
+            if self._next is not None and nonce < self._next:
+                heapq.heappush(self._released, nonce)
+
+    def reset(self, chain_nonce: Optional[int] = None) -> None:
+        """Continue from ``chain_nonce``, or from the chain's count if None."""
+        with self._lock:
+            self._next = chain_nonce
+            self._released.clear()
+
+
+class _Pipeline:
+    def __init__(
+        self,
+        eth: Any,
+        account: Any,
+        receipt_timeout: float,
+        max_retries: int,
+        nonces: Optional[NonceAllocator] = None,
+    ):
+        self.eth = eth
+        self.account = account
+        self.receipt_timeout = receipt_timeout
+        self.max_retries = max_retries
+        self.nonces = nonces or NonceAllocator()
+        self.submitted = 0
+        self.resyncs = 0
+        self.in_flight = 0
+        self._stats_lock = threading.Lock()
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _sign(self, transaction: Dict[str, Any], nonce: int) -> Any:
+        return self.account.sign_transaction({**transaction, "nonce": nonce})
+
+    def _retry(
+        self, nonce: int, error: BaseException, attempt: int, max_retries: int
+    ) -> bool:
+        """Whether to resend after a rejection; releases nonces that stay free."""
+        if not is_nonce_error(error):
+            self.nonces.release(nonce)
+            return False
+        if attempt == max_retries - 1:
+            self.nonces.reset()
+            return False
+        return True
+
+    def _resynced(
+        self, chain_nonce: int, rejected_nonce: int, error: BaseException
+    ) -> None:
+        if _is_used_nonce_error(error):
+            # The node may not count queued transactions; skip past the used one.
+            chain_nonce = max(chain_nonce, rejected_nonce + 1)
+        self.nonces.reset(chain_nonce)
+        self._count(resyncs=1)
+
+
+class TransactionPipeline(_Pipeline):
+    """Sends transactions from one wallet with locally allocated nonces.
+
+    Nonces are fetched from the chain once and then allocated locally by a
+    ``NonceAllocator``. Signing and sending hold a lock per event loop, so a
+    loop's transactions reach the node in nonce order, and a transaction the
+    node rejects does not leave a gap: its nonce goes to the next transaction.
+    Receipts are awaited outside the lock, so many transactions can be in
+    flight at once.
+
+    Nonces are fetched from the chain again when the node rejects a nonce (for
+    example after transactions were sent from the same wallet elsewhere) and
+    when a receipt times out, since a dropped transaction leaves a gap that
+    blocks later ones until its nonce is reused. A send that is cancelled, for
+    example by a deadline or a losing hedge, also recounts from the chain, and
+    the nonce of a transaction that fails to sign is released.
+
+    A pipeline may be used from several event loops and threads. Pipelines
+    sharing ``nonces``, such as a ``SyncTransactionPipeline`` of the same
+    wallet, never send two transactions with the same nonce.
+
+    Args:
+        eth (Any): ``AsyncWeb3.eth`` of the connection.
+        account (Any): The wallet account signing transactions.
+        receipt_timeout (float): Seconds to wait for each receipt.
+        max_retries (int): Attempts per transaction when its nonce is rejected.
+        nonces (NonceAllocator, optional): Allocator of the wallet's nonces.
+            Defaults to a new one.
+    """
+
+    def __init__(
+        self,
+        eth: Any,
+        account: Any,
+        receipt_timeout: float,
+        max_retries: int,
+        nonces: Optional[NonceAllocator] = None,
+    ):
+        super().__init__(eth, account, receipt_timeout, max_retries, nonces)
+        self._send_locks: "weakref.WeakKeyDictionary[Any, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def submit(
+        self, transaction: Dict[str, Any], max_retries: Optional[int] = None
+    ) -> Tuple[Any, Any]:
+        """
+        Sign and send a transaction, then wait for its receipt.
+
+        Args:
+            transaction (Dict[str, Any]): The transaction without a nonce.
+            max_retries (int, optional): Overrides the pipeline's ``max_retries``.
+
+        Returns:
+            Tuple[Any, Any]: The transaction hash and receipt.
+        """
+        tx_hash = await self._send(transaction, max_retries or self.max_retries)
+
+        self._count(in_flight=1)
+        try:
+            receipt = await self.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=self.receipt_timeout
+            )
+        except Exception:
+            # The transaction may have been dropped; recount from the chain.
+            self.nonces.reset()
+            raise
+        finally:
+            self._count(in_flight=-1)
+        return tx_hash, receipt
+
+    def _send_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._stats_lock:
+            lock = self._send_locks.get(loop)
+            if lock is None:
+                lock = self._send_locks[loop] = asyncio.Lock()
+            return lock
+
+    async def _send(self, transaction: Dict[str, Any], max_retries: int) -> Any:
+        async with self._send_lock():
+            try:
+                for attempt in range(max_retries):
+                    nonce = self.nonces.allocate()
+                    if nonce is None:
+                        nonce = self.nonces.allocate(
+                            await self.eth.get_transaction_count(
+                                self.account.address, "pending"
+                            )
+                        )
+                    try:
+                        signed = self._sign(transaction, nonce)
+                        tx_hash = await self.eth.send_raw_transaction(
+                            signed.raw_transaction
+                        )
+                    except Exception as e:
+                        if not self._retry(nonce, e, attempt, max_retries):
+                            raise
+                        chain_nonce = await self.eth.get_transaction_count(
+                            self.account.address, "pending"
+                        )
+                        self._resynced(chain_nonce, nonce, e)
+                        continue
+
+                    self._count(submitted=1)
+                    return tx_hash
+            except Exception:
+                raise
+            except BaseException:
+                # Cancelled mid-send: the transaction may or may not have gone
+                # out, so recount from the chain instead of leaving a gap.
+                self.nonces.reset()
+                raise
+
+        raise ValueError("max_retries must be at least 1")
+
+
+class SyncTransactionPipeline(_Pipeline):
+    """Blocking counterpart of ``TransactionPipeline`` for ``Web3.eth``.
+
+    Signing and sending hold a thread lock, so transactions from the threads
+    using the pipeline reach the node in nonce order. Share ``nonces`` with the
+    wallet's ``TransactionPipeline`` so sync and async calls do not collide.
+
+    Args:
+        eth (Any): ``Web3.eth`` of the connection.
+        account (Any): The wallet account signing transactions.
+        receipt_timeout (float): Seconds to wait for each receipt.
+        max_retries (int): Attempts per transaction when its nonce is rejected.
+        nonces (NonceAllocator, optional): Allocator of the wallet's nonces.
+            Defaults to a new one.
+    """
+
+    def __init__(
+        self,
+        eth: Any,
+        account: Any,
+        receipt_timeout: float,
+        max_retries: int,
+        nonces: Optional[NonceAllocator] = None,
+    ):
+        super().__init__(eth, account, receipt_timeout, max_retries, nonces)
+        self._send_lock = threading.Lock()
+
+    def submit(
+        self, transaction: Dict[str, Any], max_retries: Optional[int] = None
+    ) -> Tuple[Any, Any]:
+        """Sign and send a transaction, then wait for its receipt."""
+        tx_hash = self._send(transaction, max_retries or self.max_retries)
+
+        self._count(in_flight=1)
+        try:
+            receipt = self.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=self.receipt_timeout
+            )
+        except Exception:
+            self.nonces.reset()
+            raise
+        finally:
+            self._count(in_flight=-1)
+        return tx_hash, receipt
+
+    def _send(self, transaction: Dict[str, Any], max_retries: int) -> Any:
+        with self._send_lock:
+            try:
+                for attempt in range(max_retries):
+                    nonce = self.nonces.allocate()
+                    if nonce is None:
+                        nonce = self.nonces.allocate(
+                            self.eth.get_transaction_count(
+                                self.account.address, "pending"
+                            )
+                        )
+                    try:
+                        signed = self._sign(transaction, nonce)
+                        tx_hash = self.eth.send_raw_transaction(signed.raw_transaction)
+                    except Exception as e:
+                        if not self._retry(nonce, e, attempt, max_retries):
+                            raise
+                        chain_nonce = self.eth.get_transaction_count(
+                            self.account.address, "pending"
+                        )
+                        self._resynced(chain_nonce, nonce, e)
+                        continue
+
+                    self._count(submitted=1)
+                    return tx_hash
+            except Exception:
+                raise
+            except BaseException:
+                # Interrupted mid-send; see ``TransactionPipeline._send``.
+                self.nonces.reset()
+                raise
+
+        raise ValueError("max_retries must be at least 1")
@@ -0,0 +1,378 @@
+"""Two-phase results for verified (TEE and ZKML) inferences."""
+
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+PENDING = "pending"
+VERIFIED = "verified"
+FAILED = "failed"
+
+
+def mark_provisional(output: Any, verification: "Verification") -> str:
+    """Default marker for a provisional result of a two-phase tool call."""
+    return (
+        f"{output} (provisional: {verification.inference_mode.name} "
+        f"verification {verification.id} pending)"
+    )
+
+
+def outputs_match(provisional: Any, verified: Any) -> bool:
+    """Whether two inference results have the same outputs, up to float noise."""
+    first, second = provisional.model_output, verified.model_output
+    if first.keys() != second.keys():
+        return False
+    for name, value in first.items():
+        a, b = np.asarray(value), np.asarray(second[name])
+        if a.shape != b.shape:
+            return False
+        if np.issubdtype(a.dtype, np.number) and np.issubdtype(b.dtype, np.number):
+            if not np.allclose(a, b, equal_nan=True):
+                return False
+        elif not np.array_equal(a, b):
+            return False
+    return True
+
+
+class Verification:
+    """Handle to a verified inference finishing in the background.
+
+    The handle is returned by ``VerificationTracker`` and referenced by ``id`` in
+    provisional tool outputs. Once the verified inference is mined,
+    ``transaction_hash`` holds the hash of the inference transaction, which
+    references the TEE attestation or ZKML proof on chain.
+
+    Poll with ``done()`` and ``status``, block with ``result()``, or
+    ``await`` the handle from a coroutine.
+
+    Attributes:
+        id (str): Reference to the verification, unique per tracker.
+        tool_name (str): The tool that started it.
+        model_cid (str): The model that was run.
+        inference_mode (og.InferenceMode): ``TEE`` or ``ZKML``.
+        provisional (InferenceResult, optional): The VANILLA result returned to
+            the agent, if the call returned one.
+        mismatch (bool, optional): Whether the verified outputs differ from the
+            provisional ones. Set before ``on_complete`` is called; None if the
+            call returned no provisional result or the verification failed.
+    """
+
+    def __init__(self, id: str, tool_name: str, model_cid: str, inference_mode: Any):
+        self.id = id
+        self.tool_name = tool_name
+        self.model_cid = model_cid
+        self.inference_mode = inference_mode
+        self.provisional: Any = None
+        self.mismatch: Optional[bool] = None
+        # The verified inference and the provisional phase of the tool call.
+        self._unsettled = 2
+        self._future: "Future[Any]" = Future()
+
+    def __repr__(self) -> str:
+        return f"Verification(id={self.id!r}, status={self.status!r})"
+
+    def __await__(self) -> Any:
+        return asyncio.wrap_future(self._future).__await__()
+
+    @property
+    def status(self) -> str:
+        """``"pending"``, ``"verified"`` or ``"failed"``."""
+        if not self._future.done():
+            return PENDING
+        return FAILED if self._future.exception() is not None else VERIFIED
+
+    @property
+    def transaction_hash(self) -> Optional[str]:
+        """Hash of the verified inference transaction, once it is mined."""
+        if self.status != VERIFIED:
+            return None
+        return self._future.result().transaction_hash
+
+    def done(self) -> bool:
+        """Whether the verified inference finished, successfully or not."""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the verified inference.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None (no
+                limit).
+
+        Returns:
+            InferenceResult: The verified result. Errors of the verified
+                inference are raised.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for the verified inference and return its error, if any."""
+        return self._future.exception(timeout)
+
+
+class VerificationTracker:
+    """Runs verified inferences in the background of two-phase tool calls.
+
+    TEE and ZKML inferences take much longer than VANILLA ones. With a tracker,
+    a run-model tool with a verified ``inference_mode`` starts the verified
+    inference in the background, runs the same model on the same input as a
+    VANILLA inference and answers with that provisional result right away. The
+    output passes through ``provisional_marker``, which by default appends the
+    id of the pending verification, so the agent can keep reasoning while the
+    proof finishes.
+
+    The SDK returns nothing before the proof is done, so the provisional result
+    is a separate inference. It runs locally when the toolkit's
+    ``local_backend`` has the model. Running it on chain sends a second
+    inference transaction per call and pays gas for both, so it only happens
+    with ``on_chain_provisional=True``. Otherwise, and when the provisional
+    inference fails, the tool call waits for the verified result and returns
+    it unmarked.
+
+    Each started verification is kept as a ``Verification`` handle, looked up
+    by id with ``get``, and reported to ``on_complete`` once it finished and its
+    tool call returned. The verified outputs are compared with the provisional
+    ones first; differences are flagged in ``Verification.mismatch`` and
+    counted in ``mismatches``. Sync tool calls run verified inferences on the
+    tracker's thread pool, async tool calls as tasks on the calling event loop;
+    ``on_complete`` is called on that thread or loop, or on the calling one,
+    and should not block.
+
+    Pass an instance to ``create_run_model_tool(verification=...)``; a tracker
+    may be shared between tools.
+
+    Args:
+        on_complete (Callable[[Verification], Any], optional): Called with each
+            finished verification, verified or failed. Exceptions raised by it
+            are counted in ``callback_errors`` and otherwise ignored.
+        provisional_marker (Callable[[Any, Verification], Any], optional):
+            Builds the tool output from the formatted provisional result and
+            the verification. Defaults to appending a pending note.
+        max_workers (int, optional): Threads running verifications of sync
+            tool calls. Defaults to 8.
+        max_finished (int, optional): Finished verifications kept for ``get``.
+            Defaults to 1024.
+        on_chain_provisional (bool, optional): Send the provisional VANILLA
+            inference to the network when the model is not available locally,
+            at the cost of a second transaction per call. Defaults to False.
+
+    Example usage:
+        import opengradient as og
+        from langchain_opengradient import VerificationTracker
+
+        def report(verification):
+            print(verification.id, verification.status, verification.mismatch)
+
+        tracker = VerificationTracker(on_complete=report)
+        tool = toolkit.create_run_model_tool(
+            ...,
+            inference_mode=og.InferenceMode.TEE,
+            verification=tracker,
+        )
+    """
+
+    def __init__(
+        self,
+        on_complete: Optional[Callable[[Verification], Any]] = None,
+        provisional_marker: Callable[[Any, Verification], Any] = mark_provisional,
+        max_workers: int = 8,
+        max_finished: int = 1024,
+        on_chain_provisional: bool = False,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_finished < 0:
+            raise ValueError("max_finished must not be negative")
+
+        self.on_complete = on_complete
+        self.provisional_marker = provisional_marker
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self.on_chain_provisional = on_chain_provisional
+        self.started = 0
+        self.verified = 0
+        self.failed = 0
+        self.mismatches = 0
+        self.callback_errors = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Finished verifications are moved to the end, so the oldest are dropped.
+        self._verifications: Dict[str, Verification] = {}
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    def _create(
+        self, tool_name: str, model_cid: str, inference_mode: Any
+    ) -> Verification:
+        with self._lock:
+            verification = Verification(
+                f"v{next(self._ids)}", tool_name, model_cid, inference_mode
+            )
+            self._verifications[verification.id] = verification
+            self.started += 1
+        return verification
+
+    def _finish(
+        self,
+        verification: Verification,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if error is None:
+            verification._future.set_result(result)
+        else:
+            verification._future.set_exception(error)
+        with self._lock:
+            if error is None:
+                self.verified += 1
+            else:
+                self.failed += 1
+            # Move to the end and drop the oldest finished verifications.
+            del self._verifications[verification.id]
+            self._verifications[verification.id] = verification
+            finished = [v for v in self._verifications.values() if v.done()]
+            for old in finished[: max(0, len(finished) - self.max_finished)]:
+                del self._verifications[old.id]
+        self._settle(verification)
+
+    def set_provisional(self, verification: Verification, result: Any) -> None:
+        """
+        Record the provisional result a tool call returned.
+
+        Args:
+            verification (Verification): The handle of the call.
+            result (InferenceResult, optional): The provisional result, or None
+                if the call waited for the verified one.
+        """
+        verification.provisional = result
+        self._settle(verification)
+
+    def _settle(self, verification: Verification) -> None:
+        with self._lock:
+            verification._unsettled -= 1
+            if verification._unsettled:
+                return
+            if verification.provisional is not None and verification.status == VERIFIED:
+                verification.mismatch = not outputs_match(
+                    verification.provisional, verification._future.result()
+                )
+                if verification.mismatch:
+                    self.mismatches += 1
+        if self.on_complete is not None:
+            try:
+                self.on_complete(verification)
+            except Exception:
+                with self._lock:
+                    self.callback_errors += 1
+
+    def start(
+        self,
+        tool_name: str,
+        model_cid: str,
+        inference_mode: Any,
+        run: Callable[[], Any],
+    ) -> Verification:
+        """
+        Run a verified inference on the tracker's thread pool.
+
+        Args:
+            tool_name (str): The tool starting the verification.
+            model_cid (str): The model.
+            inference_mode (og.InferenceMode): The verified inference mode.
+            run (Callable[[], InferenceResult]): Runs the verified inference.
+
+        Returns:
+            Verification: The handle of the verification.
+        """
+        verification = self._create(tool_name, model_cid, inference_mode)
+
+        def verify() -> None:
+            try:
+                result = run()
+            except Exception as e:
+                self._finish(verification, error=e)
+            else:
+                self._finish(verification, result)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="og-verify"
+                )
+            executor = self._executor
+        executor.submit(verify)
+        return verification
+
+    def astart(
+        self,
+        tool_name: str,
+        model_cid: str,
+        inference_mode: Any,
+        arun: Callable[[], Awaitable[Any]],
+    ) -> Verification:
+        """
+        Run a verified inference as a task on the running event loop.
+
+        The task is cancelled, and the verification fails, if the loop is
+        closed before it finishes.
+
+        Args:
+            tool_name (str): The tool starting the verification.
+            model_cid (str): The model.
+            inference_mode (og.InferenceMode): The verified inference mode.
+            arun (Callable[[], Awaitable[InferenceResult]]): Runs the verified
+                inference.
+
+        Returns:
+            Verification: The handle of the verification.
+        """
+        verification = self._create(tool_name, model_cid, inference_mode)
+
+        async def verify() -> None:
+            try:
+                result = await arun()
+            except BaseException as e:
+                self._finish(verification, error=e)
+                if not isinstance(e, Exception):
+                    raise
+            else:
+                self._finish(verification, result)
+
+        task = asyncio.get_running_loop().create_task(verify())
+        # Running tasks are only weakly referenced by the loop.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return verification
+
+    def get(self, id: str) -> Verification:
+        """
+        Look up a verification by id.
+
+        Args:
+            id (str): The id from a provisional tool output.
+
+        Returns:
+            Verification: The handle.
+        """
+        with self._lock:
+            verification = self._verifications.get(id)
+        if verification is None:
+            raise ValueError(f"Verification {id!r} is not tracked")
+        return verification
+
+    def pending(self) -> List[Verification]:
+        """Verifications that have not finished yet."""
+        with self._lock:
+            return [v for v in self._verifications.values() if not v.done()]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the thread pool, waiting for running sync verifications."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
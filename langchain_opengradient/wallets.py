@@ -0,0 +1,333 @@
+"""Sharding inference transactions across a pool of wallets."""
+
+import contextlib
+import hashlib
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Sequence
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+MODEL_AFFINITY = "model_affinity"
+
+POLICIES = (ROUND_ROBIN, LEAST_OUTSTANDING, MODEL_AFFINITY)
+
+
+# Node errors that say the wallet cannot send right now.
+WALLET_ERRORS = ("insufficient funds",)
+
+
+def is_wallet_error(error: BaseException) -> bool:
+    """
+    Whether ``error`` says something about the wallet or its connection.
+
+    Connection, timeout, RPC and nonce errors and insufficient funds count,
+    including when they caused the error. Errors of the model, its input or the
+    output formatter do not.
+
+    Args:
+        error (BaseException): The error an inference failed with.
+
+    Returns:
+        bool: Whether the error counts against the wallet's health.
+    """
+    import aiohttp
+    from web3.exceptions import (
+        CannotHandleRequest,
+        ProviderConnectionError,
+        TimeExhausted,
+        TooManyRequests,
+        Web3RPCError,
+    )
+
+    from langchain_opengradient.transactions import is_nonce_error
+
+    transport_errors = (
+        OSError,
+        TimeoutError,
+        aiohttp.ClientError,
+        CannotHandleRequest,
+        ProviderConnectionError,
+        TimeExhausted,
+        TooManyRequests,
+        Web3RPCError,
+    )
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, transport_errors) or is_nonce_error(current):
+            return True
+        message = str(current).lower()
+        if any(wallet_error in message for wallet_error in WALLET_ERRORS):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _default_client_factory(private_key: str) -> Any:
+    from langchain_opengradient.clients import get_shared_client
+
+    return get_shared_client(private_key)
+
+
+def _default_async_client_factory(private_key: str) -> Any:
+    from langchain_opengradient.clients import get_shared_async_client
+
+    return get_shared_async_client(private_key)
+
+
+class Wallet:
+    """One private key of a ``WalletPool`` with its load and health.
+
+    Attributes:
+        index (int): Position of the key in the pool.
+        outstanding (int): Inferences currently sent from the wallet.
+        requests (int): Inferences sent from the wallet so far.
+        failures (int): Consecutive failed inferences.
+        last_error (BaseException, optional): The error of the last failure.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        private_key: str,
+        client_factory: Callable[[str], Any],
+        async_client_factory: Callable[[str], Any],
+    ):
+        self.index = index
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[BaseException] = None
+        self._private_key = private_key
+        self._client_factory = client_factory
+        self._async_client_factory = async_client_factory
+        self._client: Any = None
+        self._async_client: Any = None
+        self._backoff_until = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"Wallet(index={self.index}, outstanding={self.outstanding}, "
+            f"failures={self.failures})"
+        )
+
+    @property
+    def client(self) -> Any:
+        """OpenGradient client signing with this wallet, created on first use."""
+        if self._client is None:
+            self._client = self._client_factory(self._private_key)
+        return self._client
+
+    @property
+    def async_client(self) -> Any:
+        """``AsyncClient`` signing with this wallet, created on first use."""
+        if self._async_client is None:
+            self._async_client = self._async_client_factory(self._private_key)
+        return self._async_client
+
+    def healthy(self, now: Optional[float] = None) -> bool:
+        """Whether the wallet is not backing off after failures."""
+        return (time.monotonic() if now is None else now) >= self._backoff_until
+
+
+class WalletPool:
+    """Spreads inferences across several wallets.
+
+    A single wallet sends its transactions one nonce at a time, which bounds the
+    inference throughput of a toolkit. A pool picks a wallet for each inference
+    with one of these policies:
+
+    * ``"round_robin"``: wallets in turn.
+    * ``"least_outstanding"``: the wallet with the fewest inferences in flight.
+    * ``"model_affinity"``: the same wallet for a model CID as long as it is
+      healthy (rendezvous hashing, so only the models of an unhealthy wallet
+      move).
+
+    An inference that fails with a wallet error (see ``is_wallet_error``: a
+    connection, timeout, RPC or nonce error, or insufficient funds) puts its
+    wallet into exponential backoff with jitter, during which it is skipped; a
+    successful one clears it. Other errors, such as invalid model input, are
+    raised without affecting the wallet. When every wallet is backing off, the
+    one that recovers first is used rather than failing.
+
+    Workflow reads do not send transactions and keep using the toolkit's client.
+
+    Pass an instance to ``OpenGradientToolkit(wallet_pool=...)``, or pass a list
+    of keys as ``private_key`` for a round-robin pool.
+
+    Args:
+        private_keys (Sequence[str]): Private keys of the wallets.
+        policy (str, optional): Wallet selection policy. Defaults to
+            ``"round_robin"``.
+        initial_backoff (float, optional): Seconds a wallet is skipped after its
+            first failure. Defaults to 1.
+        max_backoff (float, optional): Upper bound of the backoff. Defaults to 60.
+        client_factory (Callable[[str], Any], optional): Creates the client of a
+            key. Defaults to the shared client for the key.
+        async_client_factory (Callable[[str], Any], optional): Creates the
+            ``AsyncClient`` of a key. Defaults to the shared one for the key.
+
+    Example usage:
+        from langchain_opengradient import OpenGradientToolkit, WalletPool
+
+        toolkit = OpenGradientToolkit(
+            wallet_pool=WalletPool(["0x...", "0x..."], policy="least_outstanding")
+        )
+    """
+
+    def __init__(
+        self,
+        private_keys: Sequence[str],
+        policy: str = ROUND_ROBIN,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        client_factory: Optional[Callable[[str], Any]] = None,
+        async_client_factory: Optional[Callable[[str], Any]] = None,
+    ):
+        private_keys = list(dict.fromkeys(private_keys))
+        if not private_keys:
+            raise ValueError("WalletPool needs at least one private key")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown wallet policy {policy!r}, expected {POLICIES}")
+        if initial_backoff <= 0 or max_backoff < initial_backoff:
+            raise ValueError("backoff must satisfy 0 < initial_backoff <= max_backoff")
+
+        self.policy = policy
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.wallets = [
+            Wallet(
+                index,
+                private_key,
+                client_factory or _default_client_factory,
+                async_client_factory or _default_async_client_factory,
+            )
+            for index, private_key in enumerate(private_keys)
+        ]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    @property
+    def private_keys(self) -> List[str]:
+        """Private keys of the wallets, in pool order."""
+        return [wallet._private_key for wallet in self.wallets]
+
+    def acquire(self, model_cid: str = "") -> Wallet:
+        """
+        Pick a wallet for an inference and count it as outstanding.
+
+        Every call must be followed by ``release``; ``use`` and ``ause`` do both.
+
+        Args:
+            model_cid (str, optional): The model to run, used by
+                ``"model_affinity"``.
+
+        Returns:
+            Wallet: The wallet to send the inference from.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [wallet for wallet in self.wallets if wallet.healthy(now)]
+            if not candidates:
+                candidates = [min(self.wallets, key=lambda w: w._backoff_until)]
+
+            if self.policy == LEAST_OUTSTANDING:
+                wallet = min(candidates, key=lambda w: (w.outstanding, w.requests))
+            elif self.policy == MODEL_AFFINITY:
+                wallet = max(
+                    candidates, key=lambda w: _affinity_score(model_cid, w.index)
+                )
+            else:
+                wallet = self._next_in_turn(candidates)
+
+            wallet.outstanding += 1
+            wallet.requests += 1
+            return wallet
+
+    def _next_in_turn(self, candidates: List[Wallet]) -> Wallet:
+        # Take the first candidate at or after the turn, so skipped wallets do
+        # not shift the rotation of the others.
+        count = len(self.wallets)
+        indices = {wallet.index for wallet in candidates}
+        for offset in range(count):
+            index = (self._next + offset) % count
+            if index in indices:
+                self._next = (index + 1) % count
+                return self.wallets[index]
+        raise AssertionError("no candidate wallets")
+
+    def release(
+        self,
+        wallet: Wallet,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False,
+    ) -> None:
+        """
+        Record that an inference sent from ``wallet`` finished.
+
+        Args:
+            wallet (Wallet): The wallet returned by ``acquire``.
+            error (BaseException, optional): The error the inference failed with.
+                Only wallet errors count as failures.
+            cancelled (bool): The inference was cancelled, which says nothing
+                about the wallet's health; its failures and backoff are kept.
+                Defaults to False.
+        """
+        # Decide outside the lock; the check imports web3 on first use.
+        counts = error is not None and is_wallet_error(error)
+        with self._lock:
+            wallet.outstanding -= 1
+            if cancelled:
+                return
+            if error is None:
+                wallet.failures = 0
+                wallet._backoff_until = 0.0
+                return
+            if not counts:
+                return
+            wallet.failures += 1
+            wallet.last_error = error
+            backoff = min(
+                self.initial_backoff * 2 ** (wallet.failures - 1), self.max_backoff
+            )
+            wallet._backoff_until = time.monotonic() + backoff * random.uniform(
+                0.5, 1.0
+            )
+
+    @contextlib.contextmanager
+    def use(self, model_cid: str = "") -> Iterator[Wallet]:
+        """Acquire a wallet for the duration of the block and release it after."""
+        wallet = self.acquire(model_cid)
+        try:
+            yield wallet
+        except Exception as e:
+            self.release(wallet, e)
+            raise
+        except BaseException:
+            self.release(wallet, cancelled=True)
+            raise
+        self.release(wallet)
+
+    @contextlib.asynccontextmanager
+    async def ause(self, model_cid: str = "") -> AsyncIterator[Wallet]:
+        """Async counterpart of ``use``."""
+        wallet = self.acquire(model_cid)
+        try:
+            yield wallet
+        except Exception as e:
+            self.release(wallet, e)
+            raise
+        except BaseException:
+            self.release(wallet, cancelled=True)
+            raise
+        self.release(wallet)
+
+
+def _affinity_score(model_cid: str, index: int) -> bytes:
+    return hashlib.blake2b(f"{index}:{model_cid}".encode(), digest_size=8).digest()
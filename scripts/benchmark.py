@@ -0,0 +1,350 @@
+"""Offline benchmarks of the toolkit's own overhead and concurrent throughput.
+
+Tools run against local stand-in clients that sleep for a configurable latency
+with jitter instead of contacting the OpenGradient network, so results measure
+the toolkit and not the chain. Results are written as JSON.
+
+    python scripts/benchmark.py --latency 0.01 --jitter 0.002 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.tools import BaseTool
+from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+from langchain_opengradient.toolkits import OpenGradientToolkit
+
+DEFAULT_CONCURRENCY = (1, 10, 100, 1000)
+
+
+class _Delay:
+    def __init__(self, latency: float, jitter: float, seed: int) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> float:
+        if not self.latency and not self.jitter:
+            return 0.0
+        with self._lock:
+            offset = self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency + offset)
+
+
+class StandInClient:
+    """Synchronous stand-in for ``og.client.Client`` with latency and jitter."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self._delay = _Delay(latency, jitter, seed)
+
+    def infer(
+        self, model_cid: str, inference_mode: Any, model_input: Dict[str, Any]
+    ) -> InferenceResult:
+        delay = self._delay.next()
+        if delay:
+            time.sleep(delay)
+        return InferenceResult("0xbenchmark", {"Y": np.array([0.5])})
+
+    def read_workflow_result(self, contract_address: str) -> ModelOutput:
+        delay = self._delay.next()
+        if delay:
+            time.sleep(delay)
+        return _workflow_output()
+
+
+class AsyncStandInClient:
+    """Async stand-in for ``AsyncClient`` with latency and jitter."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self._delay = _Delay(latency, jitter, seed)
+
+    async def infer(
+        self, model_cid: str, inference_mode: Any, model_input: Dict[str, Any]
+    ) -> InferenceResult:
+        await asyncio.sleep(self._delay.next())
+        return InferenceResult("0xbenchmark", {"Y": np.array([0.5])})
+
+    async def read_workflow_result(self, contract_address: str) -> ModelOutput:
+        await asyncio.sleep(self._delay.next())
+        return _workflow_output()
+
+
+def _workflow_output() -> ModelOutput:
+    return ModelOutput(
+        numbers={"regression_output": np.array([0.25])},
+        strings={},
+        jsons={},
+        is_simulation_result=False,
+    )
+
+
+def _toolkit(latency: float, jitter: float, seed: int) -> OpenGradientToolkit:
+    return OpenGradientToolkit(
+        private_key="benchmark",
+        client=StandInClient(latency, jitter, seed),
+        async_client=AsyncStandInClient(latency, jitter, seed),
+    )
+
+
+def _model_tool(toolkit: OpenGradientToolkit, index: int = 0) -> BaseTool:
+    return toolkit.create_run_model_tool(
+        model_cid=f"QmBenchmark{index}",
+        tool_name=f"model_tool_{index}",
+        model_input_provider=lambda: {"X": [1.0, 2.0, 3.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        tool_description="Benchmark model tool",
+    )
+
+
+def _summary(latencies: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+    }
+
+
+def bench_construction(iterations: int) -> Dict[str, Any]:
+    """Cost of creating a toolkit and of creating tools on it."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _toolkit(0.0, 0.0, 0)
+    toolkit_us = (time.perf_counter() - start) / iterations * 1e6
+
+    toolkit = _toolkit(0.0, 0.0, 0)
+    start = time.perf_counter()
+    for index in range(iterations):
+        _model_tool(toolkit, index)
+    model_tool_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for index in range(iterations):
+        toolkit.create_read_workflow_tool(
+            workflow_contract_address=f"0x{index:040x}",
+            tool_name=f"workflow_tool_{index}",
+            tool_description="Benchmark workflow tool",
+        )
+    workflow_tool_us = (time.perf_counter() - start) / iterations * 1e6
+
+    return {
+        "benchmark": "construction",
+        "iterations": iterations,
+        "toolkit_us": toolkit_us,
+        "run_model_tool_us": model_tool_us,
+        "read_workflow_tool_us": workflow_tool_us,
+    }
+
+
+def bench_overhead(iterations: int) -> List[Dict[str, Any]]:
+    """Time per invocation spent in the toolkit, on a zero-latency client."""
+    toolkit = _toolkit(0.0, 0.0, 0)
+    tool = _model_tool(toolkit)
+    client = toolkit.client
+    async_client = toolkit.async_client
+
+    def timed(fn: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - start) / iterations
+
+    baseline = timed(lambda: client.infer("QmBenchmark0", None, {"X": [1.0]}))
+    invoke = timed(lambda: tool.invoke({}))
+
+    async def atimed(afn: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await afn()
+        return (time.perf_counter() - start) / iterations
+
+    async def run_async() -> List[float]:
+        return [
+            await atimed(lambda: async_client.infer("QmBenchmark0", None, {})),
+            await atimed(lambda: tool.ainvoke({})),
+        ]
+
+    abaseline, ainvoke = asyncio.run(run_async())
+    return [
+        {
+            "benchmark": "overhead",
+            "mode": mode,
+            "iterations": iterations,
+            "client_us": client_s * 1e6,
+            "tool_us": tool_s * 1e6,
+            "overhead_us": (tool_s - client_s) * 1e6,
+        }
+        for mode, client_s, tool_s in (
+            ("sync", baseline, invoke),
+            ("async", abaseline, ainvoke),
+        )
+    ]
+
+
+def bench_sync_throughput(
+    concurrency: int, calls: int, latency: float, jitter: float, seed: int
+) -> Dict[str, Any]:
+    """Throughput of ``invoke`` from ``concurrency`` threads."""
+    tool = _model_tool(_toolkit(latency, jitter, seed))
+    total = max(calls, concurrency)
+    latencies: List[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(concurrency)
+
+    def caller(index: int) -> None:
+        own = total // concurrency + (index < total % concurrency)
+        barrier.wait()
+        for _ in range(own):
+            start = time.perf_counter()
+            tool.invoke({})
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(caller, range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return _throughput_result("sync", concurrency, latencies, elapsed)
+
+
+def bench_async_throughput(
+    concurrency: int, calls: int, latency: float, jitter: float, seed: int
+) -> Dict[str, Any]:
+    """Throughput of ``ainvoke`` from ``concurrency`` tasks on one event loop."""
+    tool = _model_tool(_toolkit(latency, jitter, seed))
+    total = max(calls, concurrency)
+    latencies: List[float] = []
+
+    async def caller(index: int) -> None:
+        own = total // concurrency + (index < total % concurrency)
+        for _ in range(own):
+            start = time.perf_counter()
+            await tool.ainvoke({})
+            latencies.append(time.perf_counter() - start)
+
+    async def run() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(caller(index) for index in range(concurrency)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    return _throughput_result("async", concurrency, latencies, elapsed)
+
+
+def _throughput_result(
+    mode: str, concurrency: int, latencies: List[float], elapsed: float
+) -> Dict[str, Any]:
+    return {
+        "benchmark": "throughput",
+        "mode": mode,
+        "concurrency": concurrency,
+        "calls": len(latencies),
+        "seconds": elapsed,
+        "calls_per_second": len(latencies) / elapsed,
+        **_summary(latencies),
+    }
+
+
+def run_benchmarks(
+    concurrency: Sequence[int] = DEFAULT_CONCURRENCY,
+    calls: int = 200,
+    iterations: int = 1000,
+    latency: float = 0.01,
+    jitter: float = 0.002,
+    seed: int = 0,
+    modes: Sequence[str] = ("sync", "async"),
+) -> Dict[str, Any]:
+    """
+    Run all benchmarks and return their results.
+
+    Args:
+        concurrency (Sequence[int]): Numbers of concurrent callers to measure
+            throughput at.
+        calls (int): Calls per throughput measurement (at least one per caller).
+        iterations (int): Repetitions of the construction and overhead
+            benchmarks.
+        latency (float): Mean latency of the stand-in clients in seconds.
+        jitter (float): Latencies are uniform in ``latency +/- jitter``.
+        seed (int): Seed of the latency jitter.
+        modes (Sequence[str]): Which of "sync" and "async" to measure.
+
+    Returns:
+        Dict[str, Any]: The configuration, environment and a list of results.
+    """
+    results: List[Dict[str, Any]] = [bench_construction(iterations)]
+    results.extend(
+        result for result in bench_overhead(iterations) if result["mode"] in modes
+    )
+    for level in concurrency:
+        if "sync" in modes:
+            results.append(bench_sync_throughput(level, calls, latency, jitter, seed))
+        if "async" in modes:
+            results.append(bench_async_throughput(level, calls, latency, jitter, seed))
+
+    return {
+        "config": {
+            "concurrency": list(concurrency),
+            "calls": calls,
+            "iterations": iterations,
+            "latency": latency,
+            "jitter": jitter,
+            "seed": seed,
+            "modes": list(modes),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY)
+    )
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.002)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mode", choices=("sync", "async"), action="append", dest="modes"
+    )
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        concurrency=args.concurrency,
+        calls=args.calls,
+        iterations=args.iterations,
+        latency=args.latency,
+        jitter=args.jitter,
+        seed=args.seed,
+        modes=args.modes or ("sync", "async"),
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,86 @@
+import subprocess
 import sys
 import traceback
 from importlib.machinery import SourceFileLoader
+from typing import Iterable, List, Set
+
+# Modules that must not be loaded by importing the package itself.
+HEAVY_MODULES = ("opengradient", "web3", "numpy")
+
+
+def import_time_us(statement: str) -> int:
+    """Cumulative import time of ``statement`` in a fresh interpreter, in microseconds.
+
+    Uses ``python -X importtime`` and sums the cumulative time of the top-level
+    imports the statement triggers, so interpreter startup is not counted.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package".
+    # Top-level imports are the ones whose name is not indented.
+    baseline = _startup_modules()
+    total = 0
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:].rstrip()
+        if name.lstrip() == name and name not in baseline:
+            total += int(parts[1])
+    return total
+
+
+def loaded_modules(statement: str, candidates: Iterable[str]) -> List[str]:
+    """Return which of ``candidates`` are in ``sys.modules`` after ``statement``."""
+    names = list(candidates)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\n"
+            f"print('\\n'.join(m for m in {names!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.splitlines() if name]
+
+
+def _startup_modules() -> Set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+def check_import_budget(statement: str, budget_ms: float) -> bool:
+    """Print a report and return whether ``statement`` stays within the budget."""
+    cost_ms = import_time_us(statement) / 1000
+    heavy = loaded_modules(statement, HEAVY_MODULES)
+    print(f"{statement!r}: {cost_ms:.1f}ms (budget {budget_ms}ms)")  # noqa: T201
+    if heavy:
+        print(f"{statement!r} loaded heavy modules: {', '.join(heavy)}")  # noqa: T201
+    return cost_ms <= budget_ms and not heavy
+
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--import-budget"]:
+        # python scripts/check_imports.py --import-budget <ms> <module>...
+        budget_ms = float(sys.argv[2])
+        ok = all(
+            check_import_budget(f"import {module}", budget_ms)
+            for module in sys.argv[3:]
+        )
+        sys.exit(0 if ok else 1)
+
     files = sys.argv[1:]
     has_failure = False
     for file in files:
@@ -0,0 +1,116 @@
+"""Replay a recorded tool-call trace against a toolkit and report throughput.
+
+Tools are built from a tool manifest. By default they run against the local
+stand-in clients of the benchmark script, so a trace can be replayed offline
+to compare caching and concurrency settings; with ``--network`` they use the
+OpenGradient network and ``OPENGRADIENT_PRIVATE_KEY``. Results are written as
+JSON.
+
+    python scripts/replay.py trace.jsonl.gz --manifest tools.yaml --speed 4
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark import AsyncStandInClient, StandInClient  # noqa: E402
+
+from langchain_opengradient.replay import load_trace, replay_trace  # noqa: E402
+from langchain_opengradient.toolkits import OpenGradientToolkit  # noqa: E402
+
+
+def run_replay(
+    trace: str,
+    manifest: str,
+    speed: Optional[float] = 1.0,
+    concurrency: int = 8,
+    latency: float = 0.01,
+    jitter: float = 0.002,
+    seed: int = 0,
+    network: bool = False,
+) -> Dict[str, Any]:
+    """
+    Replay a trace and return the report.
+
+    Args:
+        trace (str): Trace file written by ``TraceRecorder``.
+        manifest (str): Tool manifest declaring the traced tools.
+        speed (float, optional): Speed multiplier; None replays without pauses.
+        concurrency (int): Maximum number of calls running at once.
+        latency (float): Mean latency of the stand-in clients in seconds.
+        jitter (float): Latencies are uniform in ``latency +/- jitter``.
+        seed (int): Seed of the latency jitter.
+        network (bool): Use the OpenGradient network instead of stand-ins.
+
+    Returns:
+        Dict[str, Any]: The configuration and the replay summary.
+    """
+    kwargs: Dict[str, Any] = {}
+    if not network:
+        kwargs = {
+            "private_key": "replay",
+            "client": StandInClient(latency, jitter, seed),
+            "async_client": AsyncStandInClient(latency, jitter, seed),
+        }
+    toolkit = OpenGradientToolkit.from_manifest(manifest, **kwargs)
+    records = load_trace(trace)
+    report = replay_trace(
+        records, toolkit.get_tools(), speed=speed, max_concurrency=concurrency
+    )
+    return {
+        "config": {
+            "trace": trace,
+            "manifest": manifest,
+            "speed": speed,
+            "concurrency": concurrency,
+            "network": network,
+            "latency": None if network else latency,
+            "jitter": None if network else jitter,
+        },
+        "results": report.summary(),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace")
+    parser.add_argument("--manifest", required=True)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Speed multiplier of the recorded timing; 0 replays without pauses",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.002)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--network", action="store_true")
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_replay(
+        trace=args.trace,
+        manifest=args.manifest,
+        speed=args.speed or None,
+        concurrency=args.concurrency,
+        latency=args.latency,
+        jitter=args.jitter,
+        seed=args.seed,
+        network=args.network,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Local stand-ins for the OpenGradient clients used in unit tests."""
+
+import asyncio
+import queue
+import time
+import types
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import opengradient as og  # type: ignore
+from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+
+class FakeClient:
+    """Synchronous stand-in for ``og.client.Client`` with a fixed latency."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.infer_calls: List[Tuple[str, og.InferenceMode, Dict[str, Any]]] = []
+        self.read_calls: List[str] = []
+
+    def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        max_retries: Any = None,
+    ) -> InferenceResult:
+        self.infer_calls.append((model_cid, inference_mode, model_input))
+        time.sleep(self.latency)
+        return InferenceResult("0xfake", {"Y": np.array([0.5])})
+
+    def read_workflow_result(self, contract_address: str) -> ModelOutput:
+        self.read_calls.append(contract_address)
+        time.sleep(self.latency)
+        return ModelOutput(
+            numbers={"regression_output": np.array([0.25])},
+            strings={},
+            jsons={},
+            is_simulation_result=False,
+        )
+
+
+class FakeAsyncClient:
+    """Async stand-in for ``AsyncClient`` that tracks calls in flight."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.infer_calls: List[Tuple[str, og.InferenceMode, Dict[str, Any]]] = []
+        self.read_calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _wait(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+        max_retries: Any = None,
+    ) -> InferenceResult:
+        self.infer_calls.append((model_cid, inference_mode, model_input))
+        await self._wait()
+        return InferenceResult("0xfake", {"Y": np.array([0.5])})
+
+    async def read_workflow_result(self, contract_address: str) -> ModelOutput:
+        self.read_calls.append(contract_address)
+        await self._wait()
+        return ModelOutput(
+            numbers={"regression_output": np.array([0.25])},
+            strings={},
+            jsons={},
+            is_simulation_result=False,
+        )
+
+
+class FakeWorkflowEventSource:
+    """Stand-in workflow event stream fed from any thread.
+
+    ``publish`` reports a new result for an address and ``drop`` makes the
+    current stream fail, as a dropped RPC connection would.
+    """
+
+    def __init__(self) -> None:
+        self._events: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.connections = 0
+
+    def publish(self, contract_address: str) -> None:
+        self._events.put(contract_address)
+
+    def drop(self) -> None:
+        self._events.put(None)
+
+    async def __call__(self, contract_addresses: Sequence[str]) -> AsyncIterator[str]:
+        self.connections += 1
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                await asyncio.sleep(0.005)
+                continue
+            if event is None:
+                raise ConnectionError("event stream dropped")
+            if event in contract_addresses:
+                yield event
+
+
+class FakeChain:
+    """Stand-in for ``AsyncWeb3.eth`` that mines one wallet's transactions.
+
+    Accepted transactions are kept in ``pool`` and mined in nonce order, so a
+    missing nonce blocks every later one, like on a real chain. ``rejected`` holds
+    error messages the node returns for the next sends, and ``dropped`` nonces are
+    accepted but never reach the pool.
+    """
+
+    def __init__(self, block_time: float = 0.005) -> None:
+        self.block_time = block_time
+        self.mined = 0
+        self.pool: Dict[int, Dict[str, Any]] = {}
+        self.received: List[int] = []
+        self.rejected: List[str] = []
+        self.dropped: List[int] = []
+        self.count_calls = 0
+
+    def pending_count(self) -> int:
+        nonce = self.mined
+        while nonce in self.pool:
+            nonce += 1
+        return nonce
+
+    async def get_transaction_count(self, address: str, block: str) -> int:
+        self.count_calls += 1
+        await asyncio.sleep(0)
+        return self.pending_count()
+
+    async def send_raw_transaction(self, raw: Dict[str, Any]) -> bytes:
+        await asyncio.sleep(0)
+        nonce = raw["nonce"]
+        if self.rejected:
+            raise ValueError(self.rejected.pop(0))
+        if nonce < self.mined:
+            raise ValueError("nonce too low")
+        if nonce in self.pool:
+            raise ValueError("already known")
+        self.received.append(nonce)
+        if nonce in self.dropped:
+            self.dropped.remove(nonce)
+        else:
+            self.pool[nonce] = raw
+        return f"tx-{nonce}".encode()
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: bytes, timeout: float
+    ) -> Dict[str, Any]:
+        nonce = int(tx_hash.decode().split("-")[1])
+        deadline = time.monotonic() + timeout
+        while True:
+            await asyncio.sleep(self.block_time)
+            while self.mined in self.pool:
+                self.mined += 1
+            if nonce < self.mined and nonce in self.pool:
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Transaction {tx_hash!r} is not in the chain")
+        return {"status": 1, "nonce": nonce}
+
+
+class FakeAccount:
+    """Wallet account whose signed transactions are the transaction dicts."""
+
+    address = "0x0000000000000000000000000000000000000001"
+
+    def sign_transaction(self, transaction: Dict[str, Any]) -> Any:
+        return types.SimpleNamespace(raw_transaction=dict(transaction))
@@ -0,0 +1,219 @@
+"""Unit testing for micro-batching of concurrent inferences."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+import opengradient as og  # type: ignore
+from opengradient import InferenceResult  # type: ignore
+from pydantic import BaseModel, Field
+
+from langchain_opengradient.batching import InferenceBatcher
+from langchain_opengradient.toolkits import OpenGradientToolkit
+
+VANILLA = og.InferenceMode.VANILLA
+
+
+class BatchRecorder:
+    """Inference stand-in that sums the input, or each row of a batched input."""
+
+    def __init__(self, latency: float = 0.05) -> None:
+        self.latency = latency
+        self.batch_sizes: List[int] = []
+        self.lock = threading.Lock()
+
+    def _result(self, model_input: Dict[str, Any]) -> InferenceResult:
+        x = np.asarray(model_input["x"])
+        if (x < 0).any():
+            raise ValueError("negative input")
+        if x.ndim == 1:
+            with self.lock:
+                self.batch_sizes.append(1)
+            return InferenceResult("0xsingle", {"Y": x.sum()})
+        with self.lock:
+            self.batch_sizes.append(x.shape[0])
+        return InferenceResult("0xbatch", {"Y": x.sum(axis=1)})
+
+    def infer(
+        self, model_cid: str, inference_mode: og.InferenceMode, model_input: Any
+    ) -> InferenceResult:
+        time.sleep(self.latency)
+        return self._result(model_input)
+
+    async def ainfer(
+        self, model_cid: str, inference_mode: og.InferenceMode, model_input: Any
+    ) -> InferenceResult:
+        await asyncio.sleep(self.latency)
+        return self._result(model_input)
+
+
+def _run_threads(batcher: InferenceBatcher, recorder: BatchRecorder, n: int) -> List:
+    barrier = threading.Barrier(n)
+
+    def call(i: int) -> Any:
+        barrier.wait()
+        try:
+            return batcher.infer(recorder.infer, "QmA", VANILLA, {"x": [i, i]})
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        return list(executor.map(call, range(n)))
+
+
+def test_sync_calls_are_coalesced() -> None:
+    """Calls arriving while an inference is in flight share the next one."""
+    batcher = InferenceBatcher(max_batch_size=8, max_wait=0.1)
+    recorder = BatchRecorder()
+
+    results = _run_threads(batcher, recorder, 8)
+
+    assert recorder.batch_sizes == [1, 7]
+    assert [float(r.model_output["Y"]) for r in results] == [2.0 * i for i in range(8)]
+    assert {r.transaction_hash for r in results} == {"0xsingle", "0xbatch"}
+
+
+def test_sync_batches_respect_max_batch_size() -> None:
+    """Batches are split once max_batch_size calls have joined."""
+    batcher = InferenceBatcher(max_batch_size=4, max_wait=0.2)
+    recorder = BatchRecorder()
+
+    results = _run_threads(batcher, recorder, 10)
+
+    assert sum(recorder.batch_sizes) == 10
+    assert max(recorder.batch_sizes) <= 4
+    assert [float(r.model_output["Y"]) for r in results] == [2.0 * i for i in range(10)]
+
+
+def test_sync_errors_are_isolated() -> None:
+    """A failing input only fails its own call."""
+    batcher = InferenceBatcher(max_batch_size=3, max_wait=0.5)
+    recorder = BatchRecorder()
+    barrier = threading.Barrier(3)
+
+    def call(value: int) -> Any:
+        barrier.wait()
+        try:
+            return batcher.infer(recorder.infer, "QmA", VANILLA, {"x": [value]})
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(call, [1, -1, 2]))
+
+    assert float(results[0].model_output["Y"]) == 1.0
+    assert isinstance(results[1], ValueError)
+    assert float(results[2].model_output["Y"]) == 2.0
+
+
+def test_lone_call_is_sent_without_waiting() -> None:
+    """A call with nothing else in flight does not wait for max_wait."""
+    batcher = InferenceBatcher(max_wait=5.0)
+    recorder = BatchRecorder(latency=0.0)
+
+    start = time.monotonic()
+    result = batcher.infer(recorder.infer, "QmA", VANILLA, {"x": [1.0, 2.0]})
+
+    assert time.monotonic() - start < 1.0
+    assert float(result.model_output["Y"]) == 3.0 and recorder.batch_sizes == [1]
+
+
+async def test_model_without_batch_axis_stops_being_batched() -> None:
+    """Outputs that cannot be split are retried per call and not batched again."""
+    batcher = InferenceBatcher(max_batch_size=4, max_wait=0.01)
+    inputs: List[Any] = []
+
+    async def infer(model_cid: str, mode: og.InferenceMode, model_input: Any) -> Any:
+        inputs.append(np.asarray(model_input["x"]).shape)
+        await asyncio.sleep(0.02)
+        return InferenceResult("0x", {"Y": np.float32(1.0)})
+
+    for _ in range(2):
+        results = await asyncio.gather(
+            *(batcher.ainfer(infer, "QmA", VANILLA, {"x": [1.0]}) for _ in range(3))
+        )
+        assert [float(r.model_output["Y"]) for r in results] == [1.0] * 3
+
+    # A lone call with its own input, one stacked attempt, then own inputs only.
+    assert inputs == [(1,), (2, 1)] + [(1,)] * 5
+    assert batcher.unbatchable == {("QmA", VANILLA)}
+
+
+def test_lone_call_output_is_not_sliced() -> None:
+    """A call sent on its own gets the model output as returned."""
+    batcher = InferenceBatcher()
+
+    def infer(model_cid: str, mode: og.InferenceMode, model_input: Any) -> Any:
+        return InferenceResult("0x", {"Y": np.array([[1.0, 2.0]])})
+
+    result = batcher.infer(infer, "QmA", VANILLA, {"x": [1.0]})
+
+    assert result.model_output["Y"].shape == (1, 2)
+    assert batcher.unbatchable == set()
+
+
+async def test_async_calls_are_coalesced() -> None:
+    """Concurrent async calls are grouped by model and input signature."""
+    batcher = InferenceBatcher(max_batch_size=16, max_wait=0.01)
+    recorder = BatchRecorder()
+
+    results = await asyncio.gather(
+        *(
+            batcher.ainfer(recorder.ainfer, "QmA", VANILLA, {"x": [i]})
+            for i in range(5)
+        ),
+        *(
+            batcher.ainfer(recorder.ainfer, "QmA", VANILLA, {"x": [i, i]})
+            for i in range(3)
+        ),
+    )
+
+    # The first call of each input signature is sent at once.
+    assert sorted(recorder.batch_sizes) == [1, 1, 2, 4]
+    assert [float(r.model_output["Y"]) for r in results] == [0, 1, 2, 3, 4, 0, 2, 4]
+
+
+async def test_async_errors_are_isolated() -> None:
+    """A failing input in an async batch only fails its own call."""
+    batcher = InferenceBatcher(max_batch_size=4, max_wait=0.01)
+    recorder = BatchRecorder()
+
+    results: List[Any] = await asyncio.gather(
+        *(
+            batcher.ainfer(recorder.ainfer, "QmA", VANILLA, {"x": [v]})
+            for v in (1, -1, 2, 3)
+        ),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], ValueError)
+    assert [float(results[i].model_output["Y"]) for i in (0, 2, 3)] == [1, 2, 3]
+
+
+class PriceSchema(BaseModel):
+    price: float = Field(description="Latest price")
+
+
+async def test_run_model_tool_uses_batcher() -> None:
+    """Run model tools sharing a batcher send one inference per burst."""
+    recorder = BatchRecorder()
+    client = type("Client", (), {"infer": staticmethod(recorder.ainfer)})()
+
+    toolkit = OpenGradientToolkit(private_key="test_key", async_client=client)
+
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmA",
+        tool_name="price_tool",
+        model_input_provider=lambda price: {"x": [price]},
+        model_output_formatter=lambda r: str(float(r.model_output["Y"])),
+        tool_input_schema=PriceSchema,
+        inference_batcher=InferenceBatcher(max_batch_size=32, max_wait=0.2),
+    )
+
+    results = await asyncio.gather(*(tool.ainvoke({"price": p}) for p in range(20)))
+
+    assert results == [str(float(p)) for p in range(20)]
+    assert recorder.batch_sizes == [1, 19]
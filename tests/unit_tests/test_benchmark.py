@@ -0,0 +1,51 @@
+"""Smoke test for the offline benchmark script."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "benchmark", Path(__file__).parents[2] / "scripts" / "benchmark.py"
+)
+assert _spec is not None and _spec.loader is not None
+benchmark = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark)
+
+
+def test_benchmark_writes_json_report(tmp_path: Path) -> None:
+    """A tiny run covers every benchmark and writes a JSON report."""
+    output = tmp_path / "bench.json"
+    assert (
+        benchmark.main(
+            [
+                "--concurrency",
+                "1",
+                "4",
+                "--calls",
+                "8",
+                "--iterations",
+                "5",
+                "--latency",
+                "0.001",
+                "--jitter",
+                "0.0005",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+
+    report = json.loads(output.read_text())
+    results = report["results"]
+    assert [r["benchmark"] for r in results] == ["construction"] + ["overhead"] * 2 + [
+        "throughput"
+    ] * 4
+    throughput = [r for r in results if r["benchmark"] == "throughput"]
+    assert {(r["mode"], r["concurrency"]) for r in throughput} == {
+        ("sync", 1),
+        ("async", 1),
+        ("sync", 4),
+        ("async", 4),
+    }
+    assert all(r["calls"] == 8 and r["calls_per_second"] > 0 for r in throughput)
@@ -0,0 +1,299 @@
+"""Unit testing for the OpenGradient tool result caches."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import opengradient as og  # type: ignore
+import pytest
+from opengradient import InferenceResult  # type: ignore
+from pydantic import BaseModel, Field
+
+from langchain_opengradient.caching import (
+    InferenceCache,
+    WorkflowResultCache,
+    model_input_digest,
+)
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+class ValuesSchema(BaseModel):
+    values: List[float] = Field(description="List of values to process")
+
+
+def test_workflow_cache_hit_and_miss() -> None:
+    """Fresh values are served from the cache and counted as hits."""
+    cache = WorkflowResultCache(ttl=60)
+    calls: List[str] = []
+
+    def fetch() -> str:
+        calls.append("0x1")
+        return "result"
+
+    assert cache.get("0x1", fetch) == "result"
+    assert cache.get("0x1", fetch) == "result"
+    assert cache.get("0x1", fetch) == "result"
+
+    assert calls == ["0x1"]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.stale_hits) == (2, 1, 0)
+
+
+def test_workflow_cache_stale_while_revalidate() -> None:
+    """Stale values are served while a single background refresh runs."""
+    cache = WorkflowResultCache(ttl=0.2)
+    release = threading.Event()
+    values = iter(["old", "new"])
+    refreshes: List[int] = []
+
+    def fetch() -> str:
+        value = next(values)
+        if value == "new":
+            refreshes.append(1)
+            release.wait(timeout=5)
+        return value
+
+    assert cache.get("0x1", fetch) == "old"
+    time.sleep(0.25)
+
+    # Every caller gets the stale value and only one refresh is started.
+    assert [cache.get("0x1", fetch) for _ in range(10)] == ["old"] * 10
+    release.set()
+    for _ in range(100):
+        if cache.stats.refreshes:
+            break
+        time.sleep(0.01)
+
+    assert refreshes == [1]
+    assert cache.get("0x1", fetch) == "new"
+    assert cache.stats.stale_hits == 10
+
+
+def test_workflow_cache_refresh_error_keeps_stale_value() -> None:
+    """A failed refresh keeps the stale value and allows another refresh."""
+    cache = WorkflowResultCache(ttl=0.01)
+    cache.get("0x1", lambda: "old")
+    time.sleep(0.02)
+
+    def failing_fetch() -> Any:
+        raise ConnectionError("rpc down")
+
+    assert cache.get("0x1", failing_fetch) == "old"
+    for _ in range(100):
+        if cache.stats.refresh_errors:
+            break
+        time.sleep(0.01)
+
+    assert cache.stats.refresh_errors == 1
+    assert cache.get("0x1", failing_fetch) == "old"
+
+
+def test_workflow_cache_max_stale() -> None:
+    """Values older than ttl + max_stale are fetched inline."""
+    cache = WorkflowResultCache(ttl=0.01, max_stale=0.01)
+    cache.get("0x1", lambda: "old")
+    time.sleep(0.03)
+
+    assert cache.get("0x1", lambda: "new") == "new"
+    assert cache.stats.misses == 2
+
+
+def test_workflow_cache_bounded_size() -> None:
+    """The least recently used contract address is evicted."""
+    cache = WorkflowResultCache(ttl=60, max_size=2)
+    cache.get("0x1", lambda: "a")
+    cache.get("0x2", lambda: "b")
+    cache.get("0x1", lambda: "a")
+    cache.get("0x3", lambda: "c")
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.get("0x2", lambda: "b2") == "b2"
+
+
+def test_workflow_cache_invalid_arguments() -> None:
+    """Invalid bounds are rejected."""
+    with pytest.raises(ValueError, match="max_size"):
+        WorkflowResultCache(max_size=0)
+    with pytest.raises(ValueError, match="ttl"):
+        WorkflowResultCache(ttl=-1)
+
+
+async def test_workflow_cache_async_stale_while_revalidate() -> None:
+    """Async lookups serve stale values and refresh on the event loop."""
+    cache = WorkflowResultCache(ttl=0.01)
+    values = iter(["old", "new"])
+
+    async def afetch() -> str:
+        await asyncio.sleep(0.01)
+        return next(values)
+
+    assert await cache.aget("0x1", afetch) == "old"
+    await asyncio.sleep(0.02)
+    assert await cache.aget("0x1", afetch) == "old"
+    assert await cache.aget("0x1", afetch) == "old"
+    await asyncio.sleep(0.03)
+
+    assert await cache.aget("0x1", afetch) == "new"
+    assert cache.stats.refreshes == 1
+
+
+async def test_read_workflow_tool_uses_cache() -> None:
+    """Read workflow tools built by the toolkit read through the cache."""
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key",
+        workflow_cache=WorkflowResultCache(ttl=60),
+        client=client,
+        async_client=FakeAsyncClient(),
+    )
+
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0x123456789",
+        tool_name="test_workflow_tool",
+        tool_description="Test workflow tool for unit testing",
+        output_formatter=lambda x: str(x.numbers["regression_output"].item()),
+    )
+
+    assert [tool.invoke({}) for _ in range(5)] == ["0.25"] * 5
+    assert await tool.ainvoke({}) == "0.25"
+
+    assert client.read_calls == ["0x123456789"]
+    assert isinstance(toolkit.async_client, FakeAsyncClient)
+    assert toolkit.async_client.read_calls == []
+    assert toolkit.workflow_cache is not None
+    assert toolkit.workflow_cache.stats.hits == 5
+
+
+def _result(nbytes: int, tx_hash: str = "") -> InferenceResult:
+    return InferenceResult(tx_hash, {"Y": np.zeros(nbytes, dtype=np.uint8)})
+
+
+def test_model_input_digest_is_canonical() -> None:
+    """Equal tensors hash equally regardless of container or key order."""
+    rows = [[2535.79, 2535.79, 2505.37, 2515.36], [2515.37, 2516.37, 2497.27, 2.0]]
+
+    as_lists = {"open_high_low_close": rows, "window": 2}
+    as_arrays = {"window": np.array(2), "open_high_low_close": np.array(rows)}
+    fortran = {"open_high_low_close": np.asfortranarray(rows), "window": 2}
+    changed = {"open_high_low_close": rows[:1], "window": 2}
+
+    assert model_input_digest(as_lists) == model_input_digest(as_arrays)
+    assert model_input_digest(as_lists) == model_input_digest(fortran)
+    assert model_input_digest(as_lists) != model_input_digest(changed)
+    assert model_input_digest({"s": ["a", "b"]}) != model_input_digest({"s": ["ab"]})
+
+
+def test_inference_cache_key_includes_model_and_mode() -> None:
+    """Cache keys differ per model CID and inference mode."""
+    model_input = {"x": [1.0, 2.0]}
+    vanilla = InferenceCache.make_key("QmA", og.InferenceMode.VANILLA, model_input)
+
+    assert vanilla == InferenceCache.make_key(
+        "QmA", og.InferenceMode.VANILLA, {"x": np.array([1.0, 2.0])}
+    )
+    assert vanilla != InferenceCache.make_key(
+        "QmB", og.InferenceMode.VANILLA, model_input
+    )
+    assert vanilla != InferenceCache.make_key("QmA", og.InferenceMode.TEE, model_input)
+
+
+def test_inference_cache_byte_budget() -> None:
+    """Least recently used results are evicted to stay within max_bytes."""
+    cache = InferenceCache(max_bytes=300)
+    cache.put("a", _result(100))
+    cache.put("b", _result(100))
+    assert cache.get("a") is not None
+    cache.put("c", _result(150))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.nbytes == 250
+    assert cache.stats.evictions == 1
+
+    # Results larger than the whole budget are not cached.
+    cache.put("d", _result(400))
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+def test_inference_cache_ttl_and_readonly_outputs() -> None:
+    """Expired results are misses and cached arrays cannot be mutated."""
+    cache = InferenceCache(ttl=0.01)
+    cache.put("a", _result(10))
+
+    cached = cache.get("a")
+    assert cached is not None
+    with pytest.raises(ValueError):
+        cached.model_output["Y"][0] = 1
+
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.nbytes == 0
+
+
+async def test_run_model_tool_uses_inference_cache() -> None:
+    """Repeated inputs to a run model tool are answered from the cache."""
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=client, async_client=FakeAsyncClient()
+    )
+    cache = InferenceCache()
+
+    def model_input_provider(**llm_input: Any) -> Dict[str, Any]:
+        return {"values": llm_input["values"]}
+
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest123456789",
+        tool_name="test_model_tool",
+        model_input_provider=model_input_provider,
+        model_output_formatter=lambda x: str(x.model_output["Y"].item()),
+        tool_input_schema=ValuesSchema,
+        inference_cache=cache,
+    )
+
+    assert tool.invoke({"values": [1.0, 2.0]}) == "0.5"
+    assert tool.invoke({"values": [1.0, 2.0]}) == "0.5"
+    assert await tool.ainvoke({"values": [1.0, 2.0]}) == "0.5"
+    assert tool.invoke({"values": [3.0]}) == "0.5"
+    assert await tool.ainvoke({"values": [4.0]}) == "0.5"
+
+    assert len(client.infer_calls) == 2
+    assert isinstance(toolkit.async_client, FakeAsyncClient)
+    assert len(toolkit.async_client.infer_calls) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (2, 3)
+
+
+def test_formatter_mutations_do_not_reach_the_cache() -> None:
+    """A formatter changing its arrays in place leaves the cached copy intact."""
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    cache = InferenceCache()
+
+    def percent(result: Any) -> str:
+        output = result.model_output["Y"]
+        output *= 100
+        return f"{output.item()}%"
+
+    def create_tool(name: str, formatter: Any) -> Any:
+        return toolkit.create_run_model_tool(
+            model_cid="QmTest123456789",
+            tool_name=name,
+            model_input_provider=lambda: {"values": [1.0]},
+            model_output_formatter=formatter,
+            inference_cache=cache,
+        )
+
+    assert create_tool("percent", percent).invoke({}) == "50.0%"
+    raw = create_tool("raw", lambda x: str(x.model_output["Y"].item()))
+    assert raw.invoke({}) == "0.5"
+    assert len(client.infer_calls) == 1 and cache.stats.hits == 1
+
+    original = _result(4)
+    frozen = cache.put("direct", original)
+    assert not np.shares_memory(frozen.model_output["Y"], original.model_output["Y"])
+    assert original.model_output["Y"].flags.writeable
@@ -0,0 +1,182 @@
+"""Unit testing for deadlines, hedged attempts and last-good fallback."""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+from opengradient import InferenceResult  # type: ignore
+
+from langchain_opengradient.deadlines import DeadlinePolicy
+from langchain_opengradient.singleflight import SingleFlight
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+class ScriptedAsyncClient(FakeAsyncClient):
+    """Async client whose inferences take the given latencies in turn."""
+
+    def __init__(self, latencies: List[float]) -> None:
+        super().__init__()
+        self.latencies = latencies
+        self.cancelled = 0
+
+    async def infer(self, *args: Any, **kwargs: Any) -> InferenceResult:
+        latency = self.latencies.pop(0)
+        try:
+            await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return InferenceResult("0xfake", {"Y": [latency]})
+
+
+def _model_tool(toolkit: OpenGradientToolkit, deadline: DeadlinePolicy) -> Any:
+    return toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=lambda: {"X": [1.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        deadline=deadline,
+    )
+
+
+def test_deadline_raises_without_fallback() -> None:
+    """A call slower than the timeout raises TimeoutError."""
+    client = FakeClient(latency=0.3)
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    deadline = DeadlinePolicy(timeout=0.05)
+    tool = _model_tool(toolkit, deadline)
+
+    with pytest.raises(TimeoutError, match="deadline of 0.05s"):
+        tool.invoke({})
+    assert deadline.timeouts == 1
+
+
+def test_deadline_falls_back_to_last_good_result() -> None:
+    """After the timeout the last good result is returned, marked as stale."""
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    deadline = DeadlinePolicy(timeout=0.05, fallback=True)
+    tool = _model_tool(toolkit, deadline)
+
+    assert tool.invoke({}) == "0.5"
+    client.latency = 0.3
+    assert tool.invoke({}) == "0.5 (stale: last good result from 0s ago)"
+    assert deadline.fallbacks == 1
+
+    stale_deadline = DeadlinePolicy(timeout=0.05, fallback=True, max_staleness=0)
+    with pytest.raises(TimeoutError):
+        _model_tool(toolkit, stale_deadline).invoke({})
+
+
+def test_last_good_results_are_bounded() -> None:
+    """Only the most recent results are kept, and none older than max_staleness."""
+    deadline = DeadlinePolicy(timeout=0.05, fallback=True, max_last_good=2)
+    for key in ("a", "b", "c"):
+        deadline.run(key, lambda: key)
+
+    assert list(deadline._last_good) == ["b", "c"]
+    with pytest.raises(TimeoutError):
+        deadline.run("a", lambda: time.sleep(0.2))
+    assert deadline.run("c", lambda: time.sleep(0.2)).startswith("c (stale")
+
+    fresh = DeadlinePolicy(timeout=0.05, fallback=True, max_staleness=0.01)
+    fresh.run("a", lambda: "a")
+    time.sleep(0.02)
+    fresh.run("b", lambda: "b")
+    assert list(fresh._last_good) == ["b"]
+
+
+async def test_hedged_attempt_answers_slow_call() -> None:
+    """A second attempt starts after the hedge delay and the first is cancelled."""
+    async_client = ScriptedAsyncClient([1.0, 0.01])
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=async_client
+    )
+    deadline = DeadlinePolicy(timeout=0.5, hedge_after=0.02, hedge_inferences=True)
+    tool = _model_tool(toolkit, deadline)
+
+    assert await tool.ainvoke({}) == "0.01"
+    await asyncio.sleep(0)
+    assert deadline.hedges == 1 and deadline.hedge_wins == 1
+    assert async_client.cancelled == 1
+
+
+def test_hedge_delay_follows_latency_quantile() -> None:
+    """Once warm, the hedge delay is the configured quantile of attempt latency."""
+    deadline = DeadlinePolicy(hedge_after=1.0, hedge_quantile=0.9, min_samples=3)
+    assert deadline.hedge_delay() == 1.0
+
+    for _ in range(3):
+        deadline.run("key", lambda: "ok", group="fast_tool")
+    delay = deadline.hedge_delay("fast_tool")
+    assert delay is not None and delay < 0.01
+    # Latencies are kept per tool.
+    assert deadline.hedge_delay("slow_tool") == 1.0
+
+
+async def test_inferences_are_not_hedged_by_default() -> None:
+    """Run-model tools send one inference per call unless hedging is enabled."""
+    async_client = ScriptedAsyncClient([0.1, 0.1])
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=async_client
+    )
+    deadline = DeadlinePolicy(timeout=0.5, hedge_after=0.01)
+
+    assert await _model_tool(toolkit, deadline).ainvoke({}) == "0.1"
+    assert deadline.hedges == 0 and async_client.latencies == [0.1]
+
+
+def test_hedge_bypasses_single_flight() -> None:
+    """A hedged read does not join the slow in-flight read it backs up."""
+    client = FakeClient(latency=0.3)
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=client, single_flight=SingleFlight()
+    )
+    deadline = DeadlinePolicy(timeout=1.0, hedge_after=0.02)
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0xabc",
+        tool_name="workflow_tool",
+        tool_description="Reads a workflow",
+        deadline=deadline,
+    )
+
+    tool.invoke({})
+
+    assert deadline.hedges == 1 and len(client.read_calls) == 2
+
+
+async def test_read_workflow_deadline_fallback() -> None:
+    """Read-workflow tools support the same deadline handling."""
+    async_client = FakeAsyncClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=async_client
+    )
+    markers: List[Dict[str, Any]] = []
+
+    def marker(output: Any, age: float) -> str:
+        markers.append({"output": output, "age": age})
+        return f"stale {output}"
+
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0xabc",
+        tool_name="workflow_tool",
+        tool_description="Reads a workflow",
+        output_formatter=lambda output: str(output.numbers["regression_output"][0]),
+        deadline=DeadlinePolicy(timeout=0.05, fallback=True, stale_marker=marker),
+    )
+
+    assert await tool.ainvoke({}) == "0.25"
+    async_client.latency = 0.3
+    assert await tool.ainvoke({}) == "stale 0.25"
+    assert markers[0]["output"] == "0.25"
+
+
+def test_invalid_policies_are_rejected() -> None:
+    with pytest.raises(ValueError, match="fallback requires a timeout"):
+        DeadlinePolicy(fallback=True)
+    with pytest.raises(ValueError, match="hedge_quantile"):
+        DeadlinePolicy(hedge_quantile=1.5)
+    with pytest.raises(ValueError, match="max_last_good"):
+        DeadlinePolicy(max_last_good=0)
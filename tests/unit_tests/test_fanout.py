@@ -0,0 +1,166 @@
+"""Unit testing for concurrent invocation of toolkit tools."""
+
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import pytest
+from langchain_core.tools import BaseTool, StructuredTool
+
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+def _sleep_tool(name: str, latency: float, fail: bool = False) -> BaseTool:
+    def run() -> str:
+        time.sleep(latency)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return name
+
+    async def arun() -> str:
+        await asyncio.sleep(latency)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return name
+
+    return StructuredTool.from_function(
+        func=run, coroutine=arun, name=name, description=f"Returns {name}"
+    )
+
+
+def _toolkit(latency: float) -> OpenGradientToolkit:
+    toolkit = OpenGradientToolkit(
+        private_key="test_key",
+        client=FakeClient(latency=latency),
+        async_client=FakeAsyncClient(latency=latency),
+    )
+    for index in range(5):
+        toolkit.add_tool(
+            toolkit.create_read_workflow_tool(
+                workflow_contract_address=f"0x{index}",
+                tool_name=f"forecast_{index}",
+                tool_description="Reads a forecast",
+            )
+        )
+    return toolkit
+
+
+def test_invoke_tools_runs_concurrently_in_order() -> None:
+    """Wall-clock time is close to the slowest call and results keep order."""
+    toolkit = _toolkit(latency=0.05)
+    calls: List[Any] = [(f"forecast_{index}", {}) for index in range(5)]
+    calls.append((_sleep_tool("slow", 0.1), {}))
+
+    start = time.perf_counter()
+    results = toolkit.invoke_tools(calls, max_concurrency=10)
+    elapsed = time.perf_counter() - start
+
+    assert [result.tool_name for result in results] == [
+        *(f"forecast_{index}" for index in range(5)),
+        "slow",
+    ]
+    assert all(result.ok for result in results)
+    assert results[-1].output == "slow"
+    assert elapsed < 0.1 + 0.1
+
+
+def test_invoke_tools_reports_partial_failures_and_timeouts() -> None:
+    """Failures and timeouts are reported per item."""
+    toolkit = _toolkit(latency=0.0)
+    calls: List[Any] = [
+        (_sleep_tool("ok", 0.01), {}),
+        (_sleep_tool("boom", 0.01, fail=True), {}),
+        (_sleep_tool("hang", 0.4), {}),
+    ]
+
+    start = time.perf_counter()
+    results = toolkit.invoke_tools(calls, timeout=0.1)
+
+    assert time.perf_counter() - start < 0.5
+    assert results[0].output == "ok"
+    assert isinstance(results[1].error, RuntimeError)
+    assert isinstance(results[2].error, TimeoutError)
+    assert not results[2].ok
+
+
+def test_invoke_tools_bounds_concurrency() -> None:
+    """No more than max_concurrency calls run at once."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run() -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return "done"
+
+    tool = StructuredTool.from_function(func=run, name="count", description="Count")
+    toolkit = _toolkit(latency=0.0)
+    results = toolkit.invoke_tools([(tool, {}) for _ in range(12)], max_concurrency=3)
+
+    assert [result.output for result in results] == ["done"] * 12
+    assert peak == 3
+
+
+def test_timed_out_calls_free_their_slot() -> None:
+    """Calls queued behind a timed-out call start once it times out."""
+    toolkit = _toolkit(latency=0.0)
+    calls: List[Any] = [(_sleep_tool("hang", 0.5), {})]
+    calls += [(_sleep_tool(f"quick_{i}", 0.01), {}) for i in range(3)]
+
+    start = time.perf_counter()
+    results = toolkit.invoke_tools(calls, max_concurrency=1, timeout=0.05)
+
+    assert time.perf_counter() - start < 0.3
+    assert isinstance(results[0].error, TimeoutError)
+    assert [result.output for result in results[1:]] == [f"quick_{i}" for i in range(3)]
+
+
+def test_invoke_tools_rejects_unknown_names() -> None:
+    """Tool names must refer to tools in the toolkit."""
+    toolkit = _toolkit(latency=0.0)
+    with pytest.raises(ValueError, match="not in the toolkit"):
+        toolkit.invoke_tools([("missing", {})])
+    with pytest.raises(ValueError, match="max_concurrency"):
+        toolkit.invoke_tools([("forecast_0", {})], max_concurrency=0)
+
+
+async def test_ainvoke_tools_runs_concurrently() -> None:
+    """Async fan-out overlaps calls and isolates failures and timeouts."""
+    toolkit = _toolkit(latency=0.05)
+    calls: List[Any] = [(f"forecast_{index % 5}", {}) for index in range(20)]
+    calls += [
+        (_sleep_tool("boom", 0.01, fail=True), {}),
+        (_sleep_tool("hang", 0.4), {}),
+    ]
+
+    start = time.perf_counter()
+    results = await toolkit.ainvoke_tools(calls, max_concurrency=32, timeout=0.2)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert all(result.ok for result in results[:20])
+    assert isinstance(results[20].error, RuntimeError)
+    assert isinstance(results[21].error, TimeoutError)
+    fake_client = toolkit.async_client
+    assert isinstance(fake_client, FakeAsyncClient)
+    assert fake_client.max_in_flight == 20
+
+
+async def test_ainvoke_tools_bounds_concurrency() -> None:
+    """The async fan-out respects max_concurrency."""
+    toolkit = _toolkit(latency=0.01)
+    calls: List[Any] = [("forecast_0", {}) for _ in range(10)]
+    results = await toolkit.ainvoke_tools(calls, max_concurrency=4)
+
+    assert [result.output for result in results] == [results[0].output] * 10
+    fake_client = toolkit.async_client
+    assert isinstance(fake_client, FakeAsyncClient)
+    assert fake_client.max_in_flight == 4
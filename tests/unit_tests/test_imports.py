@@ -0,0 +1,48 @@
+"""Import-time regression tests for the langchain_opengradient package."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+import langchain_opengradient
+
+_spec = importlib.util.spec_from_file_location(
+    "check_imports", Path(__file__).parents[2] / "scripts" / "check_imports.py"
+)
+assert _spec is not None and _spec.loader is not None
+check_imports = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_imports)
+
+# Generous budget for `import langchain_opengradient`; it only loads metadata.
+IMPORT_BUDGET_MS = 250
+
+
+def test_package_import_within_budget() -> None:
+    """Importing the package stays cheap and does not load the OpenGradient SDK."""
+    assert check_imports.check_import_budget(
+        "import langchain_opengradient", IMPORT_BUDGET_MS
+    )
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from langchain_opengradient import OpenGradientToolkit",
+        "from langchain_opengradient import InferenceCache, WorkflowResultCache",
+        "import langchain_opengradient.toolkits",
+    ],
+)
+def test_heavy_dependencies_are_deferred(statement: str) -> None:
+    """The SDK, web3 and numpy are only loaded when a toolkit is created."""
+    assert check_imports.loaded_modules(statement, check_imports.HEAVY_MODULES) == []
+
+
+def test_lazy_attributes() -> None:
+    """Public names resolve on first access and unknown names raise."""
+    from langchain_opengradient.toolkits import OpenGradientToolkit
+
+    assert langchain_opengradient.OpenGradientToolkit is OpenGradientToolkit
+    assert set(langchain_opengradient.__all__) <= set(dir(langchain_opengradient))
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        langchain_opengradient.Missing
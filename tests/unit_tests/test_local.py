@@ -0,0 +1,164 @@
+"""Unit testing for the local model store and on-host inference backend."""
+
+from pathlib import Path
+
+import numpy as np
+import opengradient as og  # type: ignore
+import pytest
+
+from langchain_opengradient.local import (
+    LOCAL_TRANSACTION_HASH,
+    LocalInferenceBackend,
+    LocalModelStore,
+)
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+def _double_model() -> bytes:
+    """ONNX model computing Y = 2 * X for a float tensor X of shape [N]."""
+    onnx = pytest.importorskip("onnx")
+    helper = onnx.helper
+    graph = helper.make_graph(
+        [helper.make_node("Mul", ["X", "two"], ["Y"])],
+        "double",
+        [helper.make_tensor_value_info("X", onnx.TensorProto.FLOAT, ["N"])],
+        [helper.make_tensor_value_info("Y", onnx.TensorProto.FLOAT, ["N"])],
+        [
+            helper.make_tensor(
+                "two", onnx.TensorProto.FLOAT, [], np.float32(2.0).tobytes(), raw=True
+            )
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    return model.SerializeToString()
+
+
+def test_store_is_content_addressed(tmp_path: Path) -> None:
+    """Equal models under different CIDs share one file until both are removed."""
+    store = LocalModelStore(tmp_path)
+    first = store.add("QmFirst", b"model bytes")
+    second = store.add("QmSecond", b"model bytes")
+
+    assert first == second
+    assert "QmFirst" in store and "QmMissing" not in store
+    assert store.path("QmSecond") == first
+
+    # Lookups are cached until refreshed.
+    (tmp_path / "cids" / "QmFirst").unlink()
+    assert "QmFirst" in store
+    store.refresh()
+    assert "QmFirst" not in store
+    store.add("QmFirst", b"model bytes")
+
+    store.remove("QmFirst")
+    assert "QmFirst" not in store
+    assert first.exists()
+    store.remove("QmSecond")
+    assert not first.exists()
+
+    with pytest.raises(ValueError, match="Invalid model CID"):
+        store.add("../escape", b"model bytes")
+
+
+def test_backend_runs_stored_models(tmp_path: Path) -> None:
+    """Stored VANILLA models run locally and return an InferenceResult."""
+    pytest.importorskip("onnxruntime")
+    store = LocalModelStore(tmp_path)
+    store.add("QmDouble", _double_model())
+    backend = LocalInferenceBackend(store)
+
+    assert backend.can_run("QmDouble", og.InferenceMode.VANILLA)
+    assert not backend.can_run("QmDouble", og.InferenceMode.ZKML)
+    assert not backend.can_run("QmMissing", og.InferenceMode.VANILLA)
+
+    result = backend.infer("QmDouble", og.InferenceMode.VANILLA, {"X": [1, 2.5]})
+    assert result.transaction_hash == LOCAL_TRANSACTION_HASH
+    np.testing.assert_allclose(result.model_output["Y"], [2.0, 5.0])
+
+    with pytest.raises(ValueError, match="expects input 'X'"):
+        backend.infer("QmDouble", og.InferenceMode.VANILLA, {"Z": [1.0]})
+
+
+def test_backend_rejects_corrupted_models(tmp_path: Path) -> None:
+    """A stored file that no longer matches its digest is not loaded."""
+    pytest.importorskip("onnxruntime")
+    store = LocalModelStore(tmp_path)
+    path = store.add("QmDouble", _double_model())
+    path.write_bytes(b"corrupted")
+
+    with pytest.raises(ValueError, match="does not match its digest"):
+        LocalInferenceBackend(store).infer(
+            "QmDouble", og.InferenceMode.VANILLA, {"X": [1.0]}
+        )
+
+
+def test_external_data_is_stored_with_the_model(tmp_path: Path) -> None:
+    """Weights saved as external data are stored next to the model and loaded."""
+    pytest.importorskip("onnxruntime")
+    onnx = pytest.importorskip("onnx")
+    model = onnx.load_from_string(_double_model())
+    source = tmp_path / "source"
+    source.mkdir()
+    onnx.save_model(
+        model,
+        str(source / "double.onnx"),
+        save_as_external_data=True,
+        location="weights.bin",
+        size_threshold=0,
+    )
+
+    store = LocalModelStore(tmp_path / "store")
+    path = store.add("QmDouble", source / "double.onnx")
+    assert sorted(store.files("QmDouble")) == ["model.onnx", "weights.bin"]
+
+    (source / "weights.bin").unlink()
+    backend = LocalInferenceBackend(store)
+    result = backend.infer("QmDouble", og.InferenceMode.VANILLA, {"X": [1.5]})
+    np.testing.assert_allclose(result.model_output["Y"], [3.0])
+
+    (path.parent / "weights.bin").write_bytes(b"corrupted")
+    with pytest.raises(ValueError, match="does not match its digest"):
+        LocalInferenceBackend(store).infer(
+            "QmDouble", og.InferenceMode.VANILLA, {"X": [1.0]}
+        )
+    with pytest.raises(ValueError, match="Invalid external data location"):
+        store.add("QmOther", b"model", external_data={"../weights.bin": b""})
+
+
+async def test_toolkit_routes_vanilla_inferences_locally(tmp_path: Path) -> None:
+    """VANILLA inferences of stored models skip the network; others use it."""
+    pytest.importorskip("onnxruntime")
+    store = LocalModelStore(tmp_path)
+    store.add("QmDouble", _double_model())
+    client, async_client = FakeClient(), FakeAsyncClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key",
+        client=client,
+        async_client=async_client,
+        local_backend=LocalInferenceBackend(store),
+    )
+
+    vanilla = toolkit.create_run_model_tool(
+        model_cid="QmDouble",
+        tool_name="double",
+        model_input_provider=lambda: {"X": [3.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        tool_description="Doubles a number",
+    )
+    zkml = toolkit.create_run_model_tool(
+        model_cid="QmDouble",
+        tool_name="double_zkml",
+        model_input_provider=lambda: {"X": [3.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        tool_description="Doubles a number with a proof",
+        inference_mode=og.InferenceMode.ZKML,
+    )
+
+    assert vanilla.invoke({}) == "6.0"
+    assert await vanilla.ainvoke({}) == "6.0"
+    assert client.infer_calls == [] and async_client.infer_calls == []
+
+    assert zkml.invoke({}) == "0.5"
+    assert len(client.infer_calls) == 1
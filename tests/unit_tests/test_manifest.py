@@ -0,0 +1,159 @@
+"""Unit testing for declarative tool manifests."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+from langchain_opengradient import manifest
+from langchain_opengradient.manifest import load_manifest, parse_manifest
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeClient
+
+MANIFEST_YAML = """
+tools:
+  - type: model
+    name: volatility
+    model_cid: QmTest
+    input_provider: tests.unit_tests.test_manifest:provider
+    output_formatter: tests.unit_tests.test_manifest:formatter
+    input_schema: tests.unit_tests.test_manifest:WindowSchema
+    inference_mode: VANILLA
+  - type: workflow
+    name: forecast
+    contract_address: "0xabc"
+    description: Reads the forecast
+    output_formatter: tests.unit_tests.test_manifest:workflow_formatter
+"""
+
+
+class WindowSchema(BaseModel):
+    window: int = 10
+
+
+def provider(window: int = 10) -> Dict[str, Any]:
+    return {"X": [float(window)]}
+
+
+def formatter(result: Any) -> str:
+    return str(result.model_output["Y"][0])
+
+
+def workflow_formatter(output: Any) -> str:
+    return str(output.numbers["regression_output"][0])
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text)
+    return path
+
+
+def test_tools_are_built_on_first_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Manifest tools are only built when they are looked up."""
+    resolve_reference = manifest.resolve_reference
+    resolved: List[str] = []
+
+    def counting_resolve(reference: str) -> Any:
+        resolved.append(reference)
+        return resolve_reference(reference)
+
+    monkeypatch.setattr(manifest, "resolve_reference", counting_resolve)
+    client = FakeClient()
+    toolkit = OpenGradientToolkit.from_manifest(
+        _write(tmp_path / "tools.yaml", MANIFEST_YAML),
+        private_key="test_key",
+        client=client,
+    )
+
+    assert toolkit.tool_names() == ["volatility", "forecast"]
+    assert resolved == []
+
+    tool = toolkit.get_tool("volatility")
+    assert tool.invoke({"window": 4}) == "0.5"
+    assert client.infer_calls[0][2]["X"].tolist() == [4.0]
+    assert len(resolved) == 3
+    assert toolkit.get_tool("volatility") is tool
+
+    tools = toolkit.get_tools()
+    assert [t.name for t in tools] == ["volatility", "forecast"]
+    assert tools[1].invoke({}) == "0.25"
+    assert len(resolved) == 4
+
+
+def test_unbuilt_tools_are_removed_without_building(tmp_path: Path) -> None:
+    """Removing or replacing a lazy tool does not build it."""
+    built: List[str] = []
+    toolkit = OpenGradientToolkit.from_manifest(
+        _write(tmp_path / "tools.yaml", MANIFEST_YAML), private_key="test_key"
+    )
+
+    def broken() -> BaseTool:
+        built.append("broken")
+        raise ImportError("heavy dependency is not installed")
+
+    toolkit.add_lazy_tools({"broken": broken})
+
+    assert toolkit.remove_tool("broken") is None
+    replacement = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0xdef",
+        tool_name="forecast",
+        tool_description="Reads another forecast",
+    )
+    assert toolkit.replace_tool(replacement) is None
+
+    assert built == []
+    assert toolkit.tool_names() == ["volatility", "forecast"]
+    assert toolkit.get_tool("forecast") is replacement
+    with pytest.raises(ValueError, match="not in the toolkit"):
+        toolkit.remove_tool("broken")
+
+
+def test_manifest_is_validated() -> None:
+    """Manifests with errors are rejected before any tool is built."""
+    workflow = {
+        "type": "workflow",
+        "name": "forecast",
+        "contract_address": "0x1",
+        "description": "d",
+    }
+    with pytest.raises(ValueError, match="defined more than once"):
+        parse_manifest(json.dumps({"tools": [workflow, workflow]}))
+
+    bad_reference = {
+        "type": "model",
+        "name": "m",
+        "model_cid": "Qm",
+        "input_provider": "not a reference",
+        "output_formatter": "pkg:fn",
+    }
+    with pytest.raises(ValueError, match="input_provider"):
+        parse_manifest(json.dumps({"tools": [bad_reference]}))
+
+    with pytest.raises(ValueError, match="unknown"):
+        parse_manifest("tools:\n  - {type: workflow, name: w, unknown: 1}", "yaml")
+
+    single = parse_manifest(json.dumps({"tools": [workflow]}))
+    toolkit = OpenGradientToolkit(private_key="test_key", client=FakeClient())
+    toolkit.add_manifest(single)
+    with pytest.raises(ValueError, match="already in the toolkit"):
+        toolkit.add_manifest(single)
+
+
+def test_parsed_manifests_are_cached(tmp_path: Path) -> None:
+    """A manifest file is parsed once per version."""
+    path = _write(tmp_path / "tools.yml", MANIFEST_YAML)
+
+    first = load_manifest(path)
+    assert load_manifest(str(path)) is first
+
+    _write(path, MANIFEST_YAML.replace("Reads the forecast", "Reads it"))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    second = load_manifest(path)
+    assert second is not first
+    assert second.tools[1].description == "Reads it"
@@ -0,0 +1,104 @@
+"""Unit testing for per-phase latency metrics of tool calls."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from langchain_opengradient.metrics import LatencyHistogram, ToolMetrics
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+def test_histogram_quantiles() -> None:
+    """Quantiles are bucket upper bounds capped at the largest observation."""
+    histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+    for _ in range(98):
+        histogram.observe(0.005)
+    histogram.observe(0.05)
+    histogram.observe(0.5, failed=True)
+
+    assert histogram.count == 100
+    assert histogram.errors == 1
+    assert histogram.counts == [98, 1, 1, 0]
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.99) == 0.1
+    assert histogram.quantile(1.0) == 0.5
+    assert LatencyHistogram().quantile(0.99) == 0.0
+
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+    with pytest.raises(ValueError):
+        ToolMetrics(buckets=(1.0, 0.5))
+
+
+def _toolkit(metrics: ToolMetrics) -> OpenGradientToolkit:
+    return OpenGradientToolkit(
+        private_key="test_key",
+        client=FakeClient(latency=0.02),
+        async_client=FakeAsyncClient(latency=0.02),
+        metrics=metrics,
+    )
+
+
+def test_run_model_tool_records_phases() -> None:
+    """Each phase of a run-model tool call is timed separately."""
+    metrics = ToolMetrics()
+    events: List[Tuple[str, str, Optional[BaseException]]] = []
+    metrics.add_hook(lambda tool, phase, _, error: events.append((tool, phase, error)))
+
+    def slow_provider() -> Dict[str, Any]:
+        time.sleep(0.05)
+        return {"X": [1.0]}
+
+    tool = _toolkit(metrics).create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=slow_provider,
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        tool_description="Test model tool",
+    )
+    tool.invoke({})
+
+    phases = metrics.snapshot()["model_tool"]
+    assert set(phases) == {"input", "inference", "format", "total"}
+    assert phases["input"].max >= 0.05
+    assert phases["inference"].max >= 0.02
+    assert phases["total"].max >= phases["input"].max + phases["inference"].max
+    assert [phase for _, phase, _ in events] == [
+        "input",
+        "inference",
+        "format",
+        "total",
+    ]
+
+
+async def test_async_read_workflow_tool_records_errors() -> None:
+    """A failing phase is counted as an error of that phase and of the call."""
+    metrics = ToolMetrics()
+
+    async def failing_formatter(output: Any) -> str:
+        await asyncio.sleep(0)
+        raise ValueError("bad output")
+
+    tool = _toolkit(metrics).create_read_workflow_tool(
+        workflow_contract_address="0x123",
+        tool_name="workflow_tool",
+        tool_description="Test workflow tool",
+        output_formatter=failing_formatter,
+    )
+    with pytest.raises(ValueError, match="bad output"):
+        await tool.ainvoke({})
+
+    read = metrics.histogram("workflow_tool", "read")
+    formatted = metrics.histogram("workflow_tool", "format")
+    total = metrics.histogram("workflow_tool", "total")
+    assert read is not None and formatted is not None and total is not None
+    assert (read.count, read.errors) == (1, 0)
+    assert read.max >= 0.02
+    assert (formatted.count, formatted.errors) == (1, 1)
+    assert (total.count, total.errors) == (1, 1)
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,144 @@
+"""Unit testing for latency-budget driven inference mode selection."""
+
+import time
+from typing import List
+
+import opengradient as og  # type: ignore
+import pytest
+
+from langchain_opengradient.modes import (
+    InferenceModePolicy,
+    ModeDecision,
+    RollingLatencies,
+)
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeClient
+
+VANILLA, TEE, ZKML = (
+    og.InferenceMode.VANILLA,
+    og.InferenceMode.TEE,
+    og.InferenceMode.ZKML,
+)
+
+
+def _latencies() -> RollingLatencies:
+    latencies = RollingLatencies()
+    for _ in range(10):
+        latencies.observe("QmTest", VANILLA, 0.1)
+        latencies.observe("QmTest", TEE, 3.0)
+    return latencies
+
+
+def test_policy_picks_most_trusted_affordable_mode() -> None:
+    """Modes are tried from most trusted down and fall back within budget."""
+    latencies = _latencies()
+    assert latencies.quantile("QmTest", TEE, 0.95) == 3.0
+    assert latencies.quantile("QmOther", TEE, 0.95) is None
+
+    policy = InferenceModePolicy(latency_budget=5.0, modes=[VANILLA, TEE])
+    decision = policy.choose("tool", "QmTest", latencies)
+    assert (decision.mode, decision.reason, decision.fallback) == (
+        TEE,
+        "within_budget",
+        False,
+    )
+
+    decision = policy.choose("tool", "QmTest", latencies, elapsed=3.0)
+    assert (decision.mode, decision.reason, decision.fallback) == (
+        VANILLA,
+        "within_budget",
+        True,
+    )
+    assert decision.estimate == 0.1 and decision.remaining == 2.0
+
+    # Without latencies the fastest mode is used.
+    decision = policy.choose("tool", "QmOther", latencies)
+    assert (decision.mode, decision.reason) == (VANILLA, "no_samples")
+
+    strict = InferenceModePolicy(latency_budget=1.0, min_trust=TEE)
+    assert strict.candidates == [ZKML, TEE]
+    latencies.observe("QmTest", ZKML, 60.0)
+    strict.min_samples = 1
+    decision = strict.choose("tool", "QmTest", latencies)
+    assert (decision.mode, decision.reason) == (TEE, "over_budget")
+
+    assert policy.counts == {"TEE": 1, "VANILLA": 2}
+    assert policy.fallbacks == 2 and len(policy.recent_decisions()) == 3
+
+
+def test_cold_start_stays_within_budget() -> None:
+    """Unknown modes are only tried by a bounded share of probing calls."""
+    seconds = {VANILLA: 0.1, TEE: 1.0, ZKML: 30.0}
+    latencies = RollingLatencies(window=5)
+    policy = InferenceModePolicy(latency_budget=2.0, probe_interval=10)
+
+    chosen = []
+    for _ in range(100):
+        mode = policy.choose("tool", "QmTest", latencies).mode
+        latencies.observe("QmTest", mode, seconds[mode])
+        chosen.append(mode)
+
+    assert chosen[:9] == [VANILLA] * 9
+    over_budget = [mode for mode in chosen if seconds[mode] > 2.0]
+    assert len(over_budget) <= 100 // 10 and policy.probes == 10
+    # TEE was learned by probing and is used once it is known to fit.
+    assert chosen[-1] == TEE
+
+
+def test_over_budget_mode_is_probed_again() -> None:
+    """A mode that got faster is used again after probes refresh its latency."""
+    latencies = RollingLatencies(window=5)
+    for _ in range(5):
+        latencies.observe("QmTest", VANILLA, 0.1)
+        latencies.observe("QmTest", TEE, 3.0)
+    policy = InferenceModePolicy(
+        latency_budget=2.0, modes=[VANILLA, TEE], probe_interval=2
+    )
+
+    for _ in range(10):
+        decision = policy.choose("tool", "QmTest", latencies)
+        latencies.observe("QmTest", decision.mode, 0.1)
+
+    assert policy.probes == 5
+    assert policy.choose("tool", "QmTest", latencies).reason == "within_budget"
+    assert policy.recent_decisions()[-1].mode == TEE
+
+    aging = RollingLatencies(max_age=0.01)
+    aging.observe("QmTest", TEE, 3.0)
+    time.sleep(0.02)
+    assert aging.count("QmTest", TEE) == 0
+
+
+def test_tool_uses_and_records_policy_decisions() -> None:
+    """Tool calls run in the chosen mode and feed the toolkit's statistics."""
+    decisions: List[ModeDecision] = []
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=client, inference_latencies=_latencies()
+    )
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="volatility",
+        model_input_provider=lambda: {"X": [1.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        mode_policy=InferenceModePolicy(
+            latency_budget=1.0, modes=[VANILLA, TEE], on_decision=decisions.append
+        ),
+    )
+
+    assert tool.invoke({}) == "0.5"
+    assert [call[1] for call in client.infer_calls] == [VANILLA]
+    assert [(d.tool_name, d.mode, d.fallback) for d in decisions] == [
+        ("volatility", VANILLA, True)
+    ]
+    assert toolkit.inference_latencies.count("QmTest", VANILLA) == 11
+
+    with pytest.raises(ValueError, match="either inference_mode or mode_policy"):
+        toolkit.create_run_model_tool(
+            model_cid="QmTest",
+            tool_name="fixed",
+            model_input_provider=lambda: {"X": [1.0]},
+            model_output_formatter=str,
+            inference_mode=TEE,
+            mode_policy=InferenceModePolicy(latency_budget=1.0),
+        )
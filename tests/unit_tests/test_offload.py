@@ -0,0 +1,123 @@
+"""Unit testing for offloading providers and formatters to a process pool."""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import numpy as np
+import pytest
+
+from langchain_opengradient.offload import ProcessOffload
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+SHM_DIR = Path("/dev/shm")
+
+
+# Offloaded callables are pickled by reference, so they live at module level.
+def rolling_features(window: int = 4) -> Dict[str, Any]:
+    closes = np.arange(1000, dtype=np.float64)
+    means = np.convolve(closes, np.ones(window) / window, mode="valid")
+    return {"X": means.astype(np.float32), "pid": np.array([os.getpid()])}
+
+
+def format_with_pid(result: Any) -> str:
+    return f"{float(result.model_output['Y'][0])}@{os.getpid()}"
+
+
+def double(values: np.ndarray) -> np.ndarray:
+    return values * 2
+
+
+def first_half(values: np.ndarray) -> np.ndarray:
+    return values[: len(values) // 2]
+
+
+@pytest.fixture(scope="module")
+def offload() -> Iterator[ProcessOffload]:
+    offload = ProcessOffload(max_workers=2, shm_threshold=1024)
+    yield offload
+    offload.shutdown()
+
+
+def _shm_blocks() -> set:
+    if not SHM_DIR.is_dir():
+        return set()
+    return {name for name in os.listdir(SHM_DIR) if name.startswith("psm_")}
+
+
+def test_arrays_move_through_shared_memory(offload: ProcessOffload) -> None:
+    """Large arrays go both ways through shared memory blocks that are cleaned up."""
+    before = _shm_blocks()
+    values = np.arange(100_000, dtype=np.float64)
+
+    doubled = offload.run(double, values)
+    np.testing.assert_array_equal(doubled, values * 2)
+    assert isinstance(doubled.base, mmap.mmap)
+
+    # A result that is a view of an input is copied out before the input is freed.
+    np.testing.assert_array_equal(offload.run(first_half, values), values[:50_000])
+    small = offload.run(double, np.ones(3))
+    assert not isinstance(small.base, mmap.mmap)
+
+    del doubled
+    assert _shm_blocks() <= before
+
+
+def test_run_model_tool_offloads_provider_and_formatter(
+    offload: ProcessOffload,
+) -> None:
+    """The provider and formatter of a sync tool run in worker processes."""
+    client = FakeClient()
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=rolling_features,
+        model_output_formatter=format_with_pid,
+        offload=offload,
+    )
+
+    output = tool.invoke({})
+
+    value, pid = output.split("@")
+    assert value == "0.5" and int(pid) != os.getpid()
+    model_input = client.infer_calls[0][2]
+    assert model_input["X"].shape == (997,)
+    assert int(model_input["pid"][0]) != os.getpid()
+
+
+async def test_async_tool_awaits_offloaded_calls(offload: ProcessOffload) -> None:
+    """Async invocations await the pool instead of blocking the event loop."""
+    async_client = FakeAsyncClient()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=async_client
+    )
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=rolling_features,
+        model_output_formatter=format_with_pid,
+        offload=offload,
+    )
+
+    output = await tool.ainvoke({})
+
+    assert int(output.split("@")[1]) != os.getpid()
+    assert async_client.infer_calls[0][2]["X"].dtype == np.float32
+
+
+def test_offload_rejects_async_callables() -> None:
+    async def provider() -> Dict[str, Any]:
+        return {"X": [1.0]}
+
+    toolkit = OpenGradientToolkit(private_key="test_key", client=FakeClient())
+    with pytest.raises(ValueError, match="offload requires a synchronous"):
+        toolkit.create_run_model_tool(
+            model_cid="QmTest",
+            tool_name="model_tool",
+            model_input_provider=provider,
+            model_output_formatter=str,
+            offload=ProcessOffload(),
+        )
@@ -0,0 +1,170 @@
+"""Unit testing for the SQLite result store shared between processes."""
+
+import sqlite3
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import opengradient as og  # type: ignore
+from opengradient import InferenceResult, ModelOutput  # type: ignore
+
+from langchain_opengradient.caching import InferenceCache, WorkflowResultCache
+from langchain_opengradient.persistent import SharedResultStore
+
+REPO_ROOT = Path(__file__).parents[2]
+
+
+def _result(value: float = 0.5) -> InferenceResult:
+    return InferenceResult(
+        "0xfake",
+        {
+            "Y": np.array([[value, 2.0]], dtype=np.float32),
+            "ids": np.arange(3, dtype=np.int64),
+            "labels": np.array(["up", "down"]),
+        },
+    )
+
+
+def test_values_round_trip_without_pickle(tmp_path: Path) -> None:
+    """Inference results and workflow outputs keep their dtypes and shapes."""
+    store = SharedResultStore(tmp_path / "results.db")
+    output = ModelOutput(
+        numbers={"regression_output": np.array([0.25])},
+        strings={"label": np.array(["buy"])},
+        jsons={"meta": np.array({"source": "oracle"})},
+        is_simulation_result=True,
+    )
+
+    assert store.put("inference", _result())
+    assert store.put("workflow", output)
+    assert not store.put("other", {"not": "storable"})
+
+    age, result = store.get("inference")  # type: ignore[misc]
+    assert age >= 0 and result.transaction_hash == "0xfake"
+    for name, expected in _result().model_output.items():
+        assert result.model_output[name].dtype == expected.dtype
+        np.testing.assert_array_equal(result.model_output[name], expected)
+
+    _, stored_output = store.get("workflow")  # type: ignore[misc]
+    assert stored_output.is_simulation_result is True
+    assert stored_output.strings["label"].tolist() == ["buy"]
+    assert stored_output.jsons["meta"].tolist() == {"source": "oracle"}
+    assert store.get("missing") is None
+
+
+def test_inference_caches_share_results(tmp_path: Path) -> None:
+    """A result cached by one worker is a hit for another using the store."""
+    key = InferenceCache.make_key("QmTest", og.InferenceMode.VANILLA, {"X": [1.0]})
+    first = InferenceCache(store=SharedResultStore(tmp_path / "results.db"))
+    second = InferenceCache(store=SharedResultStore(tmp_path / "results.db"))
+    first.put(key, _result())
+
+    result = second.get(key)
+    assert result is not None
+    assert not result.model_output["Y"].flags.writeable
+    assert second.stats.store_hits == 1 and len(second) == 1
+    assert second.get(key) is result
+
+    expired = InferenceCache(ttl=0, store=SharedResultStore(tmp_path / "results.db"))
+    assert expired.get(key) is None
+
+
+def test_results_are_shared_across_processes(tmp_path: Path) -> None:
+    """A worker process reads what another process wrote."""
+    path = tmp_path / "results.db"
+    SharedResultStore(path).put("shared", _result(7.0))
+
+    code = (
+        "from langchain_opengradient.persistent import SharedResultStore\n"
+        f"_, result = SharedResultStore({str(path)!r}).get('shared')\n"
+        "print(result.model_output['Y'][0, 0])\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "7.0"
+
+
+def test_workflow_caches_share_reads_with_their_age(tmp_path: Path) -> None:
+    """A workflow read by one worker is served to another without fetching."""
+    output = ModelOutput(
+        numbers={"regression_output": np.array([0.25])},
+        strings={},
+        jsons={},
+        is_simulation_result=False,
+    )
+    fetches = []
+
+    def fetch() -> ModelOutput:
+        fetches.append(1)
+        return output
+
+    first = WorkflowResultCache(store=SharedResultStore(tmp_path / "results.db"))
+    second = WorkflowResultCache(store=SharedResultStore(tmp_path / "results.db"))
+    first.get("0xabc", fetch)
+    shared = second.get("0xabc", fetch)
+
+    assert fetches == [1]
+    np.testing.assert_array_equal(shared.numbers["regression_output"], [0.25])
+    assert second.stats.store_hits == 1 and second.stats.hits == 1
+
+    second.invalidate("0xabc")
+    assert WorkflowResultCache(store=second.store).get("0xabc", fetch) is output
+    assert fetches == [1, 1]
+
+
+def test_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    """The store stays within its byte budget, dropping the oldest entries."""
+    store = SharedResultStore(tmp_path / "results.db")
+    store.put("probe", _result())
+    entry_bytes = store.nbytes
+    store.max_bytes = entry_bytes * 3
+
+    for index in range(5):
+        store.put(f"key-{index}", _result(float(index)))
+
+    assert len(store) == 3
+    assert store.nbytes <= store.max_bytes
+    assert store.get("key-0") is None and store.get("key-4") is not None
+
+
+def test_concurrent_writers(tmp_path: Path) -> None:
+    """Threads writing and reading the same store do not fail."""
+    store = SharedResultStore(tmp_path / "results.db")
+
+    def work(worker: int) -> None:
+        for index in range(20):
+            assert store.put(f"{worker}-{index}", _result(float(index)))
+            assert store.get(f"{worker}-{index}") is not None
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 160 and store.errors == 0
+
+
+def test_busy_store_does_not_fail_invalidation(tmp_path: Path) -> None:
+    """Deletes on a locked database are counted as errors instead of raising."""
+    store = SharedResultStore(tmp_path / "results.db", timeout=0.05)
+    store.put("key", _result())
+    writer = sqlite3.connect(tmp_path / "results.db", isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        store.delete("key")
+        store.clear()
+        assert store.get("key") is not None and store.errors == 2
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    store.delete("key")
+    assert store.get("key") is None
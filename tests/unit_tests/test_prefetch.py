@@ -0,0 +1,117 @@
+"""Unit testing for background prefetching of model input data."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from langchain_opengradient.prefetch import InputPrefetcher
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+def _wait_for(condition: Any, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_tool_calls_use_prefetched_snapshot() -> None:
+    """Tool calls do not wait for the provider once a snapshot exists."""
+    fetches: List[float] = []
+
+    def slow_provider() -> Dict[str, Any]:
+        time.sleep(0.05)
+        fetches.append(time.monotonic())
+        return {"X": [float(len(fetches))]}
+
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=FakeAsyncClient()
+    )
+    prefetcher = InputPrefetcher(interval=0.02)
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=slow_provider,
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        input_prefetcher=prefetcher,
+    )
+    try:
+        _wait_for(lambda: prefetcher.refreshes >= 1)
+
+        start = time.perf_counter()
+        assert tool.invoke({}) == "0.5"
+        assert time.perf_counter() - start < 0.05
+        # The background thread keeps refreshing on its interval.
+        _wait_for(lambda: prefetcher.refreshes >= 3)
+    finally:
+        prefetcher.stop()
+
+    with pytest.raises(ValueError, match="already bound"):
+        prefetcher.bind(slow_provider)
+
+
+async def test_stale_snapshot_is_fetched_inline() -> None:
+    """Snapshots older than max_staleness are replaced before use."""
+    values = iter(range(100))
+    prefetcher = InputPrefetcher(max_staleness=0.05)
+
+    async def provider() -> int:
+        await asyncio.sleep(0)
+        return next(values)
+
+    prefetcher.bind(provider)
+    assert await prefetcher.aget() == 0
+    assert await prefetcher.aget() == 0
+    await asyncio.sleep(0.06)
+    assert await prefetcher.aget() == 1
+
+
+def test_triggered_refresh_and_errors() -> None:
+    """refresh() fetches in the background; failures keep the snapshot."""
+    fail = threading.Event()
+    calls: List[int] = []
+
+    def provider() -> int:
+        if fail.is_set():
+            raise ConnectionError("exchange down")
+        calls.append(1)
+        return len(calls)
+
+    prefetcher = InputPrefetcher()
+    prefetcher.bind(provider)
+    try:
+        assert prefetcher.get() == 1
+        prefetcher.refresh()
+        _wait_for(lambda: prefetcher.refreshes == 1)
+        assert prefetcher.get() == 2
+
+        fail.set()
+        prefetcher.refresh()
+        _wait_for(lambda: prefetcher.refresh_errors == 1)
+        assert isinstance(prefetcher.last_error, ConnectionError)
+        assert prefetcher.get() == 2
+    finally:
+        prefetcher.stop()
+
+
+def test_prefetch_requires_provider_without_arguments() -> None:
+    """Providers that take LLM arguments cannot be prefetched."""
+
+    class InputSchema(BaseModel):
+        token: str
+
+    toolkit = OpenGradientToolkit(private_key="test_key", client=FakeClient())
+    with pytest.raises(ValueError, match="without arguments"):
+        toolkit.create_run_model_tool(
+            model_cid="QmTest",
+            tool_name="model_tool",
+            model_input_provider=lambda token: {"X": [1.0]},
+            model_output_formatter=str,
+            tool_input_schema=InputSchema,
+            input_prefetcher=InputPrefetcher(interval=1),
+        )
@@ -0,0 +1,155 @@
+"""Unit testing for recording and replaying tool-call traces."""
+
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+from langchain_opengradient.replay import (
+    TraceRecord,
+    TraceRecorder,
+    load_trace,
+    replay_trace,
+)
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+SCRIPTS = Path(__file__).parents[2] / "scripts"
+
+
+class WindowSchema(BaseModel):
+    window: int
+
+
+def provider(window: int) -> Dict[str, Any]:
+    if window < 0:
+        raise ValueError("window must not be negative")
+    return {"X": [float(window)]}
+
+
+def formatter(result: Any) -> str:
+    return str(result.model_output["Y"][0])
+
+
+def _tool(toolkit: OpenGradientToolkit) -> BaseTool:
+    return toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="volatility",
+        model_input_provider=provider,
+        model_output_formatter=formatter,
+        tool_input_schema=WindowSchema,
+    )
+
+
+@pytest.mark.parametrize("name", ["trace.jsonl", "trace.jsonl.gz"])
+async def test_recorded_calls_are_loaded(tmp_path: Path, name: str) -> None:
+    """Wrapped tools behave as before and record their calls."""
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=FakeClient(), async_client=FakeAsyncClient()
+    )
+    with TraceRecorder(tmp_path / name) as recorder:
+        (tool,) = recorder.wrap_tools([_tool(toolkit)])
+        assert tool.name == "volatility" and tool.args == _tool(toolkit).args
+        assert tool.invoke({"window": 3}) == "0.5"
+        assert await tool.ainvoke({"window": 4}) == "0.5"
+        with pytest.raises(ValueError, match="must not be negative"):
+            tool.invoke({"window": -1})
+    assert recorder.calls == 3
+
+    records = load_trace(tmp_path / name)
+    assert [(r.tool_name, r.args, r.output) for r in records] == [
+        ("volatility", {"window": 3}, "0.5"),
+        ("volatility", {"window": 4}, "0.5"),
+        ("volatility", {"window": -1}, None),
+    ]
+    assert records[2].error == "ValueError: window must not be negative"
+    assert records[0].offset <= records[1].offset <= records[2].offset
+    assert all(r.latency >= 0 for r in records)
+
+
+def test_replay_reports_throughput_and_latency() -> None:
+    """Calls are re-issued at the scaled timing within the concurrency limit."""
+    client = FakeAsyncClient(latency=0.01)
+    toolkit = OpenGradientToolkit(private_key="test_key", async_client=client)
+    records = [
+        TraceRecord(
+            offset=0.1 * i, tool_name="volatility", args={"window": i}, latency=0
+        )
+        for i in range(5)
+    ]
+    records.append(TraceRecord(0.4, "volatility", {"window": -1}, 0))
+
+    report = replay_trace(records, [_tool(toolkit)], speed=4, max_concurrency=2)
+
+    assert report.calls == 6 and report.errors == 1
+    assert report.errors_by_tool == {"volatility": 1}
+    assert 0.1 <= report.seconds < 1.0
+    assert client.max_in_flight <= 2
+    summary = report.summary()
+    assert summary["p50_ms"] >= 10 and summary["calls_per_second"] > 0
+
+    fast = replay_trace(records, [_tool(toolkit)], speed=None, max_concurrency=6)
+    assert fast.seconds < report.seconds
+
+    with pytest.raises(ValueError, match="not available for replay"):
+        replay_trace([TraceRecord(0, "missing", {}, 0)], [_tool(toolkit)])
+
+
+def test_replay_script_writes_json_report(tmp_path: Path, monkeypatch: Any) -> None:
+    """The replay script builds tools from a manifest and replays offline."""
+    monkeypatch.syspath_prepend(str(SCRIPTS))
+    spec = importlib.util.spec_from_file_location("replay", SCRIPTS / "replay.py")
+    assert spec is not None and spec.loader is not None
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    manifest = tmp_path / "tools.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "tools": [
+                    {
+                        "type": "model",
+                        "name": "volatility",
+                        "model_cid": "QmTest",
+                        "input_provider": "tests.unit_tests.test_replay:provider",
+                        "output_formatter": "tests.unit_tests.test_replay:formatter",
+                        "input_schema": "tests.unit_tests.test_replay:WindowSchema",
+                    }
+                ]
+            }
+        )
+    )
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        "\n".join(
+            json.dumps(
+                {
+                    "t": i * 0.01,
+                    "tool": "volatility",
+                    "args": {"window": i},
+                    "latency": 0.1,
+                }
+            )
+            for i in range(10)
+        )
+    )
+    output = tmp_path / "replay.json"
+    argv = [
+        str(trace),
+        "--manifest",
+        str(manifest),
+        "--speed",
+        "0",
+        "--latency",
+        "0.001",
+    ]
+
+    assert script.main([*argv, "--output", str(output)]) == 0
+    results = json.loads(output.read_text())["results"]
+    assert results["calls"] == 10 and results["errors"] == 0
+    assert {"p50_ms", "p90_ms", "p99_ms", "calls_per_second"} <= set(results)
@@ -0,0 +1,111 @@
+"""Unit testing for query-relevant tool selection."""
+
+from typing import List
+
+import pytest
+from langchain_core.tools import BaseTool, StructuredTool
+from pydantic import BaseModel, Field
+
+from langchain_opengradient.search import ToolIndex, tokenize
+from langchain_opengradient.toolkits import OpenGradientToolkit
+
+
+class WindowSchema(BaseModel):
+    lookback_hours: int = Field(description="Hours of OHLC candles to use")
+
+
+def _tool(name: str, description: str) -> BaseTool:
+    return StructuredTool.from_function(
+        func=lambda **_: "", name=name, description=description
+    )
+
+
+CATALOG = [
+    _tool("ETH_Price_Forecast", "Reads latest forecast for ETH price"),
+    _tool("BTC_Price_Forecast", "Reads latest forecast for BTC price"),
+    _tool("eth_usdt_volatility", "Generates volatility measurement for ETH/USDT"),
+    _tool("sui_usdt_trend", "Predicts the 30 minute trend of SUI/USDT"),
+    _tool("wallet_balance", "Returns the token balances held by an address"),
+]
+
+
+def test_index_ranks_and_updates_incrementally() -> None:
+    """Results follow BM25 relevance and reflect added and removed documents."""
+    assert tokenize("getETH_PriceForecasts 30m") == [
+        "eth", "price", "forecast", "30", "m",
+    ]  # fmt: skip
+
+    index = ToolIndex()
+    for tool in CATALOG:
+        index.add(tool.name, tool.description)
+
+    names = [name for name, _ in index.search("ETH price forecast", k=2)]
+    assert names == ["ETH_Price_Forecast", "BTC_Price_Forecast"]
+    assert index.search("what will the SUI trend be")[0][0] == "sui_usdt_trend"
+    assert index.search("unrelated words only") == []
+
+    index.remove("ETH_Price_Forecast")
+    index.add("eth_usdt_volatility", "ETH volatility")
+    assert "ETH_Price_Forecast" not in index and len(index) == 4
+    assert index.search("eth", k=1)[0][0] == "eth_usdt_volatility"
+
+    with pytest.raises(ValueError, match="k must be at least 1"):
+        index.search("eth", k=0)
+
+
+def test_get_tools_returns_relevant_subset() -> None:
+    """get_tools(query=...) returns the top k tools, tracking registry changes."""
+    toolkit = OpenGradientToolkit(private_key="test_key")
+    toolkit.add_tools(CATALOG)
+    toolkit.add_tool(
+        StructuredTool.from_function(
+            func=lambda lookback_hours: "",
+            name="candles",
+            description="Fetches market data",
+            args_schema=WindowSchema,
+        )
+    )
+
+    assert [t.name for t in toolkit.get_tools(query="SUI trend", k=3)] == [
+        "sui_usdt_trend"
+    ]
+    assert [t.name for t in toolkit.get_tools(query="OHLC candles", k=1)] == ["candles"]
+    assert len(toolkit.get_tools()) == 6
+
+    toolkit.remove_tool("sui_usdt_trend")
+    toolkit.replace_tool(_tool("wallet_balance", "Predicts the SUI trend"))
+    assert [t.name for t in toolkit.get_tools(query="SUI trend")] == ["wallet_balance"]
+
+
+def test_query_builds_only_selected_lazy_tools() -> None:
+    """Lazy tools are ranked by description and built only when selected."""
+    built: List[str] = []
+
+    def builder(tool: BaseTool):  # type: ignore[no-untyped-def]
+        def build() -> BaseTool:
+            built.append(tool.name)
+            return tool
+
+        return build
+
+    toolkit = OpenGradientToolkit(private_key="test_key")
+    toolkit.add_lazy_tools(
+        {tool.name: builder(tool) for tool in CATALOG},
+        descriptions={tool.name: tool.description for tool in CATALOG},
+    )
+
+    tools = toolkit.get_tools(query="token balances of my address", k=2)
+    assert [t.name for t in tools] == ["wallet_balance"]
+    assert built == ["wallet_balance"]
+
+
+def test_query_without_terms_returns_first_tools() -> None:
+    """An empty or stop-word-only query returns the first k tools, not none."""
+    toolkit = OpenGradientToolkit(private_key="test_key")
+    toolkit.add_tools(CATALOG)
+
+    first = [tool.name for tool in CATALOG[:2]]
+    assert [t.name for t in toolkit.get_tools(query="", k=2)] == first
+    assert [t.name for t in toolkit.get_tools(query="what is the", k=2)] == first
+    with pytest.raises(ValueError, match="k must be at least 1"):
+        toolkit.get_tools(query="", k=0)
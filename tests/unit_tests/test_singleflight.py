@@ -0,0 +1,139 @@
+"""Unit testing for single-flight deduplication of tool requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, List
+
+import pytest
+
+from langchain_opengradient.singleflight import SingleFlight
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+
+def test_sync_callers_share_one_request() -> None:
+    """Concurrent callers with an equal key wait on one request."""
+    single_flight = SingleFlight()
+    calls: List[int] = []
+    barrier = threading.Barrier(10)
+
+    def request() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    def call(_: int) -> str:
+        barrier.wait()
+        return single_flight.do("key", request)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(call, range(10)))
+
+    assert results == ["result"] * 10
+    assert len(calls) == 1
+    assert (single_flight.requests, single_flight.shared) == (1, 9)
+    assert single_flight.in_flight() == 0
+
+
+def test_sync_callers_share_exceptions() -> None:
+    """Every caller of a failed request receives its exception."""
+    single_flight = SingleFlight()
+    barrier = threading.Barrier(4)
+
+    def request() -> Any:
+        time.sleep(0.05)
+        raise ConnectionError("rpc down")
+
+    def call(_: int) -> Any:
+        barrier.wait()
+        try:
+            return single_flight.do("key", request)
+        except ConnectionError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(call, range(4)))
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert single_flight.requests == 1
+
+    # The key is released once the request completes.
+    assert single_flight.do("key", lambda: "retry") == "retry"
+
+
+async def test_async_callers_share_one_request() -> None:
+    """Concurrent async callers with an equal key share one request."""
+    single_flight = SingleFlight()
+    calls: List[str] = []
+
+    async def request(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    results = await asyncio.gather(
+        *(single_flight.ado(key, partial(request, key)) for key in "aabbba")
+    )
+
+    assert results == list("aabbba")
+    assert sorted(calls) == ["a", "b"]
+    assert single_flight.shared == 4
+
+
+async def test_async_cancelled_caller_does_not_cancel_others() -> None:
+    """Cancelling one waiter leaves the shared request running."""
+    single_flight = SingleFlight()
+
+    async def request() -> str:
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.ensure_future(single_flight.ado("key", request))
+    second = asyncio.ensure_future(single_flight.ado("key", request))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_toolkit_tools_deduplicate_requests() -> None:
+    """Identical concurrent tool calls send a single request."""
+    client = FakeClient(latency=0.05)
+    async_client = FakeAsyncClient(latency=0.05)
+    toolkit = OpenGradientToolkit(
+        private_key="test_key",
+        single_flight=SingleFlight(),
+        client=client,
+        async_client=async_client,
+    )
+
+    workflow_tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0x123456789",
+        tool_name="test_workflow_tool",
+        tool_description="Test workflow tool for unit testing",
+        output_formatter=lambda x: str(x.numbers["regression_output"].item()),
+    )
+    model_tool = toolkit.create_run_model_tool(
+        model_cid="QmTest123456789",
+        tool_name="test_model_tool",
+        model_input_provider=lambda: {"x": [1.0, 2.0]},
+        model_output_formatter=lambda x: str(x.model_output["Y"].item()),
+    )
+
+    results = await asyncio.gather(
+        *(workflow_tool.ainvoke({}) for _ in range(20)),
+        *(model_tool.ainvoke({}) for _ in range(20)),
+    )
+    assert results == ["0.25"] * 20 + ["0.5"] * 20
+    assert len(async_client.read_calls) == 1
+    assert len(async_client.infer_calls) == 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sync_results = list(executor.map(lambda _: model_tool.invoke({}), range(8)))
+    assert sync_results == ["0.5"] * 8
+    assert 1 <= len(client.infer_calls) < 8
@@ -0,0 +1,164 @@
+"""Unit testing for push-based workflow subscriptions."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, List, Optional, Sequence
+
+from langchain_opengradient.subscriptions import WorkflowSubscription
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import (
+    FakeAsyncClient,
+    FakeClient,
+    FakeWorkflowEventSource,
+)
+
+
+def _wait_for(condition: Any, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+async def test_subscribed_reads_are_served_from_memory() -> None:
+    """Tools read watched workflows locally; reads follow published updates."""
+    client, async_client = FakeClient(), FakeAsyncClient()
+    subscription_client = FakeAsyncClient()
+    events = FakeWorkflowEventSource()
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=client, async_client=async_client
+    )
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0xabc",
+        tool_name="workflow_tool",
+        tool_description="Reads a workflow",
+        output_formatter=lambda output: str(output.numbers["regression_output"][0]),
+    )
+
+    subscription = toolkit.subscribe_workflows(
+        ["0xabc", "0xdef"], event_source=events, async_client=subscription_client
+    )
+    try:
+        assert subscription.wait_ready(timeout=2)
+        assert sorted(subscription_client.read_calls) == ["0xabc", "0xdef"]
+
+        for _ in range(5):
+            assert tool.invoke({}) == "0.25"
+            assert await tool.ainvoke({}) == "0.25"
+        assert client.read_calls == [] and async_client.read_calls == []
+
+        events.publish("0xabc")
+        _wait_for(lambda: subscription.updates == 3)
+        assert subscription_client.read_calls.count("0xabc") == 2
+    finally:
+        toolkit.unsubscribe_workflows()
+
+    assert toolkit.workflow_subscription is None
+    tool.invoke({})
+    assert client.read_calls == ["0xabc"]
+
+
+def test_subscription_reconnects_after_drop() -> None:
+    """A dropped stream is reopened and every contract is read again."""
+    subscription_client = FakeAsyncClient()
+    events = FakeWorkflowEventSource()
+    toolkit = OpenGradientToolkit(private_key="test_key", client=FakeClient())
+
+    subscription = toolkit.subscribe_workflows(
+        ["0xabc"],
+        event_source=events,
+        async_client=subscription_client,
+        initial_backoff=0.01,
+        max_backoff=0.02,
+    )
+    try:
+        assert subscription.wait_ready(timeout=2)
+        events.drop()
+        _wait_for(lambda: events.connections == 2)
+
+        assert subscription.reconnects == 1
+        assert isinstance(subscription.last_error, ConnectionError)
+        _wait_for(lambda: len(subscription_client.read_calls) == 2)
+    finally:
+        subscription.stop(timeout=2)
+
+
+class FlakyAsyncClient(FakeAsyncClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.down = False
+
+    async def read_workflow_result(self, contract_address: str) -> Any:
+        if self.down:
+            raise ConnectionError("rpc unavailable")
+        return await super().read_workflow_result(contract_address)
+
+
+def test_disconnected_subscription_falls_back_to_reads() -> None:
+    """After max_staleness without a connection, tools read contracts directly."""
+    client = FakeClient()
+    subscription_client = FlakyAsyncClient()
+    events = FakeWorkflowEventSource()
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0xabc",
+        tool_name="workflow_tool",
+        tool_description="Reads a workflow",
+    )
+
+    subscription = toolkit.subscribe_workflows(
+        ["0xabc"],
+        event_source=events,
+        async_client=subscription_client,
+        initial_backoff=0.01,
+        max_backoff=0.02,
+        max_staleness=0.05,
+    )
+    try:
+        assert subscription.wait_ready(timeout=2)
+        tool.invoke({})
+        assert client.read_calls == []
+
+        subscription_client.down = True
+        events.drop()
+        _wait_for(lambda: subscription.stale)
+        tool.invoke({})
+        assert client.read_calls == ["0xabc"]
+
+        subscription_client.down = False
+        _wait_for(lambda: not subscription.stale)
+        tool.invoke({})
+        assert client.read_calls == ["0xabc"]
+    finally:
+        toolkit.unsubscribe_workflows()
+
+
+def test_block_is_taken_before_the_initial_read() -> None:
+    """The event stream starts right after the block read before the contracts."""
+    calls: List[Any] = []
+
+    async def block_number() -> int:
+        calls.append("block")
+        return 41
+
+    async def aread(contract_address: str) -> str:
+        calls.append("read")
+        return "result"
+
+    async def event_source(
+        contract_addresses: Sequence[str], from_block: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        calls.append(("events", from_block))
+        await asyncio.sleep(10)
+        yield contract_addresses[0]
+
+    subscription = WorkflowSubscription(
+        ["0xabc"], event_source, aread, block_number=block_number
+    )
+    subscription.start()
+    try:
+        assert subscription.wait_ready(timeout=2)
+        _wait_for(lambda: len(calls) == 3)
+        assert calls == ["block", "read", ("events", 42)]
+    finally:
+        subscription.stop(timeout=2)
@@ -0,0 +1,117 @@
+"""Unit testing for model input tensor handling."""
+
+import array
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+from opengradient.utils import (  # type: ignore
+    convert_to_model_input as sdk_convert_to_model_input,
+)
+
+from langchain_opengradient.tensors import (
+    TensorSpec,
+    as_tensor,
+    convert_to_model_input,
+    prepare_model_input,
+)
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeClient
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.random.default_rng(0).random((4, 50)) * 100,
+        np.random.default_rng(1).normal(size=20) * 1e-8,
+        np.array([0.0, -0.0, 1.0, 100.0, -2.5, 1e-7, 123456789.125, 1e15]),
+        (np.random.default_rng(2).random(50) * 100).astype(np.float32),
+        np.array([0, -5, 100, 10**15], dtype=np.int64),
+        np.array([[1, 2], [3, 4]], dtype=np.uint8),
+        np.array(["a", "b"]),
+        [1.5, 2.0],
+        [[1, 2], [3, 4]],
+        3.25,
+        7,
+    ],
+)
+def test_encoding_matches_sdk(value: Any) -> None:
+    """Inputs are encoded exactly as the OpenGradient SDK encodes them."""
+    assert convert_to_model_input({"x": value}) == sdk_convert_to_model_input(
+        {"x": value}
+    )
+
+
+@pytest.mark.parametrize("value", [7, 3.25, np.float64(0.5), [1.5, 2.0], np.arange(3)])
+def test_prepared_input_is_encoded_like_raw_sdk_input(value: Any) -> None:
+    """Preparing scalars, lists and arrays keeps the shapes the SDK sends."""
+    prepared = prepare_model_input({"x": value})
+    assert convert_to_model_input(prepared) == sdk_convert_to_model_input({"x": value})
+    assert prepared["x"].shape == np.asarray(value).reshape(-1).shape
+
+
+def test_buffers_are_not_copied() -> None:
+    """Arrays and buffer-protocol objects are wrapped, not copied."""
+    values = np.arange(6, dtype=np.float32)
+    assert as_tensor(values) is values
+
+    buffer = array.array("d", [1.0, 2.0, 3.0])
+    tensor = as_tensor(buffer)
+    assert tensor.dtype == np.float64
+    buffer[0] = 5.0
+    assert tensor[0] == 5.0
+
+    assert as_tensor([1, 2], dtype=np.float32).dtype == np.float32
+
+
+def test_prepare_model_input_checks_spec() -> None:
+    """Model input must match the declared tensors."""
+    spec = {"X": TensorSpec(dtype=np.float32, shape=(None, 4))}
+
+    prepared = prepare_model_input({"X": [[1, 2, 3, 4]]}, spec)
+    assert prepared["X"].dtype == np.float32
+
+    with pytest.raises(ValueError, match="has dtype float64"):
+        prepare_model_input({"X": np.zeros((1, 4))}, spec)
+    with pytest.raises(ValueError, match=r"has shape \(1, 3\)"):
+        prepare_model_input({"X": np.zeros((1, 3), dtype=np.float32)}, spec)
+    with pytest.raises(ValueError, match="not C-contiguous"):
+        prepare_model_input({"X": np.zeros((4, 4), dtype=np.float32).T[:2]}, spec)
+    with pytest.raises(ValueError, match="expected \\['X'\\]"):
+        prepare_model_input({"Y": np.zeros((1, 4), dtype=np.float32)}, spec)
+    with pytest.raises(ValueError, match="Invalid tensor shape"):
+        TensorSpec(shape=(2, -1))
+
+
+def test_run_model_tool_passes_arrays_through() -> None:
+    """Arrays from the provider reach the client without list conversions."""
+    client = FakeClient()
+    window = np.ones((10, 4), dtype=np.float32)
+
+    def provider() -> Dict[str, Any]:
+        return {"open_high_low_close": window}
+
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="model_tool",
+        model_input_provider=provider,
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        input_spec={"open_high_low_close": TensorSpec(np.float32, (None, 4))},
+    )
+
+    assert tool.invoke({}) == "0.5"
+    assert client.infer_calls[0][2]["open_high_low_close"] is window
+
+    window = np.ones((10, 5), dtype=np.float32)
+    with pytest.raises(ValueError, match="has shape"):
+        tool.invoke({})
+
+    with pytest.raises(TypeError, match="must be a TensorSpec"):
+        toolkit.create_run_model_tool(
+            model_cid="QmTest",
+            tool_name="bad_spec_tool",
+            model_input_provider=provider,
+            model_output_formatter=str,
+            input_spec={"open_high_low_close": (np.float32, (None, 4))},  # type: ignore[dict-item]
+        )
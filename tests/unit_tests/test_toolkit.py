@@ -1,25 +1,25 @@
 """Unit testing for the OpenGradient toolkit functions."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import opengradient as og  # type: ignore
 import pytest
 from langchain_core.tools import BaseTool
 from opengradient import InferenceResult, ModelOutput  # type: ignore
-from opengradient.alphasense import (  # type: ignore
-    ToolType,
-)
 from pydantic import BaseModel, Field
 
+from langchain_opengradient.clients import clear_client_pool
 from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeClient
 
 
 class MockTool(BaseTool):
     """Mocktool that inherits from Basetool for unit tests."""
 
-    def __init__(self) -> None:
-        return
+    name: str = "mock_tool"
+    description: str = "Mock tool for unit tests"
 
     def _run(self) -> int:
         return 0
@@ -52,9 +52,53 @@ def test_add_tool() -> None:
     assert toolkit.get_tools() == [tool]
 
 
+@pytest.mark.usefixtures("mock_env")
+def test_tool_registry() -> None:
+    """Test lookup, replacement and removal of tools by name."""
+    toolkit = OpenGradientToolkit()
+    first, second, third = (MockTool(name=f"tool_{i}") for i in range(3))
+    toolkit.add_tools([first, second, third])
+
+    assert toolkit.get_tool("tool_1") is second
+    with pytest.raises(ValueError, match="'tool_1' is already in the toolkit"):
+        toolkit.add_tool(MockTool(name="tool_1"))
+    with pytest.raises(ValueError, match="'tool_3' is already in the toolkit"):
+        toolkit.add_tools([MockTool(name="tool_3"), MockTool(name="tool_3")])
+    assert toolkit.get_tools() == [first, second, third]
+
+    snapshot = toolkit.get_tools()
+    replacement = MockTool(name="tool_1")
+    assert toolkit.replace_tool(replacement) is second
+    assert toolkit.remove_tool("tool_0") is first
+    assert toolkit.get_tools() == [replacement, third]
+    assert snapshot == [first, second, third]
+
+    with pytest.raises(ValueError, match="'tool_0' is not in the toolkit"):
+        toolkit.get_tool("tool_0")
+    with pytest.raises(ValueError, match="'missing' is not in the toolkit"):
+        toolkit.replace_tool(MockTool(name="missing"))
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_concurrent_tool_registration() -> None:
+    """Test that tools registered from many threads are all kept."""
+    toolkit = OpenGradientToolkit()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda i: toolkit.add_tool(MockTool(name=f"tool_{i}")), range(200)
+            )
+        )
+
+    assert sorted(tool.name for tool in toolkit.get_tools()) == sorted(
+        f"tool_{i}" for i in range(200)
+    )
+
+
 @pytest.mark.usefixtures("mock_env")
 def test_create_run_model_tool_error() -> None:
-    """Test error flow with function create_run_model_tool."""
+    """Test error flow with tools built by create_run_model_tool."""
 
     class ExampleInputSchema(BaseModel):
         example_int_field: int = Field(description="This is an example int field")
@@ -63,7 +107,7 @@ def test_create_run_model_tool_error() -> None:
     model_cid = "Example_CID"
     tool_name = "Example run model tool"
 
-    def model_input_provider(data: Any) -> Dict[str, str]:
+    def model_input_provider(**data: Any) -> Dict[str, str]:
         return {"input": "example input getter function"}
 
     def model_output_formatter(output: InferenceResult) -> str:
@@ -72,37 +116,30 @@ def test_create_run_model_tool_error() -> None:
     tool_description = "This tool is an example tool."
     inference_mode = og.InferenceMode.VANILLA
 
-    with patch(
-        "langchain_opengradient.toolkits.create_run_model_tool"
-    ) as mock_create_run_model_tool:
-        # Set up the mock to raise an exception
-        mock_create_run_model_tool.side_effect = ValueError("Invalid model CID")
-
-        toolkit = OpenGradientToolkit()
-
-        # Test that the error from create_run_model_tool is propagated
-        with pytest.raises(ValueError, match="Invalid model CID"):
-            toolkit.create_run_model_tool(
-                model_cid=model_cid,
-                tool_name=tool_name,
-                model_input_provider=model_input_provider,
-                model_output_formatter=model_output_formatter,
-                tool_input_schema=ExampleInputSchema,
-                tool_description=tool_description,
-                inference_mode=inference_mode,
-            )
-
-        # Verify the mock was called with correct arguments
-        mock_create_run_model_tool.assert_called_once_with(
-            tool_type=ToolType.LANGCHAIN,
-            model_cid=model_cid,
-            tool_name=tool_name,
-            model_input_provider=model_input_provider,
-            model_output_formatter=model_output_formatter,
-            tool_input_schema=ExampleInputSchema,
-            tool_description=tool_description,
-            inference_mode=inference_mode,
-        )
+    toolkit = OpenGradientToolkit()
+    toolkit.client = MagicMock()
+    toolkit.client.infer.side_effect = ValueError("Invalid model CID")
+
+    tool = toolkit.create_run_model_tool(
+        model_cid=model_cid,
+        tool_name=tool_name,
+        model_input_provider=model_input_provider,
+        model_output_formatter=model_output_formatter,
+        tool_input_schema=ExampleInputSchema,
+        tool_description=tool_description,
+        inference_mode=inference_mode,
+    )
+
+    # Test that the error from the OpenGradient client is propagated
+    with pytest.raises(ValueError, match="Invalid model CID"):
+        tool.invoke({"example_int_field": 1, "example_str_field": "a"})
+
+    # Verify the client was called with correct arguments
+    toolkit.client.infer.assert_called_once_with(
+        model_cid=model_cid,
+        inference_mode=inference_mode,
+        model_input={"input": "example input getter function"},
+    )
 
 
 @pytest.mark.usefixtures("mock_env")
@@ -116,47 +153,47 @@ def test_create_run_model_tool_success() -> None:
     model_cid = "Example_CID"
     tool_name = "Example run model tool"
 
-    def model_input_provider(data: Any) -> Dict[str, str]:
-        return {"input": "example input getter function"}
+    def model_input_provider(**data: Any) -> Dict[str, Any]:
+        return {"input": data}
 
     def model_output_formatter(output: InferenceResult) -> str:
-        return str(output)
+        return format(float(output.model_output["Y"].item()), ".1%")
 
     tool_description = "This tool is an example tool."
     inference_mode = og.InferenceMode.TEE
 
-    with patch(
-        "langchain_opengradient.toolkits.create_run_model_tool"
-    ) as mock_create_run_model_tool:
-        mock_create_run_model_tool.return_value = MockTool
-
-        toolkit = OpenGradientToolkit()
-        tool = toolkit.create_run_model_tool(
-            model_cid=model_cid,
-            tool_name=tool_name,
-            model_input_provider=model_input_provider,
-            model_output_formatter=model_output_formatter,
-            tool_input_schema=ExampleInputSchema,
-            tool_description=tool_description,
-            inference_mode=inference_mode,
-        )
-
-        mock_create_run_model_tool.assert_called_once_with(
-            tool_type=ToolType.LANGCHAIN,
-            model_cid=model_cid,
-            tool_name=tool_name,
-            model_input_provider=model_input_provider,
-            model_output_formatter=model_output_formatter,
-            tool_input_schema=ExampleInputSchema,
-            tool_description=tool_description,
-            inference_mode=inference_mode,
+    toolkit = OpenGradientToolkit()
+    toolkit.client = FakeClient()
+    tool = toolkit.create_run_model_tool(
+        model_cid=model_cid,
+        tool_name=tool_name,
+        model_input_provider=model_input_provider,
+        model_output_formatter=model_output_formatter,
+        tool_input_schema=ExampleInputSchema,
+        tool_description=tool_description,
+        inference_mode=inference_mode,
+    )
+
+    assert isinstance(tool, BaseTool)
+    assert tool.name == tool_name
+    assert tool.description == tool_description
+    assert tool.args_schema is ExampleInputSchema
+
+    result = tool.invoke({"example_int_field": 1, "example_str_field": "a"})
+
+    assert result == "50.0%"
+    assert toolkit.client.infer_calls == [
+        (
+            model_cid,
+            inference_mode,
+            {"input": {"example_int_field": 1, "example_str_field": "a"}},
         )
-        assert tool == MockTool
+    ]
 
 
 @pytest.mark.usefixtures("mock_env")
 def test_create_read_workflow_tool_error() -> None:
-    """Test error flow with function create_read_workflow_tool."""
+    """Test error flow with tools built by create_read_workflow_tool."""
     workflow_contract_address = "0x12345"
     tool_name = "Example read workflow tool"
 
@@ -165,32 +202,27 @@ def test_create_read_workflow_tool_error() -> None:
 
     tool_description = "This tool is an example tool."
 
-    with patch(
-        "langchain_opengradient.toolkits.create_read_workflow_tool"
-    ) as mock_create_read_workflow_tool:
-        mock_create_read_workflow_tool.side_effect = ValueError(
-            "Invalid workflow contract address"
-        )
+    toolkit = OpenGradientToolkit()
+    toolkit.client = MagicMock()
+    toolkit.client.read_workflow_result.side_effect = ValueError(
+        "Invalid workflow contract address"
+    )
 
-        toolkit = OpenGradientToolkit()
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address=workflow_contract_address,
+        tool_name=tool_name,
+        output_formatter=output_formatter,
+        tool_description=tool_description,
+    )
 
-        # Test that the error from create_read_workflow_tool is propagated
-        with pytest.raises(ValueError, match="Invalid workflow contract address"):
-            toolkit.create_read_workflow_tool(
-                workflow_contract_address=workflow_contract_address,
-                tool_name=tool_name,
-                output_formatter=output_formatter,
-                tool_description=tool_description,
-            )
+    # Test that the error from the OpenGradient client is propagated
+    with pytest.raises(ValueError, match="Invalid workflow contract address"):
+        tool.invoke({})
 
-        # Verify the mock was called with correct arguments
-        mock_create_read_workflow_tool.assert_called_once_with(
-            tool_type=ToolType.LANGCHAIN,
-            workflow_contract_address=workflow_contract_address,
-            tool_name=tool_name,
-            output_formatter=output_formatter,
-            tool_description=tool_description,
-        )
+    # Verify the client was called with correct arguments
+    toolkit.client.read_workflow_result.assert_called_once_with(
+        contract_address=workflow_contract_address
+    )
 
 
 @pytest.mark.usefixtures("mock_env")
@@ -200,28 +232,53 @@ def test_create_read_workflow_tool_success() -> None:
     tool_name = "Example read workflow tool"
 
     def output_formatter(output: ModelOutput) -> str:
-        return str(output)
+        return str(output.numbers["regression_output"].item())
 
     tool_description = "This tool is an example tool."
 
-    with patch(
-        "langchain_opengradient.toolkits.create_read_workflow_tool"
-    ) as mock_create_read_workflow_tool:
-        mock_create_read_workflow_tool.return_value = MockTool
-
-        toolkit = OpenGradientToolkit()
-        tool = toolkit.create_read_workflow_tool(
-            workflow_contract_address=workflow_contract_address,
-            tool_name=tool_name,
-            output_formatter=output_formatter,
-            tool_description=tool_description,
-        )
+    toolkit = OpenGradientToolkit()
+    toolkit.client = FakeClient()
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address=workflow_contract_address,
+        tool_name=tool_name,
+        output_formatter=output_formatter,
+        tool_description=tool_description,
+    )
 
-        mock_create_read_workflow_tool.assert_called_once_with(
-            tool_type=ToolType.LANGCHAIN,
-            workflow_contract_address=workflow_contract_address,
-            tool_name=tool_name,
-            output_formatter=output_formatter,
-            tool_description=tool_description,
-        )
-        assert tool == MockTool
+    assert isinstance(tool, BaseTool)
+    assert tool.name == tool_name
+    assert tool.description == tool_description
+    assert tool.invoke({}) == "0.25"
+    assert toolkit.client.read_calls == [workflow_contract_address]
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_toolkit_defers_and_shares_clients() -> None:
+    """Test that clients are created on first use and shared per private key."""
+    clear_client_pool()
+    try:
+        with patch("langchain_opengradient.clients.Client") as mock_new_client:
+            mock_new_client.return_value = FakeClient()
+            first = OpenGradientToolkit()
+            second = OpenGradientToolkit()
+            mock_new_client.assert_not_called()
+
+            tool = first.create_read_workflow_tool(
+                workflow_contract_address="0x123",
+                tool_name="workflow_tool",
+                tool_description="Reads a workflow",
+            )
+            second.create_read_workflow_tool(
+                workflow_contract_address="0x123",
+                tool_name="workflow_tool",
+                tool_description="Reads a workflow",
+            ).invoke({})
+            tool.invoke({})
+
+            mock_new_client.assert_called_once()
+            assert first.client is second.client
+
+            OpenGradientToolkit(private_key="other_key")._get_client()
+            assert mock_new_client.call_count == 2
+    finally:
+        clear_client_pool()
@@ -1,14 +1,20 @@
 """Unit testing for the tools generated by the OpenGradient toolkit."""
 
+import asyncio
+import gc
+import threading
+import time
 from typing import Any, Dict, List
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import opengradient as og  # type: ignore
+import pytest
 from langchain_core.tools import BaseTool
 from langchain_tests.unit_tests import ToolsUnitTests
 from pydantic import BaseModel, Field
 
 from langchain_opengradient.toolkits import OpenGradientToolkit
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
 
 
 class MockInputSchema(BaseModel):
@@ -32,23 +38,19 @@ class TestOpenGradientRunModelToolUnit(ToolsUnitTests):
         Return an instance of a run_model_tool created by the OpenGradient toolkit
         for unit testing.
         """
-        with patch("opengradient.init") as mock_init:
-            mock_client = MagicMock()
-            mock_init.return_value = mock_client
+        toolkit = OpenGradientToolkit(private_key="test_key", client=MagicMock())
 
-            toolkit = OpenGradientToolkit(private_key="test_key")
+        tool = toolkit.create_run_model_tool(
+            model_cid="QmTest123456789",
+            tool_name="test_model_tool",
+            model_input_provider=mock_model_input_provider,
+            model_output_formatter=mock_model_output_formatter,
+            tool_input_schema=MockInputSchema,
+            tool_description="Test model tool for unit testing",
+            inference_mode=og.InferenceMode.VANILLA,
+        )
 
-            tool = toolkit.create_run_model_tool(
-                model_cid="QmTest123456789",
-                tool_name="test_model_tool",
-                model_input_provider=mock_model_input_provider,
-                model_output_formatter=mock_model_output_formatter,
-                tool_input_schema=MockInputSchema,
-                tool_description="Test model tool for unit testing",
-                inference_mode=og.InferenceMode.VANILLA,
-            )
-
-            return tool
+        return tool
 
     @property
     def tool_constructor_params(self) -> Dict[str, Any]:
@@ -70,19 +72,15 @@ class TestOpenGradientReadWorkflowToolUnit(ToolsUnitTests):
         Return an instance of a read_workflow_tool created by the OpenGradient toolkit
         for unit testing.
         """
-        with patch("opengradient.init") as mock_init:
-            mock_client = MagicMock()
-            mock_init.return_value = mock_client
-
-            toolkit = OpenGradientToolkit(private_key="test_key")
+        toolkit = OpenGradientToolkit(private_key="test_key", client=MagicMock())
 
-            tool = toolkit.create_read_workflow_tool(
-                workflow_contract_address="0x123456789",
-                tool_name="test_workflow_tool",
-                tool_description="Test model tool for unit testing",
-            )
+        tool = toolkit.create_read_workflow_tool(
+            workflow_contract_address="0x123456789",
+            tool_name="test_workflow_tool",
+            tool_description="Test model tool for unit testing",
+        )
 
-            return tool
+        return tool
 
     @property
     def tool_constructor_params(self) -> Dict[str, Any]:
@@ -97,3 +95,94 @@ class TestOpenGradientReadWorkflowToolUnit(ToolsUnitTests):
         read_workflow type tools don't require any parameters.
         """
         return {}
+
+
+def _toolkit_with_fake_clients(latency: float) -> OpenGradientToolkit:
+    return OpenGradientToolkit(
+        private_key="test_key",
+        client=FakeClient(latency=latency),
+        async_client=FakeAsyncClient(latency=latency),
+    )
+
+
+async def test_run_model_tool_async_concurrency() -> None:
+    """Concurrent ainvoke calls share one event loop instead of queueing."""
+    latency = 0.05
+    toolkit = _toolkit_with_fake_clients(latency)
+
+    async def model_input_provider(**llm_input: Any) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        return {"values": llm_input["values"]}
+
+    async def model_output_formatter(response: Any) -> str:
+        return str(response.model_output["Y"].item())
+
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest123456789",
+        tool_name="test_model_tool",
+        model_input_provider=model_input_provider,
+        model_output_formatter=model_output_formatter,
+        tool_input_schema=MockInputSchema,
+    )
+
+    # Collect garbage left by earlier tests so a full collection does not land
+    # inside a timed round.
+    gc.collect()
+    threads_before = threading.active_count()
+    for callers in (1, 50, 200):
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(tool.ainvoke({"values": [float(i)]}) for i in range(callers))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert results == ["0.5"] * callers
+        # Wall-clock time stays close to a single call as concurrency grows.
+        assert elapsed < latency * 5
+
+    fake_client = toolkit.async_client
+    assert isinstance(fake_client, FakeAsyncClient)
+    assert fake_client.max_in_flight == 200
+    assert len(fake_client.infer_calls) == 251
+    assert threading.active_count() <= threads_before
+
+
+async def test_read_workflow_tool_async_concurrency() -> None:
+    """Concurrent workflow reads are all in flight at once."""
+    latency = 0.05
+    toolkit = _toolkit_with_fake_clients(latency)
+
+    tool = toolkit.create_read_workflow_tool(
+        workflow_contract_address="0x123456789",
+        tool_name="test_workflow_tool",
+        tool_description="Test workflow tool for unit testing",
+        output_formatter=lambda x: str(x.numbers["regression_output"].item()),
+    )
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(tool.ainvoke({}) for _ in range(100)))
+
+    assert time.perf_counter() - start < latency * 5
+    assert results == ["0.25"] * 100
+    fake_client = toolkit.async_client
+    assert isinstance(fake_client, FakeAsyncClient)
+    assert fake_client.max_in_flight == 100
+
+
+def test_run_model_tool_async_callables_require_ainvoke() -> None:
+    """Tools built from coroutine providers cannot be invoked synchronously."""
+    toolkit = _toolkit_with_fake_clients(0.0)
+
+    async def model_input_provider() -> Dict[str, Any]:
+        return {"example": [1.0]}
+
+    tool = toolkit.create_run_model_tool(
+        model_cid="QmTest123456789",
+        tool_name="test_model_tool",
+        model_input_provider=model_input_provider,
+        model_output_formatter=mock_model_output_formatter,
+    )
+
+    with pytest.raises(NotImplementedError):
+        tool.invoke({})
+    assert asyncio.run(tool.ainvoke({})).startswith("Processed result")
@@ -0,0 +1,176 @@
+"""Unit testing for the nonce-managed transaction pipeline."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import pytest
+
+from langchain_opengradient.transactions import (
+    NonceAllocator,
+    SyncTransactionPipeline,
+    TransactionPipeline,
+)
+from tests.unit_tests.fakes import FakeAccount, FakeChain
+
+
+class _SyncChain:
+    """Blocking view of a ``FakeChain``, like ``Web3.eth`` next to ``AsyncWeb3``."""
+
+    def __init__(self, chain: FakeChain) -> None:
+        self.chain = chain
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.chain, name)
+        return lambda *args, **kwargs: asyncio.run(method(*args, **kwargs))
+
+
+def _pipeline(chain: FakeChain, receipt_timeout: float = 1.0) -> TransactionPipeline:
+    return TransactionPipeline(
+        chain, FakeAccount(), receipt_timeout=receipt_timeout, max_retries=5
+    )
+
+
+async def test_concurrent_transactions_get_ordered_nonces() -> None:
+    """Many in-flight transactions are sent in nonce order without collisions."""
+    chain = FakeChain()
+    pipeline = _pipeline(chain)
+
+    results = await asyncio.gather(*(pipeline.submit({"to": i}) for i in range(50)))
+
+    assert chain.received == list(range(50))
+    assert [receipt["nonce"] for _, receipt in results] == list(range(50))
+    assert chain.mined == 50
+    # The nonce is read from the chain once and then allocated locally.
+    assert chain.count_calls == 1
+    assert pipeline.submitted == 50 and pipeline.in_flight == 0
+
+
+async def test_used_nonce_is_recovered() -> None:
+    """A nonce taken by a transaction sent elsewhere is skipped."""
+    chain = FakeChain()
+    pipeline = _pipeline(chain)
+    await pipeline.submit({})
+
+    chain.pool[1] = {"nonce": 1}  # Sent from the same wallet by another process.
+    tx_hash, receipt = await pipeline.submit({})
+
+    assert receipt["nonce"] == 2
+    assert pipeline.resyncs == 1
+
+
+async def test_rejected_transaction_leaves_no_gap() -> None:
+    """The nonce of a transaction the node rejects goes to the next one."""
+    chain = FakeChain()
+    pipeline = _pipeline(chain)
+
+    chain.rejected.append("insufficient funds for gas")
+    with pytest.raises(ValueError, match="insufficient funds"):
+        await pipeline.submit({})
+    results = await asyncio.gather(*(pipeline.submit({}) for _ in range(3)))
+
+    assert [receipt["nonce"] for _, receipt in results] == [0, 1, 2]
+
+
+async def test_dropped_transaction_gap_is_refilled() -> None:
+    """After a receipt times out, nonces are recounted so the gap is reused."""
+    chain = FakeChain()
+    pipeline = _pipeline(chain, receipt_timeout=0.05)
+
+    chain.dropped.append(0)
+    with pytest.raises(TimeoutError):
+        await pipeline.submit({})
+    _, receipt = await pipeline.submit({})
+
+    assert receipt["nonce"] == 0
+    assert chain.received == [0, 0]
+
+
+class _SlowSendChain(FakeChain):
+    async def send_raw_transaction(self, raw: Dict[str, Any]) -> bytes:
+        await asyncio.sleep(0.1)
+        return await super().send_raw_transaction(raw)
+
+
+class _FailingAccount(FakeAccount):
+    def __init__(self) -> None:
+        self.failures = 1
+
+    def sign_transaction(self, transaction: Dict[str, Any]) -> Any:
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("cannot sign")
+        return super().sign_transaction(transaction)
+
+
+async def test_cancelled_send_does_not_leak_its_nonce() -> None:
+    """A submit cancelled mid-send does not block the wallet's next one."""
+    chain = _SlowSendChain()
+    pipeline = _pipeline(chain, receipt_timeout=0.5)
+    await pipeline.submit({})
+
+    task = asyncio.create_task(pipeline.submit({}))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    _, receipt = await pipeline.submit({})
+
+    assert receipt["nonce"] == 1
+    assert chain.received == [0, 1]
+
+
+def test_failed_signing_releases_its_nonce() -> None:
+    """The nonce of a transaction that cannot be signed goes to the next one."""
+    chain = FakeChain()
+    pipeline = SyncTransactionPipeline(
+        _SyncChain(chain), _FailingAccount(), 1.0, max_retries=5
+    )
+
+    with pytest.raises(ValueError, match="cannot sign"):
+        pipeline.submit({})
+    _, receipt = pipeline.submit({})
+
+    assert receipt["nonce"] == 0 and chain.count_calls == 1
+
+
+def test_pipeline_is_shared_by_event_loops_and_threads() -> None:
+    """Loops in several threads use one pipeline without reusing nonces."""
+    chain = FakeChain()
+    pipeline = _pipeline(chain)
+
+    async def send(count: int) -> None:
+        await asyncio.gather(*(pipeline.submit({}) for _ in range(count)))
+
+    asyncio.run(send(5))
+    threads = [threading.Thread(target=asyncio.run, args=(send(10),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(chain.received) == list(range(35))
+    assert pipeline.submitted == 35
+
+
+def test_sync_and_async_submissions_share_nonces() -> None:
+    """Sync calls from threads and async calls draw from one allocator."""
+    chain = FakeChain()
+    nonces = NonceAllocator()
+    async_pipeline = _pipeline(chain)
+    async_pipeline.nonces = nonces
+    sync_pipeline = SyncTransactionPipeline(
+        _SyncChain(chain), FakeAccount(), 1.0, max_retries=5, nonces=nonces
+    )
+
+    async def send_async() -> None:
+        await asyncio.gather(*(async_pipeline.submit({}) for _ in range(10)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(sync_pipeline.submit, {}) for _ in range(10)]
+        asyncio.run(send_async())
+        for future in futures:
+            future.result()
+
+    assert sorted(chain.received) == list(range(20))
@@ -0,0 +1,203 @@
+"""Unit testing for two-phase results of verified inferences."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
+import opengradient as og  # type: ignore
+import pytest
+from opengradient import InferenceResult  # type: ignore
+
+from langchain_opengradient.metrics import VERIFICATION_PHASE, ToolMetrics
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from langchain_opengradient.verification import Verification, VerificationTracker
+
+
+class GatedClient:
+    """Answers VANILLA inferences at once and verified ones when released."""
+
+    def __init__(self, fail_vanilla: bool = False, verified_value: float = 0.75):
+        self.fail_vanilla = fail_vanilla
+        self.verified_value = verified_value
+        self.released = threading.Event()
+        self.modes: List[og.InferenceMode] = []
+
+    def infer(
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        self.modes.append(inference_mode)
+        if inference_mode == og.InferenceMode.VANILLA:
+            if self.fail_vanilla:
+                raise RuntimeError("VANILLA unavailable")
+            return InferenceResult("0xvanilla", {"Y": np.array([0.5])})
+        assert self.released.wait(5)
+        return InferenceResult("0xverified", {"Y": np.array([self.verified_value])})
+
+
+class GatedAsyncClient(GatedClient):
+    async def infer(  # type: ignore[override]
+        self,
+        model_cid: str,
+        inference_mode: og.InferenceMode,
+        model_input: Dict[str, Any],
+    ) -> InferenceResult:
+        if inference_mode != og.InferenceMode.VANILLA:
+            while not self.released.is_set():
+                await asyncio.sleep(0.001)
+        return super().infer(model_cid, inference_mode, model_input)
+
+
+def _tool(toolkit: OpenGradientToolkit, tracker: VerificationTracker) -> Any:
+    return toolkit.create_run_model_tool(
+        model_cid="QmTest",
+        tool_name="volatility",
+        model_input_provider=lambda: {"X": [1.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+        inference_mode=og.InferenceMode.TEE,
+        verification=tracker,
+    )
+
+
+def test_provisional_result_is_returned_before_verification() -> None:
+    """Sync calls answer with the VANILLA result while TEE runs on."""
+    completed: List[Verification] = []
+    client = GatedClient()
+    metrics = ToolMetrics()
+    tracker = VerificationTracker(
+        on_complete=completed.append, on_chain_provisional=True
+    )
+    toolkit = OpenGradientToolkit(
+        private_key="test_key", client=client, metrics=metrics
+    )
+
+    output = _tool(toolkit, tracker).invoke({})
+
+    assert output == "0.5 (provisional: TEE verification v1 pending)"
+    handle = tracker.get("v1")
+    assert handle.status == "pending" and handle.transaction_hash is None
+    assert handle.provisional.transaction_hash == "0xvanilla"
+    assert tracker.pending() == [handle] and completed == []
+
+    client.released.set()
+    assert handle.result(timeout=5).transaction_hash == "0xverified"
+    tracker.shutdown()
+    assert handle.status == "verified" and handle.transaction_hash == "0xverified"
+    assert completed == [handle] and tracker.verified == 1
+    # The provisional 0.5 differs from the verified 0.75.
+    assert handle.mismatch is True and tracker.mismatches == 1
+    assert metrics.histogram("volatility", VERIFICATION_PHASE).count == 1  # type: ignore[union-attr]
+    assert set(client.modes) == {og.InferenceMode.VANILLA, og.InferenceMode.TEE}
+
+
+async def test_async_verification_can_be_awaited() -> None:
+    """Async calls verify in a task on the loop; the handle is awaitable."""
+    client = GatedAsyncClient()
+    tracker = VerificationTracker(on_chain_provisional=True)
+    toolkit = OpenGradientToolkit(private_key="test_key", async_client=client)
+
+    output = await _tool(toolkit, tracker).ainvoke({})
+
+    assert output.endswith("verification v1 pending)")
+    handle = tracker.get("v1")
+    assert not handle.done()
+    client.released.set()
+    verified = await handle
+    assert verified.model_output["Y"][0] == 0.75 and handle.status == "verified"
+
+
+async def test_cancelled_call_still_completes_verification() -> None:
+    """Cancelling a call during its provisional inference still reports it."""
+
+    class SlowVanillaClient(GatedAsyncClient):
+        async def infer(  # type: ignore[override]
+            self,
+            model_cid: str,
+            inference_mode: og.InferenceMode,
+            model_input: Dict[str, Any],
+        ) -> InferenceResult:
+            if inference_mode == og.InferenceMode.VANILLA:
+                await asyncio.sleep(10)
+            return await super().infer(model_cid, inference_mode, model_input)
+
+    completed: List[Verification] = []
+    client = SlowVanillaClient()
+    tracker = VerificationTracker(
+        on_complete=completed.append, on_chain_provisional=True
+    )
+    toolkit = OpenGradientToolkit(private_key="test_key", async_client=client)
+
+    call = asyncio.create_task(_tool(toolkit, tracker).ainvoke({}))
+    await asyncio.sleep(0.02)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    client.released.set()
+    handle = tracker.get("v1")
+    await handle
+    await asyncio.sleep(0)
+
+    assert completed == [handle] and handle.provisional is None
+    assert handle.mismatch is None
+
+
+def test_failed_provisional_waits_for_verification() -> None:
+    """Without a provisional result the call returns the verified one."""
+    completed: List[Verification] = []
+
+    def report(verification: Verification) -> None:
+        completed.append(verification)
+        raise RuntimeError("callback failed")
+
+    client = GatedClient(fail_vanilla=True)
+    client.released.set()
+    tracker = VerificationTracker(on_complete=report, on_chain_provisional=True)
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+
+    assert _tool(toolkit, tracker).invoke({}) == "0.75"
+    tracker.shutdown()
+    assert [v.status for v in completed] == ["verified"]
+    assert tracker.callback_errors == 1
+
+    with pytest.raises(ValueError, match="requires a TEE or ZKML"):
+        toolkit.create_run_model_tool(
+            model_cid="QmTest",
+            tool_name="vanilla",
+            model_input_provider=lambda: {"X": [1.0]},
+            model_output_formatter=str,
+            verification=tracker,
+        )
+    with pytest.raises(ValueError, match="not tracked"):
+        tracker.get("v404")
+
+
+def test_no_second_transaction_without_opt_in() -> None:
+    """Without a local model or opt-in, calls wait for the verified inference."""
+    mismatches: List[Any] = []
+    client = GatedClient()
+    client.released.set()
+    tracker = VerificationTracker(
+        on_complete=lambda verification: mismatches.append(verification.mismatch)
+    )
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+
+    assert _tool(toolkit, tracker).invoke({}) == "0.75"
+    tracker.shutdown()
+    assert client.modes == [og.InferenceMode.TEE]
+    assert mismatches == [None] and tracker.mismatches == 0
+
+
+def test_matching_outputs_are_not_flagged() -> None:
+    """Equal provisional and verified outputs clear the mismatch flag."""
+    client = GatedClient(verified_value=0.5)
+    client.released.set()
+    tracker = VerificationTracker(on_chain_provisional=True)
+    toolkit = OpenGradientToolkit(private_key="test_key", client=client)
+
+    _tool(toolkit, tracker).invoke({})
+    tracker.shutdown()
+
+    assert tracker.get("v1").mismatch is False and tracker.mismatches == 0
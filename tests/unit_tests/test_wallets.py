@@ -0,0 +1,171 @@
+"""Unit testing for sharding inferences across a pool of wallets."""
+
+import asyncio
+from collections import Counter
+from typing import Any, Dict
+
+import pytest
+
+from langchain_opengradient.toolkits import OpenGradientToolkit
+from langchain_opengradient.wallets import WalletPool, is_wallet_error
+from tests.unit_tests.fakes import FakeAsyncClient, FakeClient
+
+KEYS = ["key_a", "key_b", "key_c"]
+
+
+class FailingClient(FakeClient):
+    def infer(self, *args: Any, **kwargs: Any) -> Any:
+        raise ConnectionError("rpc unavailable")
+
+
+class ModelErrorClient(FakeClient):
+    def infer(self, *args: Any, **kwargs: Any) -> Any:
+        raise ValueError("model rejected input shape (3,)")
+
+
+def _pool(policy: str, clients: Dict[str, Any], **kwargs: Any) -> WalletPool:
+    return WalletPool(
+        KEYS,
+        policy=policy,
+        client_factory=clients.__getitem__,
+        async_client_factory=clients.__getitem__,
+        **kwargs,
+    )
+
+
+def _model_tool(toolkit: OpenGradientToolkit, model_cid: str = "QmTest") -> Any:
+    return toolkit.create_run_model_tool(
+        model_cid=model_cid,
+        tool_name=f"tool_{model_cid}",
+        model_input_provider=lambda: {"X": [1.0]},
+        model_output_formatter=lambda result: str(result.model_output["Y"][0]),
+    )
+
+
+def test_round_robin_spreads_inferences() -> None:
+    """Inferences go to each wallet in turn; reads use the first wallet's key."""
+    clients = {key: FakeClient() for key in KEYS}
+    toolkit = OpenGradientToolkit(wallet_pool=_pool("round_robin", clients))
+    tool = _model_tool(toolkit)
+
+    for _ in range(6):
+        assert tool.invoke({}) == "0.5"
+
+    assert [len(clients[key].infer_calls) for key in KEYS] == [2, 2, 2]
+    assert toolkit._private_key == "key_a"
+
+
+async def test_least_outstanding_balances_in_flight() -> None:
+    """Concurrent inferences are spread so no wallet has more than its share."""
+    clients = {key: FakeAsyncClient(latency=0.02) for key in KEYS}
+    pool = _pool("least_outstanding", clients)
+    toolkit = OpenGradientToolkit(wallet_pool=pool)
+    tool = _model_tool(toolkit)
+
+    await asyncio.gather(*(tool.ainvoke({}) for _ in range(30)))
+
+    assert [clients[key].max_in_flight for key in KEYS] == [10, 10, 10]
+    assert all(wallet.outstanding == 0 for wallet in pool.wallets)
+
+
+def test_model_affinity_keeps_models_on_healthy_wallets() -> None:
+    """A model stays on one wallet; only an unhealthy wallet's models move."""
+    clients = {key: FakeClient() for key in KEYS}
+    pool = _pool("model_affinity", clients)
+    models = [f"Qm{i}" for i in range(12)]
+
+    placement = {cid: pool.acquire(cid) for cid in models}
+    for wallet in placement.values():
+        pool.release(wallet)
+    assert all(pool.acquire(cid) is placement[cid] for cid in models)
+    assert len(set(placement.values())) > 1
+
+    unhealthy = placement[models[0]]
+    pool.release(unhealthy, ConnectionError("rpc unavailable"))
+    for cid in models:
+        wallet = pool.acquire(cid)
+        if placement[cid] is unhealthy:
+            assert wallet is not unhealthy
+        else:
+            assert wallet is placement[cid]
+
+
+def test_failing_wallet_backs_off() -> None:
+    """A wallet whose inference failed is skipped until its backoff expires."""
+    clients: Dict[str, Any] = {key: FakeClient() for key in KEYS}
+    clients["key_b"] = FailingClient()
+    pool = _pool("round_robin", clients, initial_backoff=60.0, max_backoff=60.0)
+    toolkit = OpenGradientToolkit(wallet_pool=pool)
+    tool = _model_tool(toolkit)
+
+    results: Counter = Counter()
+    for _ in range(7):
+        try:
+            tool.invoke({})
+            results["ok"] += 1
+        except ConnectionError:
+            results["failed"] += 1
+
+    assert results == {"ok": 6, "failed": 1}
+    assert pool.wallets[1].failures == 1
+    assert not pool.wallets[1].healthy()
+    assert isinstance(pool.wallets[1].last_error, ConnectionError)
+
+
+async def test_cancellation_keeps_wallet_backoff() -> None:
+    """A cancelled inference neither clears nor adds to a wallet's backoff."""
+    # With one wallet, the backing-off wallet is still picked.
+    pool = WalletPool(["key_a"], initial_backoff=60.0, max_backoff=60.0)
+    wallet = pool.acquire()
+    pool.release(wallet, ConnectionError("rpc unavailable"))
+    backoff_until = wallet._backoff_until
+
+    async def stuck() -> None:
+        async with pool.ause():
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(stuck())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert wallet.failures == 1 and wallet._backoff_until == backoff_until
+    assert not wallet.healthy() and wallet.outstanding == 0
+
+
+def test_model_errors_do_not_bench_wallets() -> None:
+    """Errors unrelated to the wallet are raised without a backoff."""
+    clients: Dict[str, Any] = {key: ModelErrorClient() for key in KEYS}
+    pool = _pool("round_robin", clients, initial_backoff=60.0, max_backoff=60.0)
+    tool = _model_tool(OpenGradientToolkit(wallet_pool=pool))
+
+    for _ in range(2 * len(KEYS)):
+        with pytest.raises(ValueError, match="input shape"):
+            tool.invoke({})
+
+    assert all(w.healthy() and w.failures == 0 for w in pool.wallets)
+    assert all(w.outstanding == 0 for w in pool.wallets)
+    assert is_wallet_error(ValueError("nonce too low"))
+    assert is_wallet_error(RuntimeError("insufficient funds for gas * price"))
+    try:
+        try:
+            raise TimeoutError("receipt")
+        except TimeoutError as e:
+            raise RuntimeError("Transaction failed") from e
+    except RuntimeError as e:
+        assert is_wallet_error(e)
+
+
+def test_private_key_list_creates_pool() -> None:
+    """A list of keys creates a round-robin pool; bad pools are rejected."""
+    toolkit = OpenGradientToolkit(private_key=KEYS)
+
+    assert toolkit.wallet_pool is not None
+    assert toolkit.wallet_pool.private_keys == KEYS
+    assert toolkit.wallet_pool.policy == "round_robin"
+
+    with pytest.raises(ValueError, match="at least one private key"):
+        WalletPool([])
+    with pytest.raises(ValueError, match="Unknown wallet policy"):
+        WalletPool(KEYS, policy="random")